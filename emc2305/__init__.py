@@ -9,6 +9,8 @@ __version__ = "0.1.0"
 __author__ = "Jose Luis Moffa"
 __license__ = "MIT"
 
+from typing import Any
+
 # Main driver classes
 from emc2305.driver import EMC2305, FanController
 
@@ -27,16 +29,30 @@ from emc2305.driver.emc2305 import (
     FanState,
     FanStatus,
     ProductFeatures,
+    StatusBlock,
 )
 from emc2305.driver.i2c import I2CBus, I2CError
 
-# Configuration management
-from emc2305.settings import (
-    ConfigManager,
-    EMC2305Config,
-    FanChannelConfig,
-    I2CConfig,
-)
+# Configuration management is imported on first access (PEP 562) so that
+# ``import emc2305`` does not load PyYAML and the settings module
+_LAZY_SETTINGS = ("ConfigManager", "EMC2305Config", "FanChannelConfig", "I2CConfig")
+
+
+def __getattr__(name: str) -> Any:
+    """Import configuration management names on first access."""
+    if name in _LAZY_SETTINGS:
+        from emc2305 import settings
+
+        value = getattr(settings, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported names."""
+    return sorted(list(globals()) + list(_LAZY_SETTINGS))
+
 
 __all__ = [
     # Main classes
@@ -52,6 +68,7 @@ __all__ = [
     "FanConfig",
     "FanState",
     "ProductFeatures",
+    "StatusBlock",
     # Enums
     "ControlMode",
     "FanStatus",
@@ -40,7 +40,10 @@ DEFAULT_I2C_BUS = 0
 DEFAULT_DEVICE_ADDRESS = 0x61
 """Default I2C device address (configurable via ADDR_SEL pin)"""
 
-SUPPORTED_ADDRESSES = [0x4C, 0x4D, 0x5C, 0x5D, 0x5E, 0x5F]
+SUPPORTED_ADDRESSES_ORDERED = (0x4C, 0x4D, 0x5C, 0x5D, 0x5E, 0x5F)
+"""All possible EMC2305 I2C addresses in ascending order (for bus scans)"""
+
+SUPPORTED_ADDRESSES = frozenset(SUPPORTED_ADDRESSES_ORDERED)
 """All possible EMC2305 I2C addresses (via ADDR_SEL pin configuration)"""
 
 DEFAULT_I2C_LOCK_TIMEOUT = 5.0
@@ -49,6 +52,9 @@ DEFAULT_I2C_LOCK_TIMEOUT = 5.0
 DEFAULT_I2C_LOCK_PATH = "/var/lock"
 """Default path for I2C bus lock files"""
 
+DEFAULT_I2C_LOCK_POLL_INTERVAL = 0.001
+"""Default interval between I2C bus lock acquisition attempts in seconds"""
+
 # I2C/SMBus Protocol Limits
 MIN_I2C_ADDRESS = 0x00
 """Minimum valid 7-bit I2C address"""
@@ -65,6 +71,22 @@ MAX_REGISTER_ADDRESS = 0xFF
 SMBUS_BLOCK_MAX_LENGTH = 32
 """Maximum block read/write length for SMBus protocol"""
 
+# Linux i2c-dev interface (<linux/i2c-dev.h>, <linux/i2c.h>)
+I2C_RDWR = 0x0707
+"""ioctl request for combined read/write transfers"""
+
+I2C_M_RD = 0x0001
+"""i2c_msg flag marking a read message"""
+
+I2C_RDWR_MAX_MSGS = 42
+"""Maximum number of messages in one I2C_RDWR ioctl (I2C_RDWR_IOCTL_MAX_MSGS)"""
+
+I2C_ADAPTER_CLOCK_FREQUENCY_PATH = "/sys/class/i2c-adapter/i2c-{bus}/of_node/clock-frequency"
+"""Device tree property holding an adapter's SCL frequency (32-bit big-endian, Hz)"""
+
+I2C_FAST_MODE_HZ = 400_000
+"""Fast-mode SCL frequency, the highest I2C bus speed supported by the EMC2305"""
+
 # =============================================================================
 # Global Configuration Registers
 # =============================================================================
@@ -200,6 +222,61 @@ REG_FAN1_TACH_READING_HIGH = 0x3E
 REG_FAN1_TACH_READING_LOW = 0x3F
 """Fan 1 TACH Reading Low - current RPM measurement (LSB)"""
 
+# Per-channel register address table, precomputed so the hot path does not
+# recompute addresses. Index as FAN_REGS[channel - 1][FAN_REG_*].
+FAN_REG_SETTING = 0
+FAN_REG_PWM_DIVIDE = 1
+FAN_REG_CONFIG1 = 2
+FAN_REG_CONFIG2 = 3
+FAN_REG_GAIN = 4
+FAN_REG_SPIN_UP_CONFIG = 5
+FAN_REG_MAX_STEP = 6
+FAN_REG_MINIMUM_DRIVE = 7
+FAN_REG_VALID_TACH_COUNT = 8
+FAN_REG_DRIVE_FAIL_BAND_LOW = 9
+FAN_REG_DRIVE_FAIL_BAND_HIGH = 10
+FAN_REG_TACH_TARGET_LOW = 11
+FAN_REG_TACH_TARGET_HIGH = 12
+FAN_REG_TACH_READING_HIGH = 13
+FAN_REG_TACH_READING_LOW = 14
+
+FAN_REGS = tuple(
+    tuple(
+        register + channel * FAN_CHANNEL_OFFSET
+        for register in (
+            REG_FAN1_SETTING,
+            REG_FAN1_PWM_DIVIDE,
+            REG_FAN1_CONFIG1,
+            REG_FAN1_CONFIG2,
+            REG_FAN1_GAIN,
+            REG_FAN1_SPIN_UP_CONFIG,
+            REG_FAN1_MAX_STEP,
+            REG_FAN1_MINIMUM_DRIVE,
+            REG_FAN1_VALID_TACH_COUNT,
+            REG_FAN1_DRIVE_FAIL_BAND_LOW,
+            REG_FAN1_DRIVE_FAIL_BAND_HIGH,
+            REG_FAN1_TACH_TARGET_LOW,
+            REG_FAN1_TACH_TARGET_HIGH,
+            REG_FAN1_TACH_READING_HIGH,
+            REG_FAN1_TACH_READING_LOW,
+        )
+    )
+    for channel in range(NUM_FAN_CHANNELS)
+)
+"""Register addresses for each fan channel, indexed [channel - 1][FAN_REG_*]"""
+
+FAN_WINDOW_TACH_TARGET = REG_FAN1_TACH_TARGET_LOW - REG_FAN1_SETTING
+"""Offset of the TACH target pair (LOW, HIGH) within a fan channel register window"""
+
+FAN_WINDOW_TACH_READING = REG_FAN1_TACH_READING_HIGH - REG_FAN1_SETTING
+"""Offset of the TACH reading pair (HIGH, LOW) within a fan channel register window"""
+
+FAN_CHANNEL_BITS = tuple(1 << channel for channel in range(NUM_FAN_CHANNELS))
+"""Per-channel bit masks of the fan bitmap registers, indexed by channel - 1.
+
+Used by the interrupt enable, PWM polarity and PWM output config registers.
+"""
+
 # =============================================================================
 # Configuration Register Bit Masks (REG_CONFIGURATION = 0x20)
 # =============================================================================
@@ -376,6 +453,14 @@ PWM_FREQ_19531HZ_THRESHOLD = 12000
 PWM_FREQ_4882HZ_THRESHOLD = 3500
 """Threshold for selecting 4.882 kHz base frequency (3500 Hz <= freq < 12000 Hz)"""
 
+PWM_FREQ_TABLE = (
+    (PWM_FREQ_26000HZ_THRESHOLD, PWM_FREQ_26000HZ, 26000),
+    (PWM_FREQ_19531HZ_THRESHOLD, PWM_FREQ_19531HZ, 19531),
+    (PWM_FREQ_4882HZ_THRESHOLD, PWM_FREQ_4882HZ, 4882),
+    (0, PWM_FREQ_2441HZ, 2441),
+)
+"""(threshold Hz, register code, actual Hz) for base frequency selection, highest first"""
+
 # PWM divide values (1-255) further divide the base frequency
 # Final PWM frequency = Base Frequency / PWM_DIVIDE
 DEFAULT_PWM_DIVIDE = 1
@@ -446,6 +531,14 @@ MIN_PWM_VALUE = 0
 MAX_PWM_VALUE = 255
 """Maximum PWM register value (255 = 100%)"""
 
+PCT_TO_PWM = tuple(
+    int(percent * MAX_PWM_VALUE / 100.0) for percent in range(MAX_FAN_SPEED_PERCENT + 1)
+)
+"""PWM register value for each whole percentage (0-100), truncated"""
+
+PWM_TO_PCT = tuple((pwm / MAX_PWM_VALUE) * 100.0 for pwm in range(MAX_PWM_VALUE + 1))
+"""Duty cycle percentage for each PWM register value (0-255)"""
+
 SAFE_SHUTDOWN_PWM_PERCENT = 30
 """Safe PWM percentage for controlled fan shutdown (prevents abrupt stop)"""
 
@@ -496,6 +589,9 @@ BYTE_MASK = 0xFF
 TACH_COUNT_HIGH_MASK = 0x1F
 """Mask for high 5 bits of 13-bit tachometer count"""
 
+TACH_PAIR_MASK = (TACH_COUNT_HIGH_MASK << 8) | BYTE_MASK
+"""Mask for a TACH register pair read as one 16-bit value (high byte masked to 5 bits)"""
+
 # Bit shift values for multi-byte register operations
 TACH_COUNT_HIGH_SHIFT = 8
 """Bit shift for high byte of tachometer count (bits 12-8)"""
@@ -580,22 +676,49 @@ FAN_STATUS_WATCH = 0x80
 # Individual status register bits (REG_FAN_STALL_STATUS, etc.)
 # Each register uses bits 4-0 for fans 5-1 respectively
 
+FAN_STATUS_BITS = (
+    FAN_STATUS_FAN1,
+    FAN_STATUS_FAN2,
+    FAN_STATUS_FAN3,
+    FAN_STATUS_FAN4,
+    FAN_STATUS_FAN5,
+)
+"""Per-channel status bit masks, indexed by channel - 1"""
+
+FAN_STATUS_CHANNEL_MASK = 0x1F
+"""Per-fan bits (4-0) of the status registers"""
+
+FAULTED_CHANNELS = tuple(
+    tuple(channel for channel, bit in enumerate(FAN_STATUS_BITS, start=1) if mask & bit)
+    for mask in range(FAN_STATUS_CHANNEL_MASK + 1)
+)
+"""Channel numbers (1-5) whose bit is set, indexed by the 5-bit status pattern"""
+
 # =============================================================================
 # Timing Constants
 # =============================================================================
 
 INIT_DELAY_MS = 10
-"""Initialization delay after reset (milliseconds)"""
+"""Settling delay after initialization or a configuration batch (milliseconds)"""
 
 WRITE_DELAY_MS = 1
-"""Delay after write operations (milliseconds)"""
+"""Delay after write operations (milliseconds) - unused, kept for compatibility"""
 
 READ_DELAY_MS = 1
-"""Delay after read operations (milliseconds)"""
+"""Delay after read operations (milliseconds) - unused, kept for compatibility"""
+
+POLL_INTERVAL_MIN_MS = 0.1
+"""Initial interval between register polls (milliseconds), doubled after each miss"""
+
+POLL_INTERVAL_MAX_MS = 5
+"""Maximum interval between register polls (milliseconds)"""
 
 WATCHDOG_TIMEOUT_SEC = 4
 """Watchdog timeout period (seconds)"""
 
+WATCHDOG_SERVICE_INTERVAL_SEC = WATCHDOG_TIMEOUT_SEC / 2
+"""Bus idle time after which service_watchdog() issues a watchdog reset (seconds)"""
+
 SMBUS_TIMEOUT_MS = 30
 """SMBus timeout period (milliseconds) - can be disabled"""
 
@@ -19,17 +19,133 @@ Features:
 """
 
 import logging
+import struct
 import threading
 import time
-from dataclasses import dataclass
+from bisect import bisect_left
+from contextlib import nullcontext
+from dataclasses import astuple, dataclass, replace
 from enum import Enum
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, ContextManager, Dict, Optional
 
 from emc2305.driver import constants as const
 from emc2305.driver.i2c import I2CBus, I2CError
 
 logger = logging.getLogger(__name__)
 
+# Precompiled unpackers for TACH register pairs. TACH reading registers are
+# stored HIGH then LOW (big-endian), TACH target registers LOW then HIGH.
+_TACH_READING = struct.Struct(">H")
+_TACH_TARGET = struct.Struct("<H")
+
+# All five TACH readings (0x3E-0x7F): one pair at the end of each 16-byte window
+_ALL_TACH_READINGS = struct.Struct(
+    ">" + f"H{const.FAN_CHANNEL_OFFSET - 2}x" * (const.NUM_FAN_CHANNELS - 1) + "H"
+)
+
+# Register field encodings used when building a fan channel configuration.
+# Built once at import; read-only so callers cannot mutate shared state.
+_UPDATE_TIME_BITS = MappingProxyType(
+    {
+        100: const.FAN_CONFIG1_UPDATE_100MS,
+        200: const.FAN_CONFIG1_UPDATE_200MS,
+        300: const.FAN_CONFIG1_UPDATE_300MS,
+        400: const.FAN_CONFIG1_UPDATE_400MS,
+        500: const.FAN_CONFIG1_UPDATE_500MS,
+        800: const.FAN_CONFIG1_UPDATE_800MS,
+        1200: const.FAN_CONFIG1_UPDATE_1200MS,
+        1600: const.FAN_CONFIG1_UPDATE_1600MS,
+    }
+)
+
+_EDGES_BITS = MappingProxyType(
+    {
+        3: const.FAN_CONFIG1_EDGES_3,
+        5: const.FAN_CONFIG1_EDGES_5,
+        7: const.FAN_CONFIG1_EDGES_7,
+        9: const.FAN_CONFIG1_EDGES_9,
+    }
+)
+
+_ERROR_RANGE_BITS = MappingProxyType(
+    {
+        0: const.FAN_CONFIG2_ERR_RNG_0,
+        50: const.FAN_CONFIG2_ERR_RNG_50,
+        100: const.FAN_CONFIG2_ERR_RNG_100,
+        200: const.FAN_CONFIG2_ERR_RNG_200,
+    }
+)
+
+# Indexed by derivative mode (0-7)
+_DERIVATIVE_OPTION_BITS = (
+    const.FAN_CONFIG2_DER_OPT_NONE,
+    const.FAN_CONFIG2_DER_OPT_1,
+    const.FAN_CONFIG2_DER_OPT_2,
+    const.FAN_CONFIG2_DER_OPT_3,
+    const.FAN_CONFIG2_DER_OPT_4,
+    const.FAN_CONFIG2_DER_OPT_5,
+    const.FAN_CONFIG2_DER_OPT_6,
+    const.FAN_CONFIG2_DER_OPT_7,
+)
+
+_GAIN_P_BITS = MappingProxyType(
+    {1: const.GAIN_P_1X, 2: const.GAIN_P_2X, 4: const.GAIN_P_4X, 8: const.GAIN_P_8X}
+)
+
+_GAIN_I_BITS = MappingProxyType(
+    {
+        0: const.GAIN_I_0X,
+        1: const.GAIN_I_1X,
+        2: const.GAIN_I_2X,
+        4: const.GAIN_I_4X,
+        8: const.GAIN_I_8X,
+        16: const.GAIN_I_16X,
+        32: const.GAIN_I_32X,
+    }
+)
+
+_GAIN_D_BITS = MappingProxyType(
+    {
+        0: const.GAIN_D_0X,
+        1: const.GAIN_D_1X,
+        2: const.GAIN_D_2X,
+        4: const.GAIN_D_4X,
+        8: const.GAIN_D_8X,
+        16: const.GAIN_D_16X,
+        32: const.GAIN_D_32X,
+    }
+)
+
+# Supported spin-up levels (ascending) and their register encodings, in parallel
+_SPIN_UP_LEVELS = (30, 35, 40, 45, 50, 55, 60, 65)
+_SPIN_UP_LEVEL_BITS = (
+    const.SPIN_UP_LEVEL_30_PERCENT,
+    const.SPIN_UP_LEVEL_35_PERCENT,
+    const.SPIN_UP_LEVEL_40_PERCENT,
+    const.SPIN_UP_LEVEL_45_PERCENT,
+    const.SPIN_UP_LEVEL_50_PERCENT,
+    const.SPIN_UP_LEVEL_55_PERCENT,
+    const.SPIN_UP_LEVEL_60_PERCENT,
+    const.SPIN_UP_LEVEL_65_PERCENT,
+)
+
+
+def _nearest_spin_up_index(percent: float) -> int:
+    """
+    Return the index of the supported spin-up level closest to a percentage.
+
+    Ties resolve to the lower level.
+    """
+    index = bisect_left(_SPIN_UP_LEVELS, percent)
+    if index == 0:
+        return 0
+    if index == len(_SPIN_UP_LEVELS):
+        return index - 1
+    if percent - _SPIN_UP_LEVELS[index - 1] <= _SPIN_UP_LEVELS[index] - percent:
+        return index - 1
+    return index
+
 
 class ControlMode(Enum):
     """Fan control mode."""
@@ -48,6 +164,28 @@ class FanStatus(Enum):
     UNKNOWN = "unknown"
 
 
+# Fan status for each combination of a channel's fault bits, indexed by
+# stall | spin << 1 | drive_fail << 2. Stall takes priority over spin failure,
+# which takes priority over drive failure.
+_FAN_STATUS_BY_FAULTS = (
+    FanStatus.OK,
+    FanStatus.STALLED,
+    FanStatus.SPIN_FAILURE,
+    FanStatus.STALLED,
+    FanStatus.DRIVE_FAILURE,
+    FanStatus.STALLED,
+    FanStatus.SPIN_FAILURE,
+    FanStatus.STALLED,
+)
+
+# get_alert_status() result for each 5-bit pattern of OR'ed fault bits. Callers
+# receive a copy, so the shared dicts are never mutated.
+_ALERTS_BY_FAULTS = tuple(
+    {channel: bool(mask & bit) for channel, bit in enumerate(const.FAN_STATUS_BITS, start=1)}
+    for mask in range(const.FAN_STATUS_CHANNEL_MASK + 1)
+)
+
+
 @dataclass
 class FanConfig:
     """Configuration for a single fan channel."""
@@ -82,11 +220,112 @@ class FanConfig:
         const.DEFAULT_VALID_TACH_COUNT
     )  # Minimum valid tach count for stall detection
 
+    def __post_init__(self) -> None:
+        self.validate()
+
+    def validate(self) -> None:
+        """
+        Check every field against the ranges the EMC2305 registers accept.
+
+        Runs when the configuration is created. configure_fan() runs it again
+        before writing a changed configuration, since fields can be modified
+        after construction.
+
+        Raises:
+            EMC2305ValidationError: If a field is out of range
+        """
+        # Validate RPM limits
+        if self.min_rpm >= self.max_rpm:
+            raise EMC2305ValidationError(
+                f"min_rpm ({self.min_rpm}) must be less than max_rpm ({self.max_rpm})"
+            )
+        EMC2305._validate_rpm(self.min_rpm)
+        EMC2305._validate_rpm(self.max_rpm)
+
+        # Validate PWM limits
+        if not 0 <= self.min_drive_percent <= 100:
+            raise EMC2305ValidationError(
+                f"min_drive_percent must be 0-100, got {self.min_drive_percent}"
+            )
+
+        # Validate max step
+        if not 0 <= self.max_step <= 63:
+            raise EMC2305ValidationError(f"max_step must be 0-63, got {self.max_step}")
+
+        # Validate update time
+        valid_update_times = [100, 200, 300, 400, 500, 800, 1200, 1600]
+        if self.update_time_ms not in valid_update_times:
+            raise EMC2305ValidationError(
+                f"update_time_ms must be one of {valid_update_times}, got {self.update_time_ms}"
+            )
+
+        # Validate tachometer edges
+        valid_edges = [3, 5, 7, 9]
+        if self.edges not in valid_edges:
+            raise EMC2305ValidationError(
+                f"edges must be one of {valid_edges} (for 1/2/3/4-pole fans), got {self.edges}"
+            )
+
+        # Validate spin-up parameters
+        if not 0 <= self.spin_up_time_ms <= 1550:
+            raise EMC2305ValidationError(
+                f"spin_up_time_ms must be 0-1550, got {self.spin_up_time_ms}"
+            )
+        valid_spin_up_levels = [30, 35, 40, 45, 50, 55, 60, 65]
+        if self.spin_up_level_percent not in valid_spin_up_levels:
+            raise EMC2305ValidationError(
+                f"spin_up_level_percent must be one of {valid_spin_up_levels}, got {self.spin_up_level_percent}"
+            )
+
+        # Validate PID gains
+        valid_p_gains = [1, 2, 4, 8]
+        valid_id_gains = [0, 1, 2, 4, 8, 16, 32]
+        EMC2305._validate_pid_gain(self.pid_gain_p, valid_p_gains, "Proportional")
+        EMC2305._validate_pid_gain(self.pid_gain_i, valid_id_gains, "Integral")
+        EMC2305._validate_pid_gain(self.pid_gain_d, valid_id_gains, "Derivative")
+
+        # Validate PWM divide
+        if not 1 <= self.pwm_divide <= 255:
+            raise EMC2305ValidationError(f"pwm_divide must be 1-255, got {self.pwm_divide}")
+
+        # Validate CONFIG2 parameters
+        valid_error_ranges = [0, 50, 100, 200]
+        if self.error_range_rpm not in valid_error_ranges:
+            raise EMC2305ValidationError(
+                f"error_range_rpm must be one of {valid_error_ranges}, got {self.error_range_rpm}"
+            )
+
+        if not 0 <= self.derivative_mode <= 7:
+            raise EMC2305ValidationError(f"derivative_mode must be 0-7, got {self.derivative_mode}")
+
+        # Validate Drive Fail Band
+        if self.drive_fail_band_rpm < 0:
+            raise EMC2305ValidationError(
+                f"drive_fail_band_rpm cannot be negative, got {self.drive_fail_band_rpm}"
+            )
+
+        if self.valid_tach_count < 0 or self.valid_tach_count > const.TACH_COUNT_MAX:
+            raise EMC2305ValidationError(
+                f"valid_tach_count must be 0-{const.TACH_COUNT_MAX}, got {self.valid_tach_count}"
+            )
+
 
 @dataclass
 class FanState:
     """Current state of a single fan channel."""
 
+    # Declared by hand (dataclass(slots=True) needs Python 3.10); one instance
+    # is created per channel on every state read
+    __slots__ = (
+        "channel",
+        "enabled",
+        "control_mode",
+        "pwm_percent",
+        "target_rpm",
+        "current_rpm",
+        "status",
+    )
+
     channel: int
     enabled: bool
     control_mode: ControlMode
@@ -96,9 +335,9 @@ class FanState:
     status: FanStatus
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProductFeatures:
-    """EMC2305 product features and capabilities."""
+    """EMC2305 product features and capabilities (read-only, shared per controller)."""
 
     fan_channels: int  # Number of fan channels (typically 5 for EMC2305)
     rpm_control_supported: bool  # RPM-based fan speed control support
@@ -107,6 +346,21 @@ class ProductFeatures:
     revision: int  # Chip revision
 
 
+@dataclass
+class StatusBlock:
+    """Snapshot of the global status and PWM configuration registers (0x24-0x2B)."""
+
+    __slots__ = ("fan_status", "stall", "spin", "drive_fail", "int_en", "pwm_pol", "pwm_out_cfg")
+
+    fan_status: int  # Fan Status (0x24) - watchdog and per-fan fault summary
+    stall: int  # Fan Stall Status (0x25) - per-fan stall flags
+    spin: int  # Fan Spin Status (0x26) - per-fan spin-up failure flags
+    drive_fail: int  # Drive Fail Status (0x27) - per-fan aging fan flags
+    int_en: int  # Fan Interrupt Enable (0x29) - per-fan ALERT# enables
+    pwm_pol: int  # PWM Polarity Config (0x2A) - per-fan inverted polarity
+    pwm_out_cfg: int  # PWM Output Config (0x2B) - per-fan push-pull output
+
+
 class EMC2305Error(Exception):
     """Base exception for EMC2305 driver errors."""
 
@@ -153,6 +407,11 @@ class EMC2305:
         use_external_clock: Use external 32.768kHz clock (default: False)
         enable_watchdog: Enable 4-second watchdog timer (default: False)
         pwm_frequency: PWM base frequency in Hz (default: 26000)
+        defer_init: Postpone device detection and initialization until the
+            first public method call (default: False)
+        thread_safe: Serialize driver calls with a lock (default: True). Pass
+            False when a single thread owns the controller to skip the lock
+            on every call.
 
     Example:
         >>> bus = I2CBus(bus_number=0)
@@ -169,6 +428,8 @@ class EMC2305:
         use_external_clock: bool = False,
         enable_watchdog: bool = False,
         pwm_frequency: int = 26000,
+        defer_init: bool = False,
+        thread_safe: bool = True,
     ):
         self.i2c_bus = i2c_bus
         self.address = device_address
@@ -176,25 +437,94 @@ class EMC2305:
         self.enable_watchdog = enable_watchdog
         self.pwm_frequency = pwm_frequency
 
+        # RPM conversion constants for the selected clock source:
+        # (edges - 1) * TACH_FREQ * 60 // poles for each valid edges setting
+        tach_freq = (
+            const.EXTERNAL_CLOCK_FREQ_HZ if use_external_clock else const.INTERNAL_CLOCK_FREQ_HZ
+        )
+        self._tach_scale_by_edges: Dict[int, int] = {
+            edges: (edges - 1) * tach_freq * 60 // ((edges - 1) // 2) for edges in (3, 5, 7, 9)
+        }
+        self._max_rpm = const.MAX_RPM_EXT_CLOCK if use_external_clock else const.MAX_RPM
+
         # Thread safety for concurrent access
-        self._lock = threading.Lock()
+        self._lock: ContextManager[Any] = threading.Lock() if thread_safe else nullcontext()
 
-        # Fan configurations and states
+        # Fan configurations and states; _initialize() stores a configuration for
+        # every channel, so configured controllers can index _fan_configs directly
         self._fan_configs: Dict[int, FanConfig] = {}
         self._fan_states: Dict[int, FanState] = {}
 
+        # Last values written to the device, used to skip redundant writes
+        self._fan_config_keys: Dict[int, tuple] = {}
+        # Tachometer edges last written to each channel, for RPM conversions
+        self._channel_edges: Dict[int, int] = {}
+        # Fan Interrupt Enable register value, so alert changes need no read
+        self._int_enable: int = 0
+        self._last_pwm_setting: Dict[int, int] = {}
+
+        # Snapshot of the clear-on-read status registers (0x24-0x27), shared by
+        # status queries made within half the fastest fan update period
+        self._status_cache: Optional[tuple[int, int, int, int]] = None
+        self._status_cache_time: float = 0.0
+        self._status_cache_ttl: float = 0.0
+
         # Software lock status
         self._is_locked: bool = False
 
+        # Deferred initialization state
+        self._configured: bool = False
+        self._init_lock = threading.Lock()
+
         # Initialize device
-        self._detect_device()
-        self._initialize()
+        if not defer_init:
+            self._ensure_configured()
+
+    def _ensure_configured(self) -> None:
+        """
+        Detect and initialize the device on first use.
+
+        Raises:
+            EMC2305DeviceNotFoundError: If device is not found or invalid
+            EMC2305CommunicationError: If the I2C bus has been closed
+            EMC2305Error: If initialization fails
+        """
+        if self._configured:
+            return
+
+        with self._init_lock:
+            if self._configured:
+                return
+
+            # The driver relies on the bus keeping its device fd open between
+            # transfers; fail clearly instead of as a failed detection
+            if self.i2c_bus.closed:
+                raise EMC2305CommunicationError(f"I2C bus {self.i2c_bus.bus_number} is closed")
+
+            # Hold the bus lock once for the whole detection/initialization burst
+            with self.i2c_bus.transaction():
+                self._detect_device()
+                self._initialize()
+            # Settle after releasing the bus so other processes are not held off
+            self.i2c_bus.settle()
+            self._configured = True
 
         logger.info(
-            f"EMC2305 initialized at address 0x{self.address:02X} "
-            f"(Product ID: 0x{self.product_id:02X}, Revision: 0x{self.revision:02X})"
+            "EMC2305 initialized at address 0x%02X (Product ID: 0x%02X, Revision: 0x%02X)",
+            self.address,
+            self._product_id,
+            self._revision,
         )
 
+        bus_speed = self.i2c_bus.bus_speed_hz
+        if bus_speed is not None and bus_speed < const.I2C_FAST_MODE_HZ:
+            logger.info(
+                "I2C bus clock is %d kHz; the EMC2305 supports %d kHz Fast-mode, which cuts "
+                "transfer time roughly 4x (set the adapter's clock-frequency to raise it)",
+                bus_speed // 1000,
+                const.I2C_FAST_MODE_HZ // 1000,
+            )
+
     def _detect_device(self) -> None:
         """
         Detect and validate EMC2305 device.
@@ -203,30 +533,43 @@ class EMC2305:
             EMC2305DeviceNotFoundError: If device is not found or invalid
         """
         try:
-            # Read product ID
-            product_id = self.i2c_bus.read_byte(self.address, const.REG_PRODUCT_ID)
+            # Read the read-only identification registers (0xFC-0xFF) in one
+            # transaction; they never change, so they are cached for later use
+            id_block = self.i2c_bus.read_block(
+                self.address,
+                const.REG_PRODUCT_FEATURES,
+                const.REG_REVISION - const.REG_PRODUCT_FEATURES + 1,
+            )
+            features, product_id, mfg_id, revision = id_block
+
             if product_id != const.PRODUCT_ID:
                 raise EMC2305DeviceNotFoundError(
                     f"Invalid Product ID: expected 0x{const.PRODUCT_ID:02X}, "
                     f"got 0x{product_id:02X}"
                 )
 
-            # Read manufacturer ID
-            mfg_id = self.i2c_bus.read_byte(self.address, const.REG_MANUFACTURER_ID)
             if mfg_id != const.MANUFACTURER_ID:
                 raise EMC2305DeviceNotFoundError(
                     f"Invalid Manufacturer ID: expected 0x{const.MANUFACTURER_ID:02X}, "
                     f"got 0x{mfg_id:02X}"
                 )
 
-            # Read revision
-            self.product_id = product_id
-            self.manufacturer_id = mfg_id
-            self.revision = self.i2c_bus.read_byte(self.address, const.REG_REVISION)
+            self._product_id = product_id
+            self._mfg_id = mfg_id
+            self._revision = revision
+            self._product_features = ProductFeatures(
+                fan_channels=features & const.PRODUCT_FEATURES_FAN_COUNT_MASK,
+                rpm_control_supported=bool(features & const.PRODUCT_FEATURES_RPM_CONTROL),
+                product_id=product_id,
+                manufacturer_id=mfg_id,
+                revision=revision,
+            )
 
             logger.info(
-                f"EMC2305 detected: Product=0x{product_id:02X}, "
-                f"Manufacturer=0x{mfg_id:02X}, Revision=0x{self.revision:02X}"
+                "EMC2305 detected: Product=0x%02X, Manufacturer=0x%02X, Revision=0x%02X",
+                product_id,
+                mfg_id,
+                revision,
             )
 
         except I2CError as e:
@@ -234,93 +577,114 @@ class EMC2305:
                 f"Failed to detect EMC2305 at address 0x{self.address:02X}: {e}"
             )
 
+    @property
+    def product_id(self) -> int:
+        """Product ID read at detection (0x34 for EMC2305)."""
+        self._ensure_configured()
+        return self._product_id
+
+    @property
+    def manufacturer_id(self) -> int:
+        """Manufacturer ID read at detection (0x5D for SMSC)."""
+        self._ensure_configured()
+        return self._mfg_id
+
+    @property
+    def revision(self) -> int:
+        """Chip revision read at detection."""
+        self._ensure_configured()
+        return self._revision
+
     def _initialize(self) -> None:
         """Initialize EMC2305 with default configuration."""
         try:
             # Build configuration register value
-            config = 0x00
-
-            # Disable SMBus timeout for full I2C compliance
-            config |= const.CONFIG_DIS_TO
-
-            # CRITICAL: Enable global PWM output (GLBL_EN bit)
-            # Without this bit enabled, ALL PWM outputs are disabled regardless of individual fan settings
-            config |= const.CONFIG_GLBL_EN
+            config = (
+                # Disable SMBus timeout for full I2C compliance
+                const.CONFIG_DIS_TO
+                # CRITICAL: Enable global PWM output (GLBL_EN bit)
+                # Without this bit enabled, ALL PWM outputs are disabled regardless of individual fan settings
+                | const.CONFIG_GLBL_EN
+                # Enable watchdog if requested
+                | (const.CONFIG_WD_EN if self.enable_watchdog else 0)
+                # Configure clock source
+                | (const.CONFIG_USE_EXT_CLK if self.use_external_clock else 0)
+            )
             logger.info("Global PWM output enabled (GLBL_EN)")
-
-            # Enable watchdog if requested
             if self.enable_watchdog:
-                config |= const.CONFIG_WD_EN
                 logger.info("Watchdog timer enabled (4 second timeout)")
-
-            # Configure clock source
             if self.use_external_clock:
-                config |= const.CONFIG_USE_EXT_CLK
                 logger.info("Using external 32.768 kHz clock")
             else:
                 logger.info("Using internal oscillator")
 
-            # Write configuration
-            self.i2c_bus.write_byte(self.address, const.REG_CONFIGURATION, config)
+            # Collect the global setup and write it as one batch, starting with
+            # the configuration register
+            writes = [(const.REG_CONFIGURATION, config)]
 
             # Configure PWM frequency for all fans
-            self._configure_pwm_frequency()
+            writes.extend(self._pwm_frequency_writes())
 
             # Set default PWM polarity (normal) and output type (open-drain)
-            self.i2c_bus.write_byte(
-                self.address, const.REG_PWM_POLARITY_CONFIG, const.DEFAULT_PWM_POLARITY
-            )
-            self.i2c_bus.write_byte(
-                self.address, const.REG_PWM_OUTPUT_CONFIG, const.DEFAULT_PWM_OUTPUT_CONFIG
-            )
+            writes.append((const.REG_PWM_POLARITY_CONFIG, const.DEFAULT_PWM_POLARITY))
+            writes.append((const.REG_PWM_OUTPUT_CONFIG, const.DEFAULT_PWM_OUTPUT_CONFIG))
+
+            # Enable interrupts for all fans (for ALERT# pin); faults latched
+            # while the channels are configured are cleared below
+            writes.append((const.REG_FAN_INTERRUPT_ENABLE, const.FAN_INTERRUPT_ENABLE_ALL_FANS))
+
+            self.i2c_bus.write_registers(self.address, writes)
+            self._int_enable = const.FAN_INTERRUPT_ENABLE_ALL_FANS
 
             # Initialize all fan channels with default configuration
+            channel_writes = {}
             for channel in range(1, const.NUM_FAN_CHANNELS + 1):
                 default_config = FanConfig()
                 self._fan_configs[channel] = default_config
-                self._configure_fan_registers(channel, default_config)
-
-            # Enable interrupts for all fans (for ALERT# pin)
-            self.i2c_bus.write_byte(
-                self.address,
-                const.REG_FAN_INTERRUPT_ENABLE,
-                const.FAN_INTERRUPT_ENABLE_ALL_FANS,  # Enable fans 1-5 (bits 0-4)
-            )
-
-            # Clear any existing fault status
-            self._clear_fault_status()
-
-            time.sleep(const.INIT_DELAY_MS / 1000.0)
+                channel_writes[channel] = self._fan_register_writes(channel, default_config)
+            self._write_fan_windows(channel_writes)
+            for channel, config in self._fan_configs.items():
+                self._fan_config_keys[channel] = astuple(config)
+                self._channel_edges[channel] = config.edges
+            self._update_status_cache_ttl()
+
+            # Clear any existing fault status with one block read of 0x24-0x27
+            fan_status, stall_status, spin_status, drive_status = self._clear_fault_status()
+            if fan_status:
+                logger.debug(
+                    "Cleared latched fault status at init: fan=0x%02X stall=0x%02X "
+                    "spin=0x%02X drive_fail=0x%02X",
+                    fan_status,
+                    stall_status,
+                    spin_status,
+                    drive_status,
+                )
 
         except I2CError as e:
             raise EMC2305Error(f"Failed to initialize EMC2305: {e}")
 
-    def _configure_pwm_frequency(self) -> None:
-        """Configure PWM base frequency for all fans."""
+    def _pwm_frequency_writes(self) -> list[tuple[int, int]]:
+        """Build the register writes that set the PWM base frequency for all fans."""
         # Map requested frequency to closest supported base frequency
-        if self.pwm_frequency >= const.PWM_FREQ_26000HZ_THRESHOLD:
-            freq_code = const.PWM_FREQ_26000HZ
-            actual_freq = 26000
-        elif self.pwm_frequency >= const.PWM_FREQ_19531HZ_THRESHOLD:
-            freq_code = const.PWM_FREQ_19531HZ
-            actual_freq = 19531
-        elif self.pwm_frequency >= const.PWM_FREQ_4882HZ_THRESHOLD:
-            freq_code = const.PWM_FREQ_4882HZ
-            actual_freq = 4882
-        else:
-            freq_code = const.PWM_FREQ_2441HZ
-            actual_freq = 2441
-
-        # Set base frequency for fans 1-3
-        self.i2c_bus.write_byte(self.address, const.REG_PWM_BASE_FREQ_1, freq_code)
-
-        # Set base frequency for fans 4-5
-        self.i2c_bus.write_byte(self.address, const.REG_PWM_BASE_FREQ_2, freq_code)
+        freq_code, actual_freq = next(
+            (
+                (code, hz)
+                for threshold, code, hz in const.PWM_FREQ_TABLE
+                if self.pwm_frequency >= threshold
+            ),
+            const.PWM_FREQ_TABLE[-1][1:],
+        )
 
         logger.info(
-            f"PWM base frequency set to {actual_freq} Hz " f"(requested: {self.pwm_frequency} Hz)"
+            "PWM base frequency set to %d Hz (requested: %d Hz)", actual_freq, self.pwm_frequency
         )
 
+        # Set base frequency for fans 1-3 and fans 4-5
+        return [
+            (const.REG_PWM_BASE_FREQ_1, freq_code),
+            (const.REG_PWM_BASE_FREQ_2, freq_code),
+        ]
+
     def _configure_fan_registers(self, channel: int, config: FanConfig) -> None:
         """
         Configure all registers for a specific fan channel.
@@ -329,10 +693,74 @@ class EMC2305:
             channel: Fan channel number (1-5)
             config: Fan configuration
         """
+        self._write_fan_windows({channel: self._fan_register_writes(channel, config)})
+        self._fan_config_keys[channel] = astuple(config)
+        self._channel_edges[channel] = config.edges
+        self._update_status_cache_ttl()
+
+        # A mode change hands the Fan Setting register to or from the FSC
+        # algorithm, so the cached PWM value can no longer be trusted
+        self._last_pwm_setting.pop(channel, None)
+
+    def _fan_config_unchanged(self, channel: int, config: FanConfig) -> bool:
+        """
+        Check whether a configuration matches the one last written to a channel.
+
+        Args:
+            channel: Fan channel number (1-5)
+            config: Fan configuration
+
+        Returns:
+            True if writing the configuration would not change any register
+        """
+        return self._fan_config_keys.get(channel) == astuple(config)
+
+    def _write_fan_windows(self, channel_writes: Dict[int, list[tuple[int, int]]]) -> None:
+        """
+        Write fan channel configuration with one block per channel in one batch.
+
+        A channel's configuration registers (PWM_DIVIDE to DRIVE_FAIL_BAND_HIGH)
+        span the reserved 0x34 + offset register, so the current register image
+        of all affected channels is read in one transaction first and the new
+        values are overlaid on it. The blocks are then sent together; the
+        registers between channel blocks (fan setting and TACH) are not
+        rewritten.
+
+        Args:
+            channel_writes: (register, value) pairs per channel number
+        """
+        registers = [register for writes in channel_writes.values() for register, _ in writes]
+        first = min(registers)
+        image = self.i2c_bus.read_register_block(self.address, first, max(registers) - first + 1)
+
+        blocks = []
+        for writes in channel_writes.values():
+            start = min(register for register, _ in writes)
+            end = max(register for register, _ in writes)
+            for register, value in writes:
+                image[register - first] = value
+            blocks.append((start, image[start - first : end - first + 1]))
+        self.i2c_bus.write_blocks(self.address, blocks)
+
+    def _fan_register_writes(self, channel: int, config: FanConfig) -> list[tuple[int, int]]:
+        """
+        Build the register writes that apply a fan configuration.
+
+        The configuration must already have passed FanConfig.validate(); field
+        encodings are looked up directly without fallbacks.
+
+        Args:
+            channel: Fan channel number (1-5)
+            config: Fan configuration
+
+        Returns:
+            (register, value) pairs in the order they must be written
+        """
         self._validate_channel(channel)
 
-        # Calculate register base address for this channel
-        base = const.REG_FAN1_SETTING + (channel - 1) * const.FAN_CHANNEL_OFFSET
+        # Register addresses for this channel
+        regs = const.FAN_REGS[channel - 1]
+        writes: list[tuple[int, int]] = []
 
         # Set PWM divide for per-fan frequency control
         # Final PWM frequency = Base Frequency / pwm_divide
@@ -341,142 +769,57 @@ class EMC2305:
             raise EMC2305ValidationError(f"PWM divide must be 1-255, got {pwm_divide}")
         if pwm_divide not in const.VALID_PWM_DIVIDES:
             logger.warning(
-                f"Fan {channel}: PWM divide {pwm_divide} is not a standard value. "
-                f"Recommended values: {const.VALID_PWM_DIVIDES}"
+                "Fan %d: PWM divide %d is not a standard value. Recommended values: %s",
+                channel,
+                pwm_divide,
+                const.VALID_PWM_DIVIDES,
             )
 
-        self.i2c_bus.write_byte(
-            self.address, base + (const.REG_FAN1_PWM_DIVIDE - const.REG_FAN1_SETTING), pwm_divide
-        )
-        logger.debug(f"Fan {channel} PWM divide set to {pwm_divide}")
-
-        # Build CONFIG1 register
-        config1 = 0x00
-
-        # Set update time
-        update_map = {
-            100: const.FAN_CONFIG1_UPDATE_100MS,
-            200: const.FAN_CONFIG1_UPDATE_200MS,
-            300: const.FAN_CONFIG1_UPDATE_300MS,
-            400: const.FAN_CONFIG1_UPDATE_400MS,
-            500: const.FAN_CONFIG1_UPDATE_500MS,
-            800: const.FAN_CONFIG1_UPDATE_800MS,
-            1200: const.FAN_CONFIG1_UPDATE_1200MS,
-            1600: const.FAN_CONFIG1_UPDATE_1600MS,
-        }
-        config1 |= update_map.get(config.update_time_ms, const.DEFAULT_UPDATE_TIME)
-
-        # Set tachometer edges
-        edges_map = {
-            3: const.FAN_CONFIG1_EDGES_3,
-            5: const.FAN_CONFIG1_EDGES_5,
-            7: const.FAN_CONFIG1_EDGES_7,
-            9: const.FAN_CONFIG1_EDGES_9,
-        }
-        config1 |= edges_map.get(config.edges, const.DEFAULT_EDGES)
-
-        # Enable FSC algorithm if in FSC mode
-        if config.control_mode == ControlMode.FSC:
-            config1 |= const.FAN_CONFIG1_EN_ALGO
-            config1 |= const.FAN_CONFIG1_EN_RRC  # Enable ramp rate control
-
-        # Write CONFIG1
-        self.i2c_bus.write_byte(
-            self.address, base + (const.REG_FAN1_CONFIG1 - const.REG_FAN1_SETTING), config1
+        writes.append((regs[const.FAN_REG_PWM_DIVIDE], pwm_divide))
+        logger.debug("Fan %d PWM divide set to %d", channel, pwm_divide)
+
+        # Build and write CONFIG1 register
+        config1 = (
+            # Update time and tachometer edges
+            _UPDATE_TIME_BITS[config.update_time_ms]
+            | _EDGES_BITS[config.edges]
+            # Enable FSC algorithm and ramp rate control if in FSC mode
+            | (
+                const.FAN_CONFIG1_EN_ALGO | const.FAN_CONFIG1_EN_RRC
+                if config.control_mode is ControlMode.FSC
+                else 0
+            )
         )
-
-        # Build CONFIG2 register
-        config2 = 0x00
-
-        # Set error range
-        error_range_map = {
-            0: const.FAN_CONFIG2_ERR_RNG_0,
-            50: const.FAN_CONFIG2_ERR_RNG_50,
-            100: const.FAN_CONFIG2_ERR_RNG_100,
-            200: const.FAN_CONFIG2_ERR_RNG_200,
-        }
-        config2 |= error_range_map.get(config.error_range_rpm, const.FAN_CONFIG2_ERR_RNG_0)
-
-        # Set derivative option (0-7)
-        derivative_options = [
-            const.FAN_CONFIG2_DER_OPT_NONE,
-            const.FAN_CONFIG2_DER_OPT_1,
-            const.FAN_CONFIG2_DER_OPT_2,
-            const.FAN_CONFIG2_DER_OPT_3,
-            const.FAN_CONFIG2_DER_OPT_4,
-            const.FAN_CONFIG2_DER_OPT_5,
-            const.FAN_CONFIG2_DER_OPT_6,
-            const.FAN_CONFIG2_DER_OPT_7,
-        ]
-        if 0 <= config.derivative_mode <= 7:
-            config2 |= derivative_options[config.derivative_mode]
-
-        # Set glitch filter
-        if config.glitch_filter_enabled:
-            config2 |= const.FAN_CONFIG2_GLITCH_EN
-
-        # Set RPM range (500-16k for internal clock)
-        if self.use_external_clock:
-            config2 |= const.FAN_CONFIG2_RNG_1K_32K
-        else:
-            config2 |= const.FAN_CONFIG2_RNG_500_16K
-
-        # Write CONFIG2
-        self.i2c_bus.write_byte(
-            self.address, base + (const.REG_FAN1_CONFIG2 - const.REG_FAN1_SETTING), config2
+        writes.append((regs[const.FAN_REG_CONFIG1], config1))
+
+        # Build and write CONFIG2 register
+        config2 = (
+            # Error range and derivative option (0-7)
+            _ERROR_RANGE_BITS[config.error_range_rpm]
+            | _DERIVATIVE_OPTION_BITS[config.derivative_mode]
+            # Glitch filter
+            | (const.FAN_CONFIG2_GLITCH_EN if config.glitch_filter_enabled else 0)
+            # RPM range (500-16k for internal clock, 1k-32k for external clock)
+            | (
+                const.FAN_CONFIG2_RNG_1K_32K
+                if self.use_external_clock
+                else const.FAN_CONFIG2_RNG_500_16K
+            )
         )
+        writes.append((regs[const.FAN_REG_CONFIG2], config2))
 
-        # Set PID gains
-        gain = 0x00
-
-        # Proportional gain
-        p_map = {1: const.GAIN_P_1X, 2: const.GAIN_P_2X, 4: const.GAIN_P_4X, 8: const.GAIN_P_8X}
-        gain |= p_map.get(config.pid_gain_p, const.GAIN_P_2X)
-
-        # Integral gain
-        i_map = {
-            0: const.GAIN_I_0X,
-            1: const.GAIN_I_1X,
-            2: const.GAIN_I_2X,
-            4: const.GAIN_I_4X,
-            8: const.GAIN_I_8X,
-            16: const.GAIN_I_16X,
-            32: const.GAIN_I_32X,
-        }
-        gain |= i_map.get(config.pid_gain_i, const.GAIN_I_1X)
-
-        # Derivative gain
-        d_map = {
-            0: const.GAIN_D_0X,
-            1: const.GAIN_D_1X,
-            2: const.GAIN_D_2X,
-            4: const.GAIN_D_4X,
-            8: const.GAIN_D_8X,
-            16: const.GAIN_D_16X,
-            32: const.GAIN_D_32X,
-        }
-        gain |= d_map.get(config.pid_gain_d, const.GAIN_D_1X)
-
-        self.i2c_bus.write_byte(
-            self.address, base + (const.REG_FAN1_GAIN - const.REG_FAN1_SETTING), gain
+        # Set PID gains (proportional, integral, derivative)
+        gain = (
+            _GAIN_P_BITS[config.pid_gain_p]
+            | _GAIN_I_BITS[config.pid_gain_i]
+            | _GAIN_D_BITS[config.pid_gain_d]
         )
+        writes.append((regs[const.FAN_REG_GAIN], gain))
 
-        # Configure spin-up
-        spin_level_map = {
-            30: const.SPIN_UP_LEVEL_30_PERCENT,
-            35: const.SPIN_UP_LEVEL_35_PERCENT,
-            40: const.SPIN_UP_LEVEL_40_PERCENT,
-            45: const.SPIN_UP_LEVEL_45_PERCENT,
-            50: const.SPIN_UP_LEVEL_50_PERCENT,
-            55: const.SPIN_UP_LEVEL_55_PERCENT,
-            60: const.SPIN_UP_LEVEL_60_PERCENT,
-            65: const.SPIN_UP_LEVEL_65_PERCENT,
-        }
-        # Find closest spin-up level
-        closest_level = min(
-            spin_level_map.keys(), key=lambda x: abs(x - config.spin_up_level_percent)
-        )
-        spin_config = spin_level_map[closest_level]
+        # Configure spin-up: find closest supported level
+        spin_index = _nearest_spin_up_index(config.spin_up_level_percent)
+        closest_level = _SPIN_UP_LEVELS[spin_index]
+        spin_config = _SPIN_UP_LEVEL_BITS[spin_index]
 
         # Spin-up time in SPIN_UP_TIME_UNIT_MS units (0-SPIN_UP_TIME_MAX_VALUE)
         spin_time = min(
@@ -485,33 +828,19 @@ class EMC2305:
         )
         spin_config |= spin_time
 
-        self.i2c_bus.write_byte(
-            self.address,
-            base + (const.REG_FAN1_SPIN_UP_CONFIG - const.REG_FAN1_SETTING),
-            spin_config,
-        )
+        writes.append((regs[const.FAN_REG_SPIN_UP_CONFIG], spin_config))
 
         # Set maximum step
-        self.i2c_bus.write_byte(
-            self.address, base + (const.REG_FAN1_MAX_STEP - const.REG_FAN1_SETTING), config.max_step
-        )
+        writes.append((regs[const.FAN_REG_MAX_STEP], config.max_step))
 
         # Set minimum drive level
         min_drive_pwm = self._percent_to_pwm(config.min_drive_percent)
-        self.i2c_bus.write_byte(
-            self.address,
-            base + (const.REG_FAN1_MINIMUM_DRIVE - const.REG_FAN1_SETTING),
-            min_drive_pwm,
-        )
+        writes.append((regs[const.FAN_REG_MINIMUM_DRIVE], min_drive_pwm))
 
         # Set valid TACH count for stall detection
         # Note: Valid TACH Count is a single 8-bit register (not 16-bit)
         valid_tach = config.valid_tach_count & const.BYTE_MASK
-        self.i2c_bus.write_byte(
-            self.address,
-            base + (const.REG_FAN1_VALID_TACH_COUNT - const.REG_FAN1_SETTING),
-            valid_tach,
-        )
+        writes.append((regs[const.FAN_REG_VALID_TACH_COUNT], valid_tach))
 
         # Set Drive Fail Band for aging fan detection
         # Convert RPM band to tachometer count difference
@@ -524,62 +853,95 @@ class EMC2305:
 
             # Drive Fail Band Low Byte (0x3B) - bits 7:3 of count
             drive_fail_low = (drive_fail_band_count >> const.DRIVE_FAIL_LOW_SHIFT) & const.BYTE_MASK
-            self.i2c_bus.write_byte(
-                self.address,
-                base + (const.REG_FAN1_DRIVE_FAIL_BAND_LOW - const.REG_FAN1_SETTING),
-                drive_fail_low,
-            )
+            writes.append((regs[const.FAN_REG_DRIVE_FAIL_BAND_LOW], drive_fail_low))
 
             # Drive Fail Band High Byte (0x3C) - bits 12:8 of count
             drive_fail_high = (
                 drive_fail_band_count >> const.DRIVE_FAIL_HIGH_SHIFT
             ) & const.DRIVE_FAIL_HIGH_MASK
-            self.i2c_bus.write_byte(
-                self.address,
-                base + (const.REG_FAN1_DRIVE_FAIL_BAND_HIGH - const.REG_FAN1_SETTING),
-                drive_fail_high,
-            )
+            writes.append((regs[const.FAN_REG_DRIVE_FAIL_BAND_HIGH], drive_fail_high))
 
             logger.debug(
-                f"Fan {channel} Drive Fail Band configured: {config.drive_fail_band_rpm} RPM "
-                f"(count={drive_fail_band_count}, low=0x{drive_fail_low:02X}, high=0x{drive_fail_high:02X})"
+                "Fan %d Drive Fail Band configured: %d RPM (count=%d, low=0x%02X, high=0x%02X)",
+                channel,
+                config.drive_fail_band_rpm,
+                drive_fail_band_count,
+                drive_fail_low,
+                drive_fail_high,
             )
         else:
             # Disable Drive Fail Band by writing 0
-            self.i2c_bus.write_byte(
-                self.address,
-                base + (const.REG_FAN1_DRIVE_FAIL_BAND_LOW - const.REG_FAN1_SETTING),
-                0x00,
-            )
-            self.i2c_bus.write_byte(
-                self.address,
-                base + (const.REG_FAN1_DRIVE_FAIL_BAND_HIGH - const.REG_FAN1_SETTING),
-                0x00,
-            )
+            writes.append((regs[const.FAN_REG_DRIVE_FAIL_BAND_LOW], 0x00))
+            writes.append((regs[const.FAN_REG_DRIVE_FAIL_BAND_HIGH], 0x00))
 
         logger.debug(
-            f"Fan {channel} configured: mode={config.control_mode.value}, "
-            f"min_drive={config.min_drive_percent}%, spin_up={closest_level}%/{config.spin_up_time_ms}ms"
+            "Fan %d configured: mode=%s, min_drive=%d%%, spin_up=%d%%/%dms",
+            channel,
+            config.control_mode.value,
+            config.min_drive_percent,
+            closest_level,
+            config.spin_up_time_ms,
         )
 
-    def _read_all_status_registers(self) -> tuple[int, int, int, int]:
+        return writes
+
+    def _update_status_cache_ttl(self) -> None:
+        """Set the status cache lifetime to half the fastest fan update time."""
+        update_times = [config.update_time_ms for config in self._fan_configs.values()]
+        self._status_cache_ttl = min(update_times) / 2000.0 if update_times else 0.0
+
+    def _read_all_status_registers(self, use_cache: bool = True) -> tuple[int, int, int, int]:
         """
         Read all status registers in one optimized block read.
 
+        The status registers clear on read, so the result is cached for
+        _status_cache_ttl seconds. Several status queries in a burst (e.g. one
+        per fan) then see the same snapshot instead of the first query
+        clearing the faults reported to the rest.
+
+        Args:
+            use_cache: Return the cached snapshot if it has not expired
+
         Returns:
             Tuple of (fan_status, stall_status, spin_status, drive_fail_status)
         """
-        # Read 4 consecutive status registers (0x24-0x27) in one I2C transaction
-        status_block = self.i2c_bus.read_block(self.address, const.REG_FAN_STATUS, 4)
-        return (status_block[0], status_block[1], status_block[2], status_block[3])
+        now = time.monotonic()
+        if (
+            use_cache
+            and self._status_cache is not None
+            and now - self._status_cache_time < self._status_cache_ttl
+        ):
+            return self._status_cache
+
+        # Read the 4 consecutive status registers (0x24-0x27) in one I2C transaction
+        fan_status, stall_status, spin_status, drive_fail_status = self.i2c_bus.read_block(
+            self.address,
+            const.REG_FAN_STATUS,
+            const.REG_DRIVE_FAIL_STATUS - const.REG_FAN_STATUS + 1,
+        )
+        self._status_cache = (fan_status, stall_status, spin_status, drive_fail_status)
+        self._status_cache_time = now
+        self._note_watchdog_status(fan_status)
+        return self._status_cache
+
+    def _clear_fault_status(self) -> tuple[int, int, int, int]:
+        """
+        Clear all fault status registers.
 
-    def _clear_fault_status(self) -> None:
-        """Clear all fault status registers."""
+        Returns:
+            Tuple of the (fan_status, stall_status, spin_status, drive_fail_status)
+            values that were latched before clearing
+        """
         # Reading status registers clears them (optimized with block read)
-        self._read_all_status_registers()
+        status = self._read_all_status_registers(use_cache=False)
+        self._status_cache = None
+        return status
 
     def _validate_channel(self, channel: int) -> None:
         """Validate fan channel number."""
+        # Fast path for the common case: an exact int in range
+        if channel.__class__ is int and 1 <= channel <= const.NUM_FAN_CHANNELS:
+            return
         if not isinstance(channel, int):
             raise EMC2305ValidationError(
                 f"Channel must be an integer, got {type(channel).__name__}"
@@ -591,6 +953,10 @@ class EMC2305:
 
     def _validate_percent(self, percent: float) -> None:
         """Validate percentage value."""
+        # Fast path for the common case: an exact float or int in range
+        cls = percent.__class__
+        if (cls is float or cls is int) and 0 <= percent <= 100:
+            return
         if not isinstance(percent, (int, float)):
             raise EMC2305ValidationError(
                 f"Percentage must be a number, got {type(percent).__name__}"
@@ -598,10 +964,12 @@ class EMC2305:
         if not 0 <= percent <= 100:
             raise EMC2305ValidationError(f"Percentage must be 0-100, got {percent}")
 
-    def _validate_rpm(
-        self, rpm: int, min_rpm: int = const.MIN_RPM, max_rpm: int = const.MAX_RPM
-    ) -> None:
+    @staticmethod
+    def _validate_rpm(rpm: int, min_rpm: int = const.MIN_RPM, max_rpm: int = const.MAX_RPM) -> None:
         """Validate RPM value."""
+        # Fast path for the common case: an exact int in range
+        if rpm.__class__ is int and 0 <= min_rpm <= rpm <= max_rpm:
+            return
         if not isinstance(rpm, int):
             raise EMC2305ValidationError(f"RPM must be an integer, got {type(rpm).__name__}")
         if rpm < 0:
@@ -609,7 +977,8 @@ class EMC2305:
         if not min_rpm <= rpm <= max_rpm:
             raise EMC2305ValidationError(f"RPM must be {min_rpm}-{max_rpm}, got {rpm}")
 
-    def _validate_pid_gain(self, gain: int, valid_gains: list[int], gain_name: str) -> None:
+    @staticmethod
+    def _validate_pid_gain(gain: int, valid_gains: list[int], gain_name: str) -> None:
         """Validate PID gain value."""
         if not isinstance(gain, int):
             raise EMC2305ValidationError(
@@ -620,92 +989,20 @@ class EMC2305:
                 f"{gain_name} gain must be one of {valid_gains}, got {gain}"
             )
 
-    def _validate_fan_config(self, config: FanConfig) -> None:
-        """Comprehensive validation of fan configuration."""
-        # Validate RPM limits
-        if config.min_rpm >= config.max_rpm:
-            raise EMC2305ValidationError(
-                f"min_rpm ({config.min_rpm}) must be less than max_rpm ({config.max_rpm})"
-            )
-        self._validate_rpm(config.min_rpm)
-        self._validate_rpm(config.max_rpm)
-
-        # Validate PWM limits
-        if not 0 <= config.min_drive_percent <= 100:
-            raise EMC2305ValidationError(
-                f"min_drive_percent must be 0-100, got {config.min_drive_percent}"
-            )
-
-        # Validate max step
-        if not 0 <= config.max_step <= 63:
-            raise EMC2305ValidationError(f"max_step must be 0-63, got {config.max_step}")
-
-        # Validate update time
-        valid_update_times = [100, 200, 300, 400, 500, 800, 1200, 1600]
-        if config.update_time_ms not in valid_update_times:
-            raise EMC2305ValidationError(
-                f"update_time_ms must be one of {valid_update_times}, got {config.update_time_ms}"
-            )
-
-        # Validate tachometer edges
-        valid_edges = [3, 5, 7, 9]
-        if config.edges not in valid_edges:
-            raise EMC2305ValidationError(
-                f"edges must be one of {valid_edges} (for 1/2/3/4-pole fans), got {config.edges}"
-            )
-
-        # Validate spin-up parameters
-        if not 0 <= config.spin_up_time_ms <= 1550:
-            raise EMC2305ValidationError(
-                f"spin_up_time_ms must be 0-1550, got {config.spin_up_time_ms}"
-            )
-        valid_spin_up_levels = [30, 35, 40, 45, 50, 55, 60, 65]
-        if config.spin_up_level_percent not in valid_spin_up_levels:
-            raise EMC2305ValidationError(
-                f"spin_up_level_percent must be one of {valid_spin_up_levels}, got {config.spin_up_level_percent}"
-            )
-
-        # Validate PID gains
-        valid_p_gains = [1, 2, 4, 8]
-        valid_id_gains = [0, 1, 2, 4, 8, 16, 32]
-        self._validate_pid_gain(config.pid_gain_p, valid_p_gains, "Proportional")
-        self._validate_pid_gain(config.pid_gain_i, valid_id_gains, "Integral")
-        self._validate_pid_gain(config.pid_gain_d, valid_id_gains, "Derivative")
-
-        # Validate PWM divide
-        if not 1 <= config.pwm_divide <= 255:
-            raise EMC2305ValidationError(f"pwm_divide must be 1-255, got {config.pwm_divide}")
-
-        # Validate CONFIG2 parameters
-        valid_error_ranges = [0, 50, 100, 200]
-        if config.error_range_rpm not in valid_error_ranges:
-            raise EMC2305ValidationError(
-                f"error_range_rpm must be one of {valid_error_ranges}, got {config.error_range_rpm}"
-            )
-
-        if not 0 <= config.derivative_mode <= 7:
-            raise EMC2305ValidationError(
-                f"derivative_mode must be 0-7, got {config.derivative_mode}"
-            )
-
-        # Validate Drive Fail Band
-        if config.drive_fail_band_rpm < 0:
-            raise EMC2305ValidationError(
-                f"drive_fail_band_rpm cannot be negative, got {config.drive_fail_band_rpm}"
-            )
-
-        if config.valid_tach_count < 0 or config.valid_tach_count > const.TACH_COUNT_MAX:
-            raise EMC2305ValidationError(
-                f"valid_tach_count must be 0-{const.TACH_COUNT_MAX}, got {config.valid_tach_count}"
-            )
-
     def _percent_to_pwm(self, percent: float) -> int:
         """Convert percentage (0-100) to PWM value (0-255)."""
+        # Whole percentages, including floats such as 50.0, come from the table.
+        # The formula is kept as is for fractions: folding it into a single
+        # precomputed 2.55 factor truncates many values one step lower.
+        if isinstance(percent, int):
+            return const.PCT_TO_PWM[percent]
+        if percent.is_integer():
+            return const.PCT_TO_PWM[int(percent)]
         return int(percent * const.MAX_PWM_VALUE / 100.0)
 
     def _pwm_to_percent(self, pwm: int) -> float:
         """Convert PWM value (0-255) to percentage (0-100)."""
-        return (pwm / const.MAX_PWM_VALUE) * 100.0
+        return const.PWM_TO_PCT[pwm]
 
     def _rpm_to_tach_count(self, rpm: int, edges: int = 5) -> int:
         """
@@ -731,27 +1028,19 @@ class EMC2305:
             return const.TACH_COUNT_MAX
 
         # Validate RPM range based on clock source
-        max_rpm = const.MAX_RPM_EXT_CLOCK if self.use_external_clock else const.MAX_RPM
-        if not const.MIN_RPM <= rpm <= max_rpm:
+        if not const.MIN_RPM <= rpm <= self._max_rpm:
             raise EMC2305ValidationError(
-                f"RPM {rpm} out of range (must be {const.MIN_RPM}-{max_rpm})"
+                f"RPM {rpm} out of range (must be {const.MIN_RPM}-{self._max_rpm})"
             )
 
-        tach_freq = (
-            const.EXTERNAL_CLOCK_FREQ_HZ
-            if self.use_external_clock
-            else const.INTERNAL_CLOCK_FREQ_HZ
-        )
-
-        # Calculate poles from edges
-        poles = (edges - 1) // 2
-        if poles == 0:
-            poles = 2  # Default to 2-pole
-
-        # Inverse of RPM formula: TACH_COUNT = ((edges - 1) * tach_freq * 60) / (RPM * poles)
-        tach_count = ((edges - 1) * tach_freq * 60) // (rpm * poles)
+        scale = self._tach_scale_by_edges.get(edges)
+        if scale is None:
+            raise EMC2305ValidationError(
+                f"Invalid tachometer edges {edges} (must be 3, 5, 7, or 9)"
+            )
 
-        return min(const.TACH_COUNT_MAX, max(0, tach_count))
+        # Inverse of RPM formula, with the numerator precomputed per edges setting
+        return min(const.TACH_COUNT_MAX, scale // rpm)
 
     def _tach_count_to_rpm(self, tach_count: int, edges: int = 5) -> int:
         """
@@ -783,41 +1072,114 @@ class EMC2305:
             )
 
         # Validate edges (3, 5, 7, or 9 for 1-4 pole fans)
-        if edges not in [3, 5, 7, 9]:
+        scale = self._tach_scale_by_edges.get(edges)
+        if scale is None:
             raise EMC2305ValidationError(
                 f"Invalid tachometer edges {edges} (must be 3, 5, 7, or 9)"
             )
 
-        tach_freq = (
-            const.EXTERNAL_CLOCK_FREQ_HZ
-            if self.use_external_clock
-            else const.INTERNAL_CLOCK_FREQ_HZ
-        )
+        # RPM = ((edges - 1) * tach_freq * 60) / (tach_count * poles), with the
+        # numerator and pole division precomputed in __init__. Flooring the
+        # numerator by poles first gives the same result as the combined division.
+        return scale // tach_count
+
+    def _read_tach_pair(self, register: int, layout: struct.Struct) -> int:
+        """
+        Read a TACH register pair in one transaction and return its 13-bit count.
+
+        Args:
+            register: First register of the pair
+            layout: _TACH_READING (HIGH, LOW) or _TACH_TARGET (LOW, HIGH)
+
+        Returns:
+            TACH count
+        """
+        data = bytes(self.i2c_bus.read_block(self.address, register, 2))
+        (raw_tach,) = layout.unpack(data)
+        return (raw_tach & const.TACH_PAIR_MASK) >> const.TACH_COUNT_LOW_SHIFT
 
-        # Calculate poles from edges: edges = poles * 2 + 1
-        # So: poles = (edges - 1) / 2
-        poles = (edges - 1) // 2
-        if poles == 0:
-            poles = 2  # Default to 2-pole
+    def _tach_reading_to_rpm(self, tach_count: int, edges: int) -> int:
+        """
+        Convert a measured TACH count to RPM, reporting stopped fans as 0.
 
-        # Corrected formula: RPM = ((edges - 1) * tach_freq * 60) / (tach_count * poles)
-        # The (edges - 1) factor accounts for EMC2305 counting clock cycles
-        # between (edges - 1) tachometer transitions
-        rpm = ((edges - 1) * tach_freq * 60) // (tach_count * poles)
+        Args:
+            tach_count: 13-bit tachometer count from the TACH reading registers
+            edges: Tachometer edges per revolution (3, 5, 7, or 9)
+
+        Returns:
+            RPM value (0 if fan is stopped)
+        """
+        # Check for max TACH count - indicates no tach signal (fan stopped)
+        # EMC2305 returns 0x1FFF (or near max) when no pulses are detected
+        if tach_count >= const.TACH_COUNT_STOPPED_THRESHOLD:
+            return 0
+
+        rpm = self._tach_count_to_rpm(tach_count, edges)
+
+        # Filter noise - readings below threshold mean fan is stopped
+        if rpm < const.MIN_VALID_RPM_READING:
+            return 0
 
         return rpm
 
+    def _read_fan_block(self, channel: int) -> bytes:
+        """
+        Read the complete register window of a fan channel in one transaction.
+
+        The 16-byte window spans REG_FANx_SETTING through REG_FANx_TACH_READING_LOW.
+        Index it with (const.REG_FAN1_<register> - const.REG_FAN1_SETTING), or
+        the precomputed const.FAN_WINDOW_* offsets.
+
+        Args:
+            channel: Fan channel number (1-5)
+
+        Returns:
+            Register values of the channel window
+        """
+        base = const.FAN_REGS[channel - 1][const.FAN_REG_SETTING]
+        return bytes(self.i2c_bus.read_block(self.address, base, const.FAN_CHANNEL_OFFSET))
+
+    def _record_pwm_setting(self, channel: int, pwm_value: int) -> None:
+        """
+        Update the skip-write cache from a Fan Setting value read from the device.
+
+        Keeps set_pwm_duty_cycle() from skipping a write after the register was
+        changed behind the cache. Channels under FSC control are not cached,
+        since the algorithm rewrites the register continuously.
+
+        Args:
+            channel: Fan channel number (1-5)
+            pwm_value: Fan Setting register value
+        """
+        if self._fan_configs[channel].control_mode is ControlMode.PWM:
+            self._last_pwm_setting[channel] = pwm_value
+        else:
+            self._last_pwm_setting.pop(channel, None)
+
+    def _note_watchdog_status(self, fan_status: int) -> None:
+        """Drop the skip-write cache if a Fan Status read reports a watchdog timeout."""
+        if fan_status & const.FAN_STATUS_WATCH:
+            # The device drives all fans to full speed on timeout
+            self._last_pwm_setting.clear()
+
     # =============================================================================
     # Public API - PWM Control
     # =============================================================================
 
-    def set_pwm_duty_cycle(self, channel: int, percent: float) -> None:
+    def set_pwm_duty_cycle(self, channel: int, percent: float, force: bool = False) -> None:
         """
         Set PWM duty cycle for direct PWM control mode.
 
+        The write is skipped when the register already holds the requested
+        value, as last written or read back by this instance. A watchdog
+        timeout seen by any status read drops that knowledge. Pass force=True
+        after the Fan Setting register was written from outside this driver
+        instance (another process or EMC2305 object), which it cannot see.
+
         Args:
             channel: Fan channel number (1-5)
             percent: PWM duty cycle percentage (0-100)
+            force: Write the register even if the value is unchanged
 
         Raises:
             ValueError: If channel or percent is out of range
@@ -826,25 +1188,81 @@ class EMC2305:
         Example:
             >>> fan_controller.set_pwm_duty_cycle(1, 75.0)  # Set fan 1 to 75%
         """
+        self._ensure_configured()
         self._validate_channel(channel)
         self._validate_percent(percent)
 
+        # Look up register address and convert percent to PWM value
+        reg = const.FAN_REGS[channel - 1][const.FAN_REG_SETTING]
+        pwm_value = self._percent_to_pwm(percent)
+
         with self._lock:
             try:
-                # Calculate register address
-                reg = const.REG_FAN1_SETTING + (channel - 1) * const.FAN_CHANNEL_OFFSET
-
-                # Convert percent to PWM value
-                pwm_value = self._percent_to_pwm(percent)
+                if not force and self._last_pwm_setting.get(channel) == pwm_value:
+                    return
 
                 # Write to Fan Setting register
                 self.i2c_bus.write_byte(self.address, reg, pwm_value)
+                self._last_pwm_setting[channel] = pwm_value
+                self._status_cache = None
 
-                logger.debug(f"Fan {channel} PWM set to {percent:.1f}% (0x{pwm_value:02X})")
+                logger.debug("Fan %d PWM set to %.1f%% (0x%02X)", channel, percent, pwm_value)
 
             except I2CError as e:
                 raise EMC2305Error(f"Failed to set PWM for fan {channel}: {e}")
 
+    def set_pwm_duty_cycles(self, values: Dict[int, float], force: bool = False) -> None:
+        """
+        Set PWM duty cycles for several fan channels in one bus operation.
+
+        The Fan Setting registers are 0x10 apart with TACH and configuration
+        registers in between, so instead of one block write the settings are
+        sent as a register batch (a single I2C_RDWR transaction where the
+        adapter supports it). Channels already at the requested value are
+        skipped, as in set_pwm_duty_cycle(); pass force=True after the Fan
+        Setting registers were written from outside this driver instance.
+
+        Args:
+            values: Mapping of fan channel number (1-5) to duty cycle percentage (0-100)
+            force: Write every register even if the value is unchanged
+
+        Raises:
+            ValueError: If a channel or percent is out of range
+            EMC2305Error: If I2C communication fails
+
+        Example:
+            >>> fan_controller.set_pwm_duty_cycles({1: 40.0, 2: 40.0, 3: 60.0})
+        """
+        self._ensure_configured()
+        for channel, percent in values.items():
+            self._validate_channel(channel)
+            self._validate_percent(percent)
+
+        pwm_values = {channel: self._percent_to_pwm(percent) for channel, percent in values.items()}
+
+        with self._lock:
+            settings = {
+                channel: pwm_value
+                for channel, pwm_value in pwm_values.items()
+                if force or self._last_pwm_setting.get(channel) != pwm_value
+            }
+            if not settings:
+                return
+
+            writes = [
+                (const.FAN_REGS[channel - 1][const.FAN_REG_SETTING], pwm_value)
+                for channel, pwm_value in settings.items()
+            ]
+            try:
+                self.i2c_bus.write_registers(self.address, writes)
+            except I2CError as e:
+                raise EMC2305Error(f"Failed to set PWM for fans {sorted(settings)}: {e}")
+
+            self._last_pwm_setting.update(settings)
+            self._status_cache = None
+
+            logger.debug("Fan PWM batch set: %s", settings)
+
     def get_pwm_duty_cycle(self, channel: int) -> float:
         """
         Get current PWM duty cycle.
@@ -859,23 +1277,57 @@ class EMC2305:
             >>> duty_cycle = fan_controller.get_pwm_duty_cycle(1)
             >>> print(f"Fan 1 is at {duty_cycle}%")
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
+        # Look up register address
+        reg = const.FAN_REGS[channel - 1][const.FAN_REG_SETTING]
+
         with self._lock:
             try:
-                # Calculate register address
-                reg = const.REG_FAN1_SETTING + (channel - 1) * const.FAN_CHANNEL_OFFSET
-
                 # Read Fan Setting register
                 pwm_value = self.i2c_bus.read_byte(self.address, reg)
+            except I2CError as e:
+                raise EMC2305Error(f"Failed to read PWM for fan {channel}: {e}")
+            self._record_pwm_setting(channel, pwm_value)
+
+        # Convert to percent
+        return const.PWM_TO_PCT[pwm_value]
+
+    def get_all_pwm_duty_cycles(self) -> Dict[int, float]:
+        """
+        Get current PWM duty cycle of all fans.
+
+        The Fan Setting registers of all channels (0x30-0x70) are read in a
+        single I2C transaction instead of one read per channel.
+
+        Returns:
+            Dictionary mapping channel number to duty cycle percentage (0-100)
 
-                # Convert to percent
-                percent = self._pwm_to_percent(pwm_value)
+        Raises:
+            EMC2305Error: If I2C communication fails
 
-                return percent
+        Example:
+            >>> duty_cycles = fan_controller.get_all_pwm_duty_cycles()
+            >>> print(f"Fan 2 is at {duty_cycles[2]}%")
+        """
+        self._ensure_configured()
+        first = const.FAN_REGS[0][const.FAN_REG_SETTING]
+        last = const.FAN_REGS[-1][const.FAN_REG_SETTING]
 
+        with self._lock:
+            try:
+                data = self.i2c_bus.read_register_block(self.address, first, last - first + 1)
             except I2CError as e:
-                raise EMC2305Error(f"Failed to read PWM for fan {channel}: {e}")
+                raise EMC2305Error(f"Failed to read fan PWM duty cycles: {e}")
+            pwm_values = data[:: const.FAN_CHANNEL_OFFSET]
+            for channel, pwm_value in enumerate(pwm_values, start=1):
+                self._record_pwm_setting(channel, pwm_value)
+
+        to_percent = const.PWM_TO_PCT
+        return {
+            channel: to_percent[pwm_value] for channel, pwm_value in enumerate(pwm_values, start=1)
+        }
 
     def set_pwm_duty_cycle_verified(
         self, channel: int, percent: float, tolerance: float = 5.0, retry_count: int = 1
@@ -915,12 +1367,13 @@ class EMC2305:
             ... else:
             ...     print(f"Readback mismatch: wanted 50%, got {actual}%")
         """
+        self._ensure_configured()
         self._validate_channel(channel)
         self._validate_percent(percent)
 
         for attempt in range(retry_count + 1):
-            # Set the PWM duty cycle
-            self.set_pwm_duty_cycle(channel, percent)
+            # Set the PWM duty cycle, always writing so a retry can correct the register
+            self.set_pwm_duty_cycle(channel, percent, force=True)
 
             # Wait for update cycle to complete
             # Update time is typically 200ms (configurable in FanConfig)
@@ -934,22 +1387,34 @@ class EMC2305:
             if delta <= tolerance:
                 if attempt > 0:
                     logger.info(
-                        f"Fan {channel} PWM verified at {actual:.1f}% "
-                        f"(target: {percent:.1f}%, attempt: {attempt + 1})"
+                        "Fan %d PWM verified at %.1f%% (target: %.1f%%, attempt: %d)",
+                        channel,
+                        actual,
+                        percent,
+                        attempt + 1,
                     )
                 return (True, actual)
             else:
                 if attempt < retry_count:
                     logger.warning(
-                        f"Fan {channel} PWM readback mismatch on attempt {attempt + 1}: "
-                        f"wrote {percent:.1f}%, read {actual:.1f}% (delta: {delta:.1f}%). "
-                        f"Retrying..."
+                        "Fan %d PWM readback mismatch on attempt %d: "
+                        "wrote %.1f%%, read %.1f%% (delta: %.1f%%). Retrying...",
+                        channel,
+                        attempt + 1,
+                        percent,
+                        actual,
+                        delta,
                     )
                 else:
                     logger.warning(
-                        f"Fan {channel} PWM readback mismatch after {retry_count + 1} attempts: "
-                        f"wrote {percent:.1f}%, read {actual:.1f}% (delta: {delta:.1f}%). "
-                        f"This may be normal hardware quantization behavior."
+                        "Fan %d PWM readback mismatch after %d attempts: "
+                        "wrote %.1f%%, read %.1f%% (delta: %.1f%%). "
+                        "This may be normal hardware quantization behavior.",
+                        channel,
+                        retry_count + 1,
+                        percent,
+                        actual,
+                        delta,
                     )
 
         return (False, actual)
@@ -971,6 +1436,7 @@ class EMC2305:
             >>> fan_controller.set_pwm_output_mode(1, open_drain=True)   # Open-drain
             >>> fan_controller.set_pwm_output_mode(1, open_drain=False)  # Push-pull
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
         with self._lock:
@@ -979,7 +1445,7 @@ class EMC2305:
                 current = self.i2c_bus.read_byte(self.address, const.REG_PWM_OUTPUT_CONFIG)
 
                 # Per datasheet: 0 = open-drain (default), 1 = push-pull
-                bit_mask = 1 << (channel - 1)
+                bit_mask = const.FAN_CHANNEL_BITS[channel - 1]
 
                 if open_drain:
                     new_config = current & ~bit_mask  # Clear bit for open-drain
@@ -988,7 +1454,9 @@ class EMC2305:
 
                 self.i2c_bus.write_byte(self.address, const.REG_PWM_OUTPUT_CONFIG, new_config)
                 logger.debug(
-                    f"Fan {channel} PWM output set to {'open-drain' if open_drain else 'push-pull'}"
+                    "Fan %d PWM output set to %s",
+                    channel,
+                    "open-drain" if open_drain else "push-pull",
                 )
 
             except I2CError as e:
@@ -1005,13 +1473,14 @@ class EMC2305:
             >>> fan_controller.set_all_pwm_output_mode(open_drain=True)   # All open-drain
             >>> fan_controller.set_all_pwm_output_mode(open_drain=False)  # All push-pull
         """
+        self._ensure_configured()
         with self._lock:
             try:
                 # Per datasheet: 0 = open-drain, 1 = push-pull
                 config = 0x00 if open_drain else 0x1F
                 self.i2c_bus.write_byte(self.address, const.REG_PWM_OUTPUT_CONFIG, config)
                 logger.debug(
-                    f"All PWM outputs set to {'open-drain' if open_drain else 'push-pull'}"
+                    "All PWM outputs set to %s", "open-drain" if open_drain else "push-pull"
                 )
 
             except I2CError as e:
@@ -1031,19 +1500,19 @@ class EMC2305:
             >>> is_open_drain = fan_controller.get_pwm_output_mode(1)
             >>> print("Open-drain" if is_open_drain else "Push-pull")
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
         with self._lock:
             try:
                 config = self.i2c_bus.read_byte(self.address, const.REG_PWM_OUTPUT_CONFIG)
-                bit_mask = 1 << (channel - 1)
-                # Per datasheet: 0 = open-drain, 1 = push-pull
-                # Return True for open-drain (bit NOT set)
-                return not bool(config & bit_mask)
-
             except I2CError as e:
                 raise EMC2305Error(f"Failed to read PWM output mode for fan {channel}: {e}")
 
+        # Per datasheet: 0 = open-drain, 1 = push-pull
+        # Return True for open-drain (bit NOT set)
+        return not config & const.FAN_CHANNEL_BITS[channel - 1]
+
     def set_pwm_polarity(self, channel: int, inverted: bool = False) -> None:
         """
         Set PWM polarity for a specific fan channel.
@@ -1061,6 +1530,7 @@ class EMC2305:
             >>> fan_controller.set_pwm_polarity(1, inverted=False)  # Normal
             >>> fan_controller.set_pwm_polarity(1, inverted=True)   # Inverted
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
         with self._lock:
@@ -1069,7 +1539,7 @@ class EMC2305:
                 current = self.i2c_bus.read_byte(self.address, const.REG_PWM_POLARITY_CONFIG)
 
                 # Each channel is 1 bit: 0 = normal, 1 = inverted
-                bit_mask = 1 << (channel - 1)
+                bit_mask = const.FAN_CHANNEL_BITS[channel - 1]
 
                 if inverted:
                     new_config = current | bit_mask
@@ -1078,7 +1548,7 @@ class EMC2305:
 
                 self.i2c_bus.write_byte(self.address, const.REG_PWM_POLARITY_CONFIG, new_config)
                 logger.debug(
-                    f"Fan {channel} PWM polarity set to {'inverted' if inverted else 'normal'}"
+                    "Fan %d PWM polarity set to %s", channel, "inverted" if inverted else "normal"
                 )
 
             except I2CError as e:
@@ -1098,17 +1568,17 @@ class EMC2305:
             >>> is_inverted = fan_controller.get_pwm_polarity(1)
             >>> print("Inverted" if is_inverted else "Normal")
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
         with self._lock:
             try:
                 config = self.i2c_bus.read_byte(self.address, const.REG_PWM_POLARITY_CONFIG)
-                bit_mask = 1 << (channel - 1)
-                return bool(config & bit_mask)
-
             except I2CError as e:
                 raise EMC2305Error(f"Failed to read PWM polarity for fan {channel}: {e}")
 
+        return bool(config & const.FAN_CHANNEL_BITS[channel - 1])
+
     # =============================================================================
     # Public API - RPM Control (FSC Mode)
     # =============================================================================
@@ -1130,36 +1600,37 @@ class EMC2305:
         Example:
             >>> fan_controller.set_target_rpm(1, 3000)  # Set fan 1 to 3000 RPM
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
-        max_rpm = const.MAX_RPM_EXT_CLOCK if self.use_external_clock else const.MAX_RPM
-        self._validate_rpm(rpm, const.MIN_RPM, max_rpm)
+        self._validate_rpm(rpm, const.MIN_RPM, self._max_rpm)
 
-        with self._lock:
-            try:
-                # Get fan config to use correct edges value
-                config = self._fan_configs.get(channel, FanConfig())
+        # Get fan config to use correct edges value
+        # Convert RPM to TACH count using configured edges
+        tach_count = self._rpm_to_tach_count(rpm, self._channel_edges[channel])
 
-                # Convert RPM to TACH count using configured edges
-                tach_count = self._rpm_to_tach_count(rpm, config.edges)
+        # Calculate register addresses
+        regs = const.FAN_REGS[channel - 1]
+        reg_low = regs[const.FAN_REG_TACH_TARGET_LOW]
+        reg_high = regs[const.FAN_REG_TACH_TARGET_HIGH]
 
-                # Calculate register addresses
-                base = const.REG_FAN1_SETTING + (channel - 1) * const.FAN_CHANNEL_OFFSET
-                reg_low = base + (const.REG_FAN1_TACH_TARGET_LOW - const.REG_FAN1_SETTING)
-                reg_high = base + (const.REG_FAN1_TACH_TARGET_HIGH - const.REG_FAN1_SETTING)
+        # TACH target is the 13-bit value shifted left by 3, MSB first
+        # The register format has 3 LSBs unused in the LOW register.
+        shifted_tach = tach_count << const.TACH_COUNT_LOW_SHIFT
+        tach_high = (shifted_tach >> const.TACH_COUNT_HIGH_SHIFT) & const.TACH_COUNT_HIGH_MASK
+        tach_low = shifted_tach & const.BYTE_MASK
 
-                # Write TACH target (13-bit value shifted left by 3, MSB first)
-                # The register format has 3 LSBs unused in the LOW register
-                shifted_tach = tach_count << const.TACH_COUNT_LOW_SHIFT
-                self.i2c_bus.write_byte(
-                    self.address,
-                    reg_high,
-                    (shifted_tach >> const.TACH_COUNT_HIGH_SHIFT) & const.TACH_COUNT_HIGH_MASK,
+        with self._lock:
+            try:
+                # Both bytes go out in one batch so the PID loop never sees a
+                # half-updated target.
+                self.i2c_bus.write_registers(
+                    self.address, [(reg_high, tach_high), (reg_low, tach_low)]
                 )
-                self.i2c_bus.write_byte(self.address, reg_low, shifted_tach & const.BYTE_MASK)
+                self._status_cache = None
 
                 logger.debug(
-                    f"Fan {channel} target RPM set to {rpm} (TACH count: 0x{tach_count:04X})"
+                    "Fan %d target RPM set to %d (TACH count: 0x%04X)", channel, rpm, tach_count
                 )
 
             except I2CError as e:
@@ -1179,35 +1650,22 @@ class EMC2305:
             >>> target = fan_controller.get_target_rpm(1)
             >>> print(f"Fan 1 target: {target} RPM")
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
+        # Same format as TACH reading: 13-bit value with 3 LSBs unused in LOW register
+        reg_low = const.FAN_REGS[channel - 1][const.FAN_REG_TACH_TARGET_LOW]
+
         with self._lock:
             try:
-                # Calculate register addresses
-                base = const.REG_FAN1_SETTING + (channel - 1) * const.FAN_CHANNEL_OFFSET
-                reg_low = base + (const.REG_FAN1_TACH_TARGET_LOW - const.REG_FAN1_SETTING)
-                reg_high = base + (const.REG_FAN1_TACH_TARGET_HIGH - const.REG_FAN1_SETTING)
-
-                # Read TACH target registers
-                # Same format as TACH reading: 13-bit value with 3 LSBs unused in LOW register
-                tach_high = (
-                    self.i2c_bus.read_byte(self.address, reg_high) & const.TACH_COUNT_HIGH_MASK
-                )
-                tach_low = self.i2c_bus.read_byte(self.address, reg_low)
-
-                # Combine registers and apply 3-bit right shift
-                raw_tach = (tach_high << const.TACH_COUNT_HIGH_SHIFT) | tach_low
-                tach_count = raw_tach >> const.TACH_COUNT_LOW_SHIFT
-
-                # Convert to RPM
-                config = self._fan_configs.get(channel, FanConfig())
-                rpm = self._tach_count_to_rpm(tach_count, config.edges)
-
-                return rpm
-
+                # Read TACH target LOW/HIGH registers in one transaction
+                tach_count = self._read_tach_pair(reg_low, _TACH_TARGET)
             except I2CError as e:
                 raise EMC2305Error(f"Failed to read target RPM for fan {channel}: {e}")
 
+        # Convert to RPM
+        return self._tach_count_to_rpm(tach_count, self._channel_edges[channel])
+
     def get_current_rpm(self, channel: int) -> int:
         """
         Get current measured RPM from tachometer.
@@ -1222,58 +1680,74 @@ class EMC2305:
             >>> rpm = fan_controller.get_current_rpm(1)
             >>> print(f"Fan 1 speed: {rpm} RPM")
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
+        reg_high = const.FAN_REGS[channel - 1][const.FAN_REG_TACH_READING_HIGH]
+
         with self._lock:
             try:
-                # Calculate register addresses
-                base = const.REG_FAN1_SETTING + (channel - 1) * const.FAN_CHANNEL_OFFSET
-                reg_low = base + (const.REG_FAN1_TACH_READING_LOW - const.REG_FAN1_SETTING)
-                reg_high = base + (const.REG_FAN1_TACH_READING_HIGH - const.REG_FAN1_SETTING)
-
-                # Read TACH reading registers
-                # The TACH count is a 13-bit value stored across two registers:
-                # - HIGH register: bits 12:8 (5 bits)
-                # - LOW register: bits 7:3 (5 bits), with 3 LSBs unused
-                tach_high = (
-                    self.i2c_bus.read_byte(self.address, reg_high) & const.TACH_COUNT_HIGH_MASK
-                )
-                tach_low = self.i2c_bus.read_byte(self.address, reg_low)
+                # Read TACH reading HIGH/LOW registers in one transaction
+                tach_count = self._read_tach_pair(reg_high, _TACH_READING)
+            except I2CError as e:
+                raise EMC2305Error(f"Failed to read RPM for fan {channel}: {e}")
+
+        return self._tach_reading_to_rpm(tach_count, self._channel_edges[channel])
 
-                # Combine registers and apply 3-bit right shift to get actual count
-                # The combined 16-bit value has the count in bits 15:3
-                raw_tach = (tach_high << const.TACH_COUNT_HIGH_SHIFT) | tach_low
-                tach_count = raw_tach >> const.TACH_COUNT_LOW_SHIFT
+    def get_all_current_rpms(self) -> Dict[int, int]:
+        """
+        Get current measured RPM of all fans.
 
-                # Check for max TACH count - indicates no tach signal (fan stopped)
-                # EMC2305 returns 0x1FFF (or near max) when no pulses are detected
-                if tach_count >= const.TACH_COUNT_STOPPED_THRESHOLD:
-                    return 0
+        All TACH reading registers (0x3E-0x7F) are read in a single I2C
+        transaction instead of two reads per channel.
 
-                # Convert to RPM
-                config = self._fan_configs.get(channel, FanConfig())
-                rpm = self._tach_count_to_rpm(tach_count, config.edges)
+        Returns:
+            Dictionary mapping channel number to RPM (0 if fan is stalled)
 
-                # Filter noise - readings below threshold mean fan is stopped
-                if rpm < const.MIN_VALID_RPM_READING:
-                    return 0
+        Raises:
+            EMC2305Error: If I2C communication fails
 
-                return rpm
+        Example:
+            >>> rpms = fan_controller.get_all_current_rpms()
+            >>> print(f"Fan 3 speed: {rpms[3]} RPM")
+        """
+        self._ensure_configured()
+        first = const.FAN_REGS[0][const.FAN_REG_TACH_READING_HIGH]
+        last = const.FAN_REGS[-1][const.FAN_REG_TACH_READING_LOW]
 
+        with self._lock:
+            try:
+                data = self.i2c_bus.read_register_block(self.address, first, last - first + 1)
             except I2CError as e:
-                raise EMC2305Error(f"Failed to read RPM for fan {channel}: {e}")
+                raise EMC2305Error(f"Failed to read fan RPMs: {e}")
+
+        # Bind loop-invariant lookups to locals once for the per-channel decode
+        to_rpm = self._tach_reading_to_rpm
+        edges = self._channel_edges
+        mask = const.TACH_PAIR_MASK
+        shift = const.TACH_COUNT_LOW_SHIFT
+
+        rpms = {}
+        for channel, raw_tach in enumerate(_ALL_TACH_READINGS.unpack(bytes(data)), start=1):
+            rpms[channel] = to_rpm((raw_tach & mask) >> shift, edges[channel])
+
+        return rpms
 
     # =============================================================================
     # Public API - Fan Configuration
     # =============================================================================
 
-    def configure_fan(self, channel: int, config: FanConfig) -> None:
+    def configure_fan(self, channel: int, config: FanConfig, force: bool = False) -> None:
         """
         Configure a fan channel with custom settings.
 
+        Register writes are skipped when the configuration is identical to the
+        one last written to the channel.
+
         Args:
             channel: Fan channel number (1-5)
             config: Fan configuration
+            force: Rewrite the registers even if the configuration is unchanged
 
         Example:
             >>> config = FanConfig(
@@ -1286,15 +1760,23 @@ class EMC2305:
             ... )
             >>> fan_controller.configure_fan(1, config)
         """
+        self._ensure_configured()
         self._validate_channel(channel)
-        self._validate_fan_config(config)
         self._check_not_locked()
 
         with self._lock:
+            if not force and self._fan_config_unchanged(channel, config):
+                self._fan_configs[channel] = config
+                logger.debug("Fan %d configuration unchanged, skipping register writes", channel)
+                return
+            # Validated on construction, but fields may have changed since
+            config.validate()
             self._fan_configs[channel] = config
-            self._configure_fan_registers(channel, config)
+            with self.i2c_bus.transaction():
+                self._configure_fan_registers(channel, config)
+            self.i2c_bus.settle()
 
-        logger.info(f"Fan {channel} configured with custom settings")
+        logger.info("Fan %d configured with custom settings", channel)
 
     def set_control_mode(self, channel: int, mode: ControlMode) -> None:
         """
@@ -1307,16 +1789,21 @@ class EMC2305:
         Example:
             >>> fan_controller.set_control_mode(1, ControlMode.FSC)
         """
+        self._ensure_configured()
         self._validate_channel(channel)
         self._check_not_locked()
 
         with self._lock:
-            config = self._fan_configs.get(channel, FanConfig())
-            config.control_mode = mode
+            # A new config (validated on construction) is only published once
+            # written, so readers outside the lock never see a partial update
+            # and a failed write leaves the cached config matching the device
+            config = replace(self._fan_configs[channel], control_mode=mode)
+            if not self._fan_config_unchanged(channel, config):
+                with self.i2c_bus.transaction():
+                    self._configure_fan_registers(channel, config)
             self._fan_configs[channel] = config
-            self._configure_fan_registers(channel, config)
 
-        logger.info(f"Fan {channel} control mode set to {mode.value}")
+        logger.info("Fan %d control mode set to %s", channel, mode.value)
 
     # =============================================================================
     # Public API - Status and Monitoring
@@ -1337,65 +1824,215 @@ class EMC2305:
             >>> if status == FanStatus.STALLED:
             ...     print("Fan 1 is stalled!")
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
         with self._lock:
             try:
-                channel_bit = 1 << (channel - 1)
-
                 # Read all status registers in one optimized I2C transaction
-                _, stall_status, spin_status, drive_status = self._read_all_status_registers()
+                status_registers = self._read_all_status_registers()
+            except I2CError as e:
+                logger.error("Failed to read status for fan %d: %s", channel, e)
+                return FanStatus.UNKNOWN
 
-                # Check stall status
-                if stall_status & channel_bit:
-                    return FanStatus.STALLED
+        return self._decode_fan_status(channel, status_registers)
 
-                # Check spin failure
-                if spin_status & channel_bit:
-                    return FanStatus.SPIN_FAILURE
+    @staticmethod
+    def _decode_fan_status(
+        channel: int, status_registers: Optional[tuple[int, int, int, int]]
+    ) -> FanStatus:
+        """
+        Decode the status of one fan from the status register snapshot.
 
-                # Check drive failure (aging fan)
-                if drive_status & channel_bit:
-                    return FanStatus.DRIVE_FAILURE
+        Args:
+            channel: Fan channel number (1-5)
+            status_registers: Result of _read_all_status_registers(), or None if
+                the status could not be read
 
-                return FanStatus.OK
+        Returns:
+            FanStatus for the channel
+        """
+        if status_registers is None:
+            return FanStatus.UNKNOWN
 
-            except I2CError as e:
-                logger.error(f"Failed to read status for fan {channel}: {e}")
-                return FanStatus.UNKNOWN
+        shift = channel - 1
+        _, stall_status, spin_status, drive_status = status_registers
+
+        # Gather the channel's stall, spin and drive failure (aging fan) bits
+        faults = (
+            (stall_status >> shift & 1)
+            | (spin_status >> shift & 1) << 1
+            | (drive_status >> shift & 1) << 2
+        )
+        return _FAN_STATUS_BY_FAULTS[faults]
+
+    def read_status_block(self) -> StatusBlock:
+        """
+        Read all global status and PWM configuration registers in one transaction.
+
+        Reads the contiguous span 0x24-0x2B (Fan Status through PWM Output Config)
+        with a single block read instead of one read per register. Reading the
+        status registers clears latched fault conditions, as with any status read.
+
+        Returns:
+            StatusBlock with the raw register values
+
+        Raises:
+            EMC2305CommunicationError: If I2C communication fails
+
+        Example:
+            >>> status = fan_controller.read_status_block()
+            >>> if status.stall:
+            ...     print(f"Stalled fans mask: 0x{status.stall:02X}")
+        """
+        self._ensure_configured()
+        try:
+            with self._lock:
+                block = self.i2c_bus.read_block(
+                    self.address,
+                    const.REG_FAN_STATUS,
+                    const.REG_PWM_OUTPUT_CONFIG - const.REG_FAN_STATUS + 1,
+                )
+                # The read cleared the latched faults; keep them for status queries
+                self._status_cache = (block[0], block[1], block[2], block[3])
+                self._status_cache_time = time.monotonic()
+                self._note_watchdog_status(block[0])
+                self._int_enable = block[const.REG_FAN_INTERRUPT_ENABLE - const.REG_FAN_STATUS]
+        except I2CError as e:
+            raise EMC2305CommunicationError(f"Failed to read status registers: {e}")
+
+        def reg(register: int) -> int:
+            return block[register - const.REG_FAN_STATUS]
+
+        return StatusBlock(
+            fan_status=reg(const.REG_FAN_STATUS),
+            stall=reg(const.REG_FAN_STALL_STATUS),
+            spin=reg(const.REG_FAN_SPIN_STATUS),
+            drive_fail=reg(const.REG_DRIVE_FAIL_STATUS),
+            int_en=reg(const.REG_FAN_INTERRUPT_ENABLE),
+            pwm_pol=reg(const.REG_PWM_POLARITY_CONFIG),
+            pwm_out_cfg=reg(const.REG_PWM_OUTPUT_CONFIG),
+        )
 
     def get_all_fan_states(self) -> Dict[int, FanState]:
         """
         Get current state of all fan channels.
 
+        The register windows of all channels (0x30-0x7F) are read in one
+        transaction and the status registers once, instead of one window read
+        and status query per channel.
+
         Returns:
             Dictionary mapping channel number to FanState
 
+        Raises:
+            EMC2305Error: If I2C communication fails
+
         Example:
             >>> states = fan_controller.get_all_fan_states()
             >>> for channel, state in states.items():
             ...     print(f"Fan {channel}: {state.current_rpm} RPM, {state.status}")
         """
-        states = {}
-
-        for channel in range(1, const.NUM_FAN_CHANNELS + 1):
-            config = self._fan_configs.get(channel, FanConfig())
-
-            state = FanState(
-                channel=channel,
-                enabled=config.enabled,
-                control_mode=config.control_mode,
-                pwm_percent=self.get_pwm_duty_cycle(channel),
-                target_rpm=(
-                    self.get_target_rpm(channel) if config.control_mode == ControlMode.FSC else 0
-                ),
-                current_rpm=self.get_current_rpm(channel),
-                status=self.get_fan_status(channel),
+        self._ensure_configured()
+
+        with self._lock:
+            try:
+                data = bytes(
+                    self.i2c_bus.read_register_block(
+                        self.address,
+                        const.REG_FAN1_SETTING,
+                        const.NUM_FAN_CHANNELS * const.FAN_CHANNEL_OFFSET,
+                    )
+                )
+            except I2CError as e:
+                raise EMC2305Error(f"Failed to read fan states: {e}")
+            for channel, pwm_value in enumerate(data[:: const.FAN_CHANNEL_OFFSET], start=1):
+                self._record_pwm_setting(channel, pwm_value)
+
+            status_registers: Optional[tuple[int, int, int, int]]
+            try:
+                status_registers = self._read_all_status_registers()
+            except I2CError as e:
+                logger.error("Failed to read fan status: %s", e)
+                status_registers = None
+
+        return {
+            channel: self._decode_fan_state(
+                channel,
+                data,
+                (channel - 1) * const.FAN_CHANNEL_OFFSET,
+                self._decode_fan_status(channel, status_registers),
             )
+            for channel in range(1, const.NUM_FAN_CHANNELS + 1)
+        }
+
+    def get_fan_state(self, channel: int) -> FanState:
+        """
+        Get current state of a single fan channel.
+
+        PWM setting, TACH target and TACH reading are decoded from one block
+        read of the channel's register window instead of separate byte reads.
+
+        Args:
+            channel: Fan channel number (1-5)
 
-            states[channel] = state
+        Returns:
+            FanState for the channel
+
+        Raises:
+            EMC2305Error: If I2C communication fails
 
-        return states
+        Example:
+            >>> state = fan_controller.get_fan_state(1)
+            >>> print(f"Fan 1: {state.pwm_percent:.1f}% at {state.current_rpm} RPM")
+        """
+        self._ensure_configured()
+        self._validate_channel(channel)
+
+        with self._lock:
+            try:
+                block = self._read_fan_block(channel)
+            except I2CError as e:
+                raise EMC2305Error(f"Failed to read state for fan {channel}: {e}")
+            self._record_pwm_setting(channel, block[0])
+
+        return self._decode_fan_state(channel, block, 0, self.get_fan_status(channel))
+
+    def _decode_fan_state(
+        self, channel: int, data: bytes, offset: int, status: FanStatus
+    ) -> FanState:
+        """
+        Decode the state of one fan from its register window.
+
+        Args:
+            channel: Fan channel number (1-5)
+            data: Register values containing the channel window
+            offset: Index of the channel's REG_FANx_SETTING register in data
+            status: Decoded fault status of the channel
+
+        Returns:
+            FanState for the channel
+        """
+        config = self._fan_configs[channel]
+
+        target_rpm = 0
+        if config.control_mode is ControlMode.FSC:
+            (raw_target,) = _TACH_TARGET.unpack_from(data, offset + const.FAN_WINDOW_TACH_TARGET)
+            target_count = (raw_target & const.TACH_PAIR_MASK) >> const.TACH_COUNT_LOW_SHIFT
+            target_rpm = self._tach_count_to_rpm(target_count, self._channel_edges[channel])
+
+        (raw_reading,) = _TACH_READING.unpack_from(data, offset + const.FAN_WINDOW_TACH_READING)
+        reading_count = (raw_reading & const.TACH_PAIR_MASK) >> const.TACH_COUNT_LOW_SHIFT
+
+        return FanState(
+            channel=channel,
+            enabled=config.enabled,
+            control_mode=config.control_mode,
+            pwm_percent=const.PWM_TO_PCT[data[offset]],
+            target_rpm=target_rpm,
+            current_rpm=self._tach_reading_to_rpm(reading_count, self._channel_edges[channel]),
+            status=status,
+        )
 
     def get_product_features(self) -> ProductFeatures:
         """
@@ -1404,39 +2041,21 @@ class EMC2305:
         Returns hardware capabilities including number of fan channels,
         RPM control support, product ID, manufacturer ID, and revision.
 
+        These registers are read-only, so the ProductFeatures built during
+        device detection is returned without any I2C traffic. The same frozen
+        instance is returned on every call.
+
         Returns:
             ProductFeatures dataclass with device information
 
-        Raises:
-            EMC2305CommunicationError: If I2C communication fails
-
         Example:
             >>> features = fan_controller.get_product_features()
             >>> print(f"Device: EMC230{features.fan_channels}")
             >>> print(f"Product ID: 0x{features.product_id:02X}")
             >>> print(f"RPM Control: {features.rpm_control_supported}")
         """
-        try:
-            # Read Product Features register (0xFC)
-            features_reg = self.i2c_bus.read_byte(self.address, const.REG_PRODUCT_FEATURES)
-            fan_channels = features_reg & const.PRODUCT_FEATURES_FAN_COUNT_MASK
-            rpm_control = bool(features_reg & const.PRODUCT_FEATURES_RPM_CONTROL)
-
-            # Read identification registers
-            product_id = self.i2c_bus.read_byte(self.address, const.REG_PRODUCT_ID)
-            mfg_id = self.i2c_bus.read_byte(self.address, const.REG_MANUFACTURER_ID)
-            revision = self.i2c_bus.read_byte(self.address, const.REG_REVISION)
-
-            return ProductFeatures(
-                fan_channels=fan_channels,
-                rpm_control_supported=rpm_control,
-                product_id=product_id,
-                manufacturer_id=mfg_id,
-                revision=revision,
-            )
-
-        except I2CError as e:
-            raise EMC2305CommunicationError(f"Failed to read product features: {e}")
+        self._ensure_configured()
+        return self._product_features
 
     def check_watchdog(self) -> bool:
         """
@@ -1449,11 +2068,13 @@ class EMC2305:
             >>> if fan_controller.check_watchdog():
             ...     print("Watchdog timeout detected!")
         """
+        self._ensure_configured()
         try:
             status = self.i2c_bus.read_byte(self.address, const.REG_FAN_STATUS)
+            self._note_watchdog_status(status)
             return bool(status & const.FAN_STATUS_WATCH)
         except I2CError as e:
-            logger.error(f"Failed to check watchdog status: {e}")
+            logger.error("Failed to check watchdog status: %s", e)
             return False
 
     def reset_watchdog(self) -> None:
@@ -1461,17 +2082,51 @@ class EMC2305:
         Reset the watchdog timer by performing a dummy write.
 
         Call this periodically (within 4 seconds) to prevent watchdog timeout.
+        The reset is a single SMBus Send Byte that only sets the register
+        pointer, so no register contents are read or modified.
 
         Example:
             >>> fan_controller.reset_watchdog()
         """
+        self._ensure_configured()
         if self.enable_watchdog:
             try:
-                # Read configuration register (any read/write resets watchdog)
-                self.i2c_bus.read_byte(self.address, const.REG_CONFIGURATION)
+                # Any transfer resets the watchdog; Send Byte is the shortest one
+                self.i2c_bus.send_byte(self.address, const.REG_CONFIGURATION)
                 logger.debug("Watchdog timer reset")
             except I2CError as e:
-                logger.error(f"Failed to reset watchdog: {e}")
+                logger.error("Failed to reset watchdog: %s", e)
+
+    def service_watchdog(self) -> bool:
+        """
+        Reset the watchdog timer only when it is due.
+
+        Any I2C transfer to the device restarts the watchdog, so regular driver
+        calls already keep it alive. Call this from the application's main loop
+        instead of running a separate kicker thread; it only touches the bus if
+        no transfer reached the device within WATCHDOG_SERVICE_INTERVAL_SEC.
+
+        Returns:
+            True if a watchdog reset was issued
+
+        Example:
+            >>> while running:
+            ...     update_fans(fan_controller)
+            ...     fan_controller.service_watchdog()
+        """
+        self._ensure_configured()
+        if not self.enable_watchdog:
+            return False
+
+        last_transfer = self.i2c_bus.last_transfer.get(self.address)
+        if (
+            last_transfer is not None
+            and time.monotonic() - last_transfer < const.WATCHDOG_SERVICE_INTERVAL_SEC
+        ):
+            return False
+
+        self.reset_watchdog()
+        return True
 
     # =============================================================================
     # Public API - Software Lock
@@ -1494,6 +2149,7 @@ class EMC2305:
             >>> fan_controller.configure_fan(1, my_config)
             >>> fan_controller.lock_configuration()  # Prevent changes
         """
+        self._ensure_configured()
         try:
             # Write SOFTWARE_LOCK_LOCKED_VALUE to lock register (irreversible until reset)
             self.i2c_bus.write_byte(
@@ -1515,25 +2171,28 @@ class EMC2305:
             >>> if fan_controller.is_configuration_locked():
             ...     print("Configuration is protected")
         """
+        self._ensure_configured()
         try:
             # Read lock register - SOFTWARE_LOCK_LOCKED_VALUE means locked
             lock_status = self.i2c_bus.read_byte(self.address, const.REG_SOFTWARE_LOCK)
             self._is_locked = lock_status == const.SOFTWARE_LOCK_LOCKED_VALUE
             return self._is_locked
         except I2CError as e:
-            logger.error(f"Failed to read lock status: {e}")
+            logger.error("Failed to read lock status: %s", e)
             return self._is_locked  # Return cached status on error
 
     def _check_not_locked(self) -> None:
         """
         Internal method to verify configuration is not locked.
 
-        Always reads from hardware register to avoid race conditions.
+        The lock only clears on hardware reset, so once the device is known to
+        be locked no register read is needed. While unlocked, the register is
+        read every time in case another process has locked it.
 
         Raises:
             EMC2305ConfigurationLockedError: If configuration is locked
         """
-        if self.is_configuration_locked():
+        if self._is_locked or self.is_configuration_locked():
             raise EMC2305ConfigurationLockedError(
                 "Configuration registers are locked. Hardware reset required to unlock. "
                 "This prevents accidental changes in production environments."
@@ -1550,6 +2209,9 @@ class EMC2305:
         When enabled, fan faults (stall, spin failure, drive failure) will
         assert the ALERT# pin (active low) and trigger SMBus Alert Response.
 
+        The new enable mask is derived from the last value written, so the
+        update is a single register write.
+
         Args:
             channel: Fan channel number (1-5)
             enabled: True to enable alerts, False to disable
@@ -1562,28 +2224,58 @@ class EMC2305:
             >>> fan_controller.configure_fan_alerts(1, True)  # Enable alerts for fan 1
             >>> fan_controller.configure_fan_alerts(2, False) # Disable alerts for fan 2
         """
+        self._ensure_configured()
         self._validate_channel(channel)
 
+        channel_bit = const.FAN_CHANNEL_BITS[channel - 1]
+
         try:
             with self._lock:
-                # Read current interrupt enable register
-                int_enable = self.i2c_bus.read_byte(self.address, const.REG_FAN_INTERRUPT_ENABLE)
-
                 # Modify the bit for this channel
-                channel_bit = 1 << (channel - 1)
                 if enabled:
-                    int_enable |= channel_bit
+                    int_enable = self._int_enable | channel_bit
                 else:
-                    int_enable &= ~channel_bit
+                    int_enable = self._int_enable & ~channel_bit
 
-                # Write back
                 self.i2c_bus.write_byte(self.address, const.REG_FAN_INTERRUPT_ENABLE, int_enable)
+                self._int_enable = int_enable
 
-                logger.debug(f"Fan {channel} alerts {'enabled' if enabled else 'disabled'}")
+                logger.debug("Fan %d alerts %s", channel, "enabled" if enabled else "disabled")
 
         except I2CError as e:
             raise EMC2305CommunicationError(f"Failed to configure fan alerts: {e}")
 
+    def set_fan_alerts_mask(self, mask: int) -> None:
+        """
+        Enable ALERT# pin assertion for a set of fans in one register write.
+
+        Args:
+            mask: Bitmap of fans with alerts enabled (bit 0 = fan 1, ..., bit 4 = fan 5)
+
+        Raises:
+            EMC2305ValidationError: If mask has bits outside the fan channels
+            EMC2305CommunicationError: If I2C communication fails
+
+        Example:
+            >>> fan_controller.set_fan_alerts_mask(0x1F)  # Enable alerts for all fans
+            >>> fan_controller.set_fan_alerts_mask(0b00011)  # Only fans 1 and 2
+        """
+        self._ensure_configured()
+        if not isinstance(mask, int) or not 0 <= mask <= const.FAN_INTERRUPT_ENABLE_ALL_FANS:
+            raise EMC2305ValidationError(
+                f"Alert mask must be 0x00-0x{const.FAN_INTERRUPT_ENABLE_ALL_FANS:02X}, got {mask!r}"
+            )
+
+        try:
+            with self._lock:
+                self.i2c_bus.write_byte(self.address, const.REG_FAN_INTERRUPT_ENABLE, mask)
+                self._int_enable = mask
+
+                logger.debug("Fan alert mask set to 0x%02X", mask)
+
+        except I2CError as e:
+            raise EMC2305CommunicationError(f"Failed to set fan alert mask: {e}")
+
     def get_alert_status(self) -> Dict[int, bool]:
         """
         Get alert status for all fan channels.
@@ -1603,29 +2295,48 @@ class EMC2305:
             ...     if has_alert:
             ...         print(f"Fan {channel} has an alert!")
         """
+        self._ensure_configured()
         try:
             with self._lock:
                 # Read all status registers in one optimized I2C transaction
                 _, stall_status, spin_status, drive_fail_status = self._read_all_status_registers()
+        except I2CError as e:
+            raise EMC2305CommunicationError(f"Failed to read alert status: {e}")
 
-                # Build alert status for each channel
-                alerts = {}
-                for channel in range(1, const.NUM_FAN_CHANNELS + 1):
-                    channel_bit = 1 << (channel - 1)
+        # Channel has alert if any fault condition is active
+        fault_bits = (
+            stall_status | spin_status | drive_fail_status
+        ) & const.FAN_STATUS_CHANNEL_MASK
+        return dict(_ALERTS_BY_FAULTS[fault_bits])
 
-                    # Channel has alert if any fault condition is active
-                    has_fault = (
-                        (stall_status & channel_bit)
-                        or (spin_status & channel_bit)
-                        or (drive_fail_status & channel_bit)
-                    )
+    def get_faulted_fans(self) -> tuple[int, ...]:
+        """
+        Get the fan channels that currently report a fault.
 
-                    alerts[channel] = bool(has_fault)
+        A channel is faulted if its stall, spin-up or drive fail status bit is
+        set. The status registers are read in one transaction.
 
-                return alerts
+        Returns:
+            Tuple of faulted channel numbers in ascending order (empty if none)
 
+        Raises:
+            EMC2305CommunicationError: If I2C communication fails
+
+        Example:
+            >>> for channel in fan_controller.get_faulted_fans():
+            ...     print(f"Fan {channel}: {fan_controller.get_fan_status(channel)}")
+        """
+        self._ensure_configured()
+        try:
+            with self._lock:
+                _, stall_status, spin_status, drive_fail_status = self._read_all_status_registers()
         except I2CError as e:
-            raise EMC2305CommunicationError(f"Failed to read alert status: {e}")
+            raise EMC2305CommunicationError(f"Failed to read fault status: {e}")
+
+        fault_bits = (
+            stall_status | spin_status | drive_fail_status
+        ) & const.FAN_STATUS_CHANNEL_MASK
+        return const.FAULTED_CHANNELS[fault_bits]
 
     def is_alert_active(self) -> bool:
         """
@@ -1644,6 +2355,7 @@ class EMC2305:
             ...     alerts = fan_controller.get_alert_status()
             ...     print(f"Active alerts: {alerts}")
         """
+        self._ensure_configured()
         try:
             with self._lock:
                 # Check if any fan has an active alert
@@ -1677,13 +2389,11 @@ class EMC2305:
             >>> fan_controller.clear_alert_status()  # Clear all alerts
             >>> # ALERT# pin will de-assert if no active faults remain
         """
+        self._ensure_configured()
         try:
             with self._lock:
                 # Reading status registers clears them (per EMC2305 datasheet)
-                self.i2c_bus.read_byte(self.address, const.REG_FAN_STATUS)
-                self.i2c_bus.read_byte(self.address, const.REG_FAN_STALL_STATUS)
-                self.i2c_bus.read_byte(self.address, const.REG_FAN_SPIN_STATUS)
-                self.i2c_bus.read_byte(self.address, const.REG_DRIVE_FAIL_STATUS)
+                self._clear_fault_status()
 
                 logger.debug("Alert status cleared for all fans")
 
@@ -1698,18 +2408,32 @@ class EMC2305:
         """
         Close the fan controller and release resources.
 
-        Sets all fans to safe state before closing.
+        Sets all fans to safe state before closing. A deferred controller that
+        was never used is left untouched.
         """
         logger.info("Closing EMC2305 fan controller")
 
-        # Set all fans to minimum safe speed
-        for channel in range(1, const.NUM_FAN_CHANNELS + 1):
+        if not self._configured:
+            return
+
+        # Set all fans to minimum safe speed in one batched write
+        channels = range(1, const.NUM_FAN_CHANNELS + 1)
+        try:
+            self.set_pwm_duty_cycles(
+                dict.fromkeys(channels, const.SAFE_SHUTDOWN_PWM_PERCENT), force=True
+            )
+            return
+        except Exception as e:
+            logger.error("Failed to set fans to safe state in one batch: %s", e)
+
+        # Fall back to one write per fan so a single failure cannot skip the rest
+        for channel in channels:
             try:
                 self.set_pwm_duty_cycle(
-                    channel, const.SAFE_SHUTDOWN_PWM_PERCENT
+                    channel, const.SAFE_SHUTDOWN_PWM_PERCENT, force=True
                 )  # Safe PWM for controlled shutdown
             except Exception as e:
-                logger.error(f"Failed to set fan {channel} to safe state: {e}")
+                logger.error("Failed to set fan %d to safe state: %s", channel, e)
 
     def __enter__(self) -> "EMC2305":
         """Context manager entry."""
@@ -1724,8 +2448,11 @@ class EMC2305:
 
     def __repr__(self) -> str:
         """String representation."""
+        if not self._configured:
+            return f"EMC2305(address=0x{self.address:02X}, unconfigured)"
+
         return (
             f"EMC2305(address=0x{self.address:02X}, "
-            f"product_id=0x{self.product_id:02X}, "
-            f"revision=0x{self.revision:02X})"
+            f"product_id=0x{self._product_id:02X}, "
+            f"revision=0x{self._revision:02X})"
         )
@@ -7,33 +7,55 @@ I2C Communication Layer
 Provides low-level I2C communication with cross-process locking support.
 """
 
+import ctypes
 import logging
+import os
+import threading
 import time
+import weakref
+from array import array
+from contextlib import contextmanager
+from fcntl import LOCK_EX, LOCK_NB, LOCK_UN, flock, ioctl
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Sequence
 
 try:
     import smbus2
+    from smbus2 import i2c_msg
+    from smbus2.smbus2 import i2c_rdwr_ioctl_data
 except ImportError:
     smbus2 = None
-
-from filelock import FileLock, Timeout
+    i2c_msg = None
+    i2c_rdwr_ioctl_data = None
 
 from emc2305.driver.constants import (
     DEFAULT_I2C_BUS,
     DEFAULT_I2C_LOCK_PATH,
+    DEFAULT_I2C_LOCK_POLL_INTERVAL,
     DEFAULT_I2C_LOCK_TIMEOUT,
+    I2C_ADAPTER_CLOCK_FREQUENCY_PATH,
+    I2C_M_RD,
+    I2C_RDWR,
+    I2C_RDWR_MAX_MSGS,
+    INIT_DELAY_MS,
     MAX_I2C_ADDRESS,
     MAX_REGISTER_ADDRESS,
     MIN_I2C_ADDRESS,
     MIN_REGISTER_ADDRESS,
-    READ_DELAY_MS,
+    POLL_INTERVAL_MAX_MS,
+    POLL_INTERVAL_MIN_MS,
     SMBUS_BLOCK_MAX_LENGTH,
-    WRITE_DELAY_MS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Bits that must be clear in a valid address, register or byte value. All three
+# ranges start at 0, so one mask test replaces the range check on hot paths;
+# the _validate_* helpers only run to report an invalid value.
+_INVALID_ADDRESS_BITS = ~MAX_I2C_ADDRESS
+_INVALID_REGISTER_BITS = ~MAX_REGISTER_ADDRESS
+_INVALID_BYTE_BITS = ~0xFF
+
 
 class I2CError(Exception):
     """Base exception for I2C communication errors."""
@@ -47,17 +69,223 @@ class I2CBusLockError(I2CError):
     pass
 
 
+class _LockFile:
+    """
+    Open lock file and in-process lock state, shared by all buses on one lock path.
+
+    flock() only excludes other open file descriptions, so threads of this
+    process are serialized by the RLock first; the file lock is taken by the
+    outermost acquire and released by the matching release. Sharing one
+    instance per path lets a thread that holds the lock through one I2CBus
+    use another I2CBus on the same bus number instead of deadlocking on its
+    own process's file lock.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.fd: Optional[int] = self._open()
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.users = 0
+
+    def _open(self) -> int:
+        """Open the lock file; the descriptor is not inherited across exec()."""
+        return os.open(self.path, os.O_RDONLY | os.O_CREAT | os.O_CLOEXEC, 0o666)
+
+    def reopen(self) -> None:
+        """Reopen the descriptor on the file currently at the lock path."""
+        self.close()
+        self.fd = self._open()
+
+    def reset_after_fork(self) -> None:
+        """
+        Give a forked child its own open file description and an unheld lock state.
+
+        The inherited descriptor shares the parent's open file description,
+        which flock() does not exclude, and depth/thread_lock describe the
+        parent's holders. Closing the child's copy leaves the parent's lock intact.
+        """
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        if self.fd is not None:
+            self.reopen()
+
+    def holds_current_file(self) -> bool:
+        """Whether the open descriptor still refers to the file at the lock path."""
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        held = os.fstat(self.fd)
+        return (held.st_dev, held.st_ino) == (current.st_dev, current.st_ino)
+
+    def close(self) -> None:
+        """Close the lock file descriptor (also drops any held file lock)."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+# Lock files by resolved path, shared by every I2CBus of this process using that path
+_LOCK_FILES: dict[str, _LockFile] = {}
+_LOCK_FILES_GUARD = threading.Lock()
+
+# Open buses, so a forked child can reset their per-process state
+_BUSES: "weakref.WeakSet[I2CBus]" = weakref.WeakSet()
+
+
+def _reset_after_fork() -> None:
+    """
+    Reset inherited lock state in a forked child.
+
+    Only the forking thread survives fork(), so any lock another parent
+    thread held is recreated unheld. Every lock file gets a descriptor of its
+    own, so the child contends for the bus with the parent like any other
+    process; buses of the child keep sharing one lock file per path.
+    """
+    global _LOCK_FILES_GUARD
+    _LOCK_FILES_GUARD = threading.Lock()
+    for lock_file in _LOCK_FILES.values():
+        lock_file.reset_after_fork()
+    for bus in _BUSES:
+        bus._reset_after_fork()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class _BusLock:
+    """
+    Cross-process bus lock: flock() on a lock file held open for the bus lifetime.
+
+    A contended flock() is retried every poll_interval seconds until the
+    timeout (a negative timeout waits forever). The lock file is the same
+    one other flock()-based lockers (such as filelock) use; if one of them
+    removes it, the descriptor is reopened on the new file before the lock
+    counts as held. Buses on the same lock path share one _LockFile.
+    """
+
+    def __init__(self, path: Path, timeout: float, poll_interval: float):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        # Symlinked lock directories (/var/lock -> /run/lock) must share one entry
+        self._key = os.path.realpath(path)
+        with _LOCK_FILES_GUARD:
+            lock_file = _LOCK_FILES.get(self._key)
+            if lock_file is None:
+                lock_file = _LOCK_FILES[self._key] = _LockFile(path)
+            lock_file.users += 1
+        self._file: Optional[_LockFile] = lock_file
+
+    def acquire(self) -> None:
+        """
+        Acquire the lock, reentrantly for the owning thread.
+
+        Raises:
+            I2CError: If the bus has been closed
+            I2CBusLockError: If the lock cannot be acquired within the timeout
+        """
+        lock_file = self._file
+        if lock_file is None:
+            raise I2CError("I2C bus is closed")
+        deadline = time.monotonic() + self.timeout
+        if not lock_file.thread_lock.acquire(timeout=max(self.timeout, -1)):
+            raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.timeout}s")
+        if lock_file.depth == 0:
+            try:
+                self._flock_until(lock_file, deadline)
+            except BaseException:
+                lock_file.thread_lock.release()
+                raise
+        lock_file.depth += 1
+
+    def _flock_until(self, lock_file: _LockFile, deadline: float) -> None:
+        """Take the file lock, polling while another process holds it."""
+        while True:
+            try:
+                flock(lock_file.fd, LOCK_EX | LOCK_NB)
+                if lock_file.holds_current_file():
+                    return
+                # Another locker removed or replaced the file; lock the new one
+                flock(lock_file.fd, LOCK_UN)
+                lock_file.reopen()
+                continue
+            except BlockingIOError:
+                pass
+            wait = self.poll_interval
+            if self.timeout >= 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.timeout}s")
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def release(self) -> None:
+        """Release one level of the lock; the file lock is dropped at the outermost level."""
+        lock_file = self._file
+        if lock_file is None:
+            raise I2CError("I2C bus is closed")
+        if lock_file.depth == 0:
+            # Acquired by the parent before fork(); the child never held it
+            return
+        lock_file.depth -= 1
+        if lock_file.depth == 0:
+            flock(lock_file.fd, LOCK_UN)
+        lock_file.thread_lock.release()
+
+    def close(self) -> None:
+        """Detach from the shared lock file, closing it when no bus uses it anymore."""
+        with _LOCK_FILES_GUARD:
+            lock_file, self._file = self._file, None
+            if lock_file is None:
+                return
+            lock_file.users -= 1
+            if lock_file.users == 0:
+                del _LOCK_FILES[self._key]
+                lock_file.close()
+
+    def __enter__(self) -> "_BusLock":
+        """Context manager entry."""
+        self.acquire()
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[Any]
+    ) -> None:
+        """Context manager exit."""
+        self.release()
+
+
+class _TransactionState(threading.local):
+    """Per-thread flag set while the thread holds the bus lock in transaction()."""
+
+    active = False
+
+
 class I2CBus:
     """
     I2C bus communication with cross-process locking.
 
     Provides thread-safe and process-safe I2C operations using file-based locks.
 
+    Register reads are issued as a single combined I2C transaction (register
+    pointer write followed by a repeated START and the data read) via the
+    ``I2C_RDWR`` ioctl when the adapter supports plain I2C messages. The ioctl
+    request is preallocated once and issued directly on the open bus file
+    descriptor. Adapters that only implement SMBus transfers fall back to
+    SMBus read commands.
+
+    The bus device node is opened once here and held until close(); no
+    transfer reopens it, so each operation costs only its ioctl.
+
     Args:
         bus_number: I2C bus number (default: 0)
         lock_enabled: Enable cross-process locking (default: True)
         lock_timeout: Lock acquisition timeout in seconds (default: 5.0)
         lock_path: Directory for lock files (default: /var/lock)
+        lock_poll_interval: Seconds between attempts while another process
+            holds the lock (default: 0.001)
 
     Example:
         >>> bus = I2CBus(bus_number=0)
@@ -71,6 +299,7 @@ class I2CBus:
         lock_enabled: bool = True,
         lock_timeout: float = DEFAULT_I2C_LOCK_TIMEOUT,
         lock_path: str = DEFAULT_I2C_LOCK_PATH,
+        lock_poll_interval: float = DEFAULT_I2C_LOCK_POLL_INTERVAL,
     ):
         if smbus2 is None:
             raise ImportError(
@@ -80,6 +309,7 @@ class I2CBus:
         self.bus_number = bus_number
         self.lock_enabled = lock_enabled
         self.lock_timeout = lock_timeout
+        self.lock_poll_interval = lock_poll_interval
 
         # Initialize I2C bus
         try:
@@ -87,13 +317,95 @@ class I2CBus:
         except Exception as e:
             raise I2CError(f"Failed to open I2C bus {bus_number}: {e}")
 
-        # Initialize lock if enabled
-        self.lock: Optional[FileLock] = None
+        # Combined write-then-read transfers need I2C_FUNC_I2C on the adapter
+        self.rdwr_supported = bool(self.bus.funcs & smbus2.I2cFunc.I2C)
+        logger.debug(
+            "I2C bus %d combined transfers %s",
+            bus_number,
+            "enabled" if self.rdwr_supported else "unavailable, using SMBus",
+        )
+
+        # Preallocated I2C_RDWR request (pointer write + read) reused for every
+        # register read, so the hot path only patches address/register/length
+        # and issues the ioctl on the already open bus fd
+        if self.rdwr_supported:
+            self._rdwr_lock = threading.Lock()
+            self._rdwr_register = ctypes.create_string_buffer(1)
+            # The kernel fills the array in place; results are sliced out through
+            # a memoryview without copying the whole buffer
+            self._rdwr_rx = array("B", bytes(MAX_REGISTER_ADDRESS + 1))
+            self._rdwr_rx_view = memoryview(self._rdwr_rx)
+            self._rdwr_msgs = (i2c_msg * 2)()
+            self._rdwr_msgs[0].len = 1
+            self._rdwr_msgs[0].buf = ctypes.cast(self._rdwr_register, ctypes.POINTER(ctypes.c_char))
+            self._rdwr_msgs[1].flags = I2C_M_RD
+            self._rdwr_msgs[1].buf = ctypes.cast(
+                (ctypes.c_char * len(self._rdwr_rx)).from_buffer(self._rdwr_rx),
+                ctypes.POINTER(ctypes.c_char),
+            )
+            self._rdwr_data = i2c_rdwr_ioctl_data(msgs=self._rdwr_msgs, nmsgs=2)
+
+            # Preallocated write_registers() request: one 2-byte (register,
+            # value) message per slot, filled in place for each batch
+            self._wr_pairs = (ctypes.c_uint8 * (2 * I2C_RDWR_MAX_MSGS))()
+            self._wr_msgs = (i2c_msg * I2C_RDWR_MAX_MSGS)()
+            pairs_address = ctypes.addressof(self._wr_pairs)
+            for index, msg in enumerate(self._wr_msgs):
+                msg.len = 2
+                msg.buf = ctypes.cast(pairs_address + 2 * index, ctypes.POINTER(ctypes.c_char))
+            self._wr_data = i2c_rdwr_ioctl_data(msgs=self._wr_msgs, nmsgs=0)
+
+        # Monotonic time of the last successful transfer to each device address
+        self.last_transfer: dict[int, float] = {}
+
+        # (address, register) -> (value, monotonic read time) for read_byte_cached()
+        self._register_cache: dict[tuple[int, int], tuple[int, float]] = {}
+
+        # SCL frequency configured for the adapter, if the platform exposes it.
+        # i2c-dev cannot change it; it is set by the device tree or driver.
+        self.bus_speed_hz = self._read_bus_speed()
+        if self.bus_speed_hz is not None:
+            logger.debug("I2C bus %d clock: %d Hz", bus_number, self.bus_speed_hz)
+
+        # Initialize lock if enabled; operations test `self.lock is not None`
+        self.lock: Optional[_BusLock] = None
         if self.lock_enabled:
             lock_file = Path(lock_path) / f"i2c-{bus_number}.lock"
             lock_file.parent.mkdir(parents=True, exist_ok=True)
-            self.lock = FileLock(str(lock_file), timeout=lock_timeout)
-            logger.debug(f"I2C bus {bus_number} locking enabled: {lock_file}")
+            try:
+                self.lock = _BusLock(lock_file, lock_timeout, lock_poll_interval)
+            except OSError as e:
+                self.bus.close()
+                raise I2CError(f"Failed to open I2C bus lock file {lock_file}: {e}")
+            logger.debug("I2C bus %d locking enabled: %s", bus_number, lock_file)
+
+        # Operations inside transaction() skip their own lock round trip
+        self._transaction = _TransactionState()
+
+        _BUSES.add(self)
+
+    def _reset_after_fork(self) -> None:
+        """Drop transaction and transfer lock state inherited from the parent process."""
+        self._transaction = _TransactionState()
+        if self.rdwr_supported:
+            self._rdwr_lock = threading.Lock()
+
+    def _read_bus_speed(self) -> Optional[int]:
+        """
+        Read the adapter's SCL frequency from its device tree node.
+
+        Returns:
+            Bus speed in Hz, or None if the adapter has no device tree node
+            (e.g. ACPI or USB adapters)
+        """
+        path = Path(I2C_ADAPTER_CLOCK_FREQUENCY_PATH.format(bus=self.bus_number))
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        if len(raw) != 4:
+            return None
+        return int.from_bytes(raw, "big")
 
     def _validate_address(self, address: int) -> None:
         """
@@ -143,6 +455,23 @@ class I2CBus:
                 f"(must be 1-{SMBUS_BLOCK_MAX_LENGTH} bytes for SMBus)"
             )
 
+    def _validate_register_span(self, register: int, length: int) -> None:
+        """
+        Validate a multi-register read span.
+
+        Args:
+            register: Starting register address
+            length: Number of consecutive registers
+
+        Raises:
+            I2CError: If the span is empty or runs past the last register
+        """
+        if not 1 <= length <= MAX_REGISTER_ADDRESS - register + 1:
+            raise I2CError(
+                f"Invalid register span: {length} bytes from 0x{register:02X} "
+                f"(must stay within 0x{MIN_REGISTER_ADDRESS:02X}-0x{MAX_REGISTER_ADDRESS:02X})"
+            )
+
     def _validate_byte_value(self, value: int) -> None:
         """
         Validate byte value.
@@ -156,6 +485,52 @@ class I2CBus:
         if not 0 <= value <= 0xFF:
             raise I2CError(f"Invalid byte value: 0x{value:X} (must be 0x00-0xFF)")
 
+    def _validate_byte_values(self, data: Sequence[int]) -> None:
+        """
+        Validate a block of byte values in a single pass.
+
+        Args:
+            data: Byte values to validate
+
+        Raises:
+            I2CError: If any value is out of byte range
+        """
+        bad = next((value for value in data if not 0 <= value <= 0xFF), None)
+        if bad is not None:
+            raise I2CError(f"Invalid byte value: 0x{bad:X} (must be 0x00-0xFF)")
+
+    @contextmanager
+    def transaction(self) -> Iterator["I2CBus"]:
+        """
+        Hold the bus lock across a sequence of operations.
+
+        Read/write calls made by the same thread inside the block skip the
+        file lock entirely instead of re-entering it for every register.
+        Nested transactions reuse the outer one.
+
+        Yields:
+            This I2CBus instance
+
+        Raises:
+            I2CBusLockError: If lock cannot be acquired
+
+        Example:
+            >>> with bus.transaction():
+            ...     bus.write_byte(0x61, 0x30, 0x80)
+            ...     bus.write_byte(0x61, 0x40, 0x80)
+        """
+        if self.lock is None or self._transaction.active:
+            yield self
+            return
+
+        self.lock.acquire()
+        self._transaction.active = True
+        try:
+            yield self
+        finally:
+            self._transaction.active = False
+            self.lock.release()
+
     def read_byte(self, address: int, register: int) -> int:
         """
         Read a single byte from a register.
@@ -171,28 +546,200 @@ class I2CBus:
             I2CError: If read operation fails or parameters are invalid
             I2CBusLockError: If lock cannot be acquired
         """
-        self._validate_address(address)
-        self._validate_register(register)
+        if address & _INVALID_ADDRESS_BITS or register & _INVALID_REGISTER_BITS:
+            self._validate_address(address)
+            self._validate_register(register)
 
-        if self.lock_enabled and self.lock:
-            try:
-                with self.lock:
-                    return self._read_byte_unlocked(address, register)
-            except Timeout:
-                raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.lock_timeout}s")
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                return self._read_byte_unlocked(address, register)
         else:
             return self._read_byte_unlocked(address, register)
 
+    def _read_register_data(self, address: int, register: int, length: int) -> list[int]:
+        """
+        Read consecutive registers without locking, delays or error wrapping.
+
+        Uses one combined I2C_RDWR transaction (pointer write + repeated START +
+        read) when available, otherwise SMBus byte/block reads.
+        """
+        if self.rdwr_supported:
+            msgs = self._rdwr_msgs
+            with self._rdwr_lock:
+                msgs[0].addr = msgs[1].addr = address
+                msgs[1].len = length
+                self._rdwr_register[0] = register
+                ioctl(self.bus.fd, I2C_RDWR, self._rdwr_data)
+                data = self._rdwr_rx_view[:length].tolist()
+        elif length == 1:
+            data = [self.bus.read_byte_data(address, register)]
+        else:
+            data = []
+            for offset in range(0, length, SMBUS_BLOCK_MAX_LENGTH):
+                chunk = min(SMBUS_BLOCK_MAX_LENGTH, length - offset)
+                data.extend(self.bus.read_i2c_block_data(address, register + offset, chunk))
+
+        self.last_transfer[address] = time.monotonic()
+        return data
+
+    def read_register_block(self, address: int, register: int, length: int) -> list[int]:
+        """
+        Read consecutive registers in a single write-then-read transaction.
+
+        Unlike read_block(), the length is not limited to the SMBus block size;
+        on SMBus-only adapters the read is split into SMBus-sized chunks.
+
+        Args:
+            address: I2C device address (7-bit)
+            register: Starting register address
+            length: Number of bytes to read
+
+        Returns:
+            List of byte values read from registers
+
+        Raises:
+            I2CError: If read operation fails or parameters are invalid
+            I2CBusLockError: If lock cannot be acquired
+
+        Example:
+            >>> status = bus.read_register_block(0x4D, 0x24, 4)
+        """
+        if address & _INVALID_ADDRESS_BITS or register & _INVALID_REGISTER_BITS:
+            self._validate_address(address)
+            self._validate_register(register)
+        self._validate_register_span(register, length)
+
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                return self._read_register_block_unlocked(address, register, length)
+        else:
+            return self._read_register_block_unlocked(address, register, length)
+
+    def _read_register_block_unlocked(self, address: int, register: int, length: int) -> list[int]:
+        """Internal register block read operation without locking."""
+        try:
+            data = self._read_register_data(address, register, length)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "I2C read registers: addr=0x%02X reg=0x%02X len=%d -> %s",
+                    address,
+                    register,
+                    length,
+                    [hex(b) for b in data],
+                )
+            return data
+        except Exception as e:
+            raise I2CError(
+                f"I2C register read failed: addr=0x{address:02X} reg=0x{register:02X}: {e}"
+            )
+
     def _read_byte_unlocked(self, address: int, register: int) -> int:
         """Internal read operation without locking."""
         try:
-            time.sleep(READ_DELAY_MS / 1000.0)
-            value = self.bus.read_byte_data(address, register)
-            logger.debug(f"I2C read: addr=0x{address:02X} reg=0x{register:02X} -> 0x{value:02X}")
+            value = self._read_register_data(address, register, 1)[0]
+            logger.debug("I2C read: addr=0x%02X reg=0x%02X -> 0x%02X", address, register, value)
             return value
         except Exception as e:
             raise I2CError(f"I2C read failed: addr=0x{address:02X} reg=0x{register:02X}: {e}")
 
+    def read_byte_cached(self, address: int, register: int, max_age: float) -> int:
+        """
+        Read a register, reusing the value read within the last max_age seconds.
+
+        Meant for registers that only change when written (configuration,
+        limits), so repeated sanity-check reads cost no bus traffic. Every
+        write through this bus drops the cached values of the registers it
+        covers; call clear_register_cache() after changing the device by other
+        means.
+
+        Args:
+            address: I2C device address (7-bit)
+            register: Register address
+            max_age: Maximum age of a cached value in seconds
+
+        Returns:
+            Byte value of the register
+
+        Raises:
+            I2CError: If read operation fails or parameters are invalid
+            I2CBusLockError: If lock cannot be acquired
+
+        Example:
+            >>> config = bus.read_byte_cached(0x4D, 0x20, max_age=1.0)
+        """
+        entry = self._register_cache.get((address, register))
+        if entry is not None and time.monotonic() - entry[1] < max_age:
+            return entry[0]
+
+        if address & _INVALID_ADDRESS_BITS or register & _INVALID_REGISTER_BITS:
+            self._validate_address(address)
+            self._validate_register(register)
+
+        # Read and store under the lock so a concurrent write cannot be cached over
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                return self._read_byte_cached_unlocked(address, register)
+        else:
+            return self._read_byte_cached_unlocked(address, register)
+
+    def _read_byte_cached_unlocked(self, address: int, register: int) -> int:
+        """Internal read operation that refreshes the register cache, without locking."""
+        value = self._read_byte_unlocked(address, register)
+        self._register_cache[(address, register)] = (value, time.monotonic())
+        return value
+
+    def clear_register_cache(self) -> None:
+        """Drop all values cached by read_byte_cached()."""
+        self._register_cache.clear()
+
+    def _invalidate_cached(self, address: int, register: int, length: int = 1) -> None:
+        """Drop cached values of the registers a write covers."""
+        cache = self._register_cache
+        if cache:
+            for offset in range(length):
+                cache.pop((address, register + offset), None)
+
+    def poll_until(self, address: int, register: int, mask: int, value: int, timeout: float) -> int:
+        """
+        Poll a register until its masked value matches.
+
+        The wait between reads starts at POLL_INTERVAL_MIN_MS and doubles up to
+        POLL_INTERVAL_MAX_MS, bounded by a monotonic deadline. The bus lock is
+        only held for each read, not while waiting.
+
+        Args:
+            address: I2C device address (7-bit)
+            register: Register address
+            mask: Bits of the register to compare
+            value: Expected value of the masked bits
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            Register value that matched
+
+        Raises:
+            I2CError: If a read fails or the value does not match within timeout
+            I2CBusLockError: If lock cannot be acquired
+
+        Example:
+            >>> bus.poll_until(0x4D, 0x25, 0x01, 0x00, timeout=0.5)  # Fan 1 not stalled
+        """
+        deadline = time.monotonic() + timeout
+        interval = POLL_INTERVAL_MIN_MS / 1000.0
+        while True:
+            current = self.read_byte(address, register)
+            if current & mask == value:
+                return current
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise I2CError(
+                    f"I2C poll timed out: addr=0x{address:02X} reg=0x{register:02X} "
+                    f"(0x{current:02X} & 0x{mask:02X} != 0x{value:02X} after {timeout}s)"
+                )
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, POLL_INTERVAL_MAX_MS / 1000.0)
+
     def write_byte(self, address: int, register: int, value: int) -> None:
         """
         Write a single byte to a register.
@@ -206,28 +753,94 @@ class I2CBus:
             I2CError: If write operation fails or parameters are invalid
             I2CBusLockError: If lock cannot be acquired
         """
-        self._validate_address(address)
-        self._validate_register(register)
-        self._validate_byte_value(value)
+        if (
+            address & _INVALID_ADDRESS_BITS
+            or register & _INVALID_REGISTER_BITS
+            or value & _INVALID_BYTE_BITS
+        ):
+            self._validate_address(address)
+            self._validate_register(register)
+            self._validate_byte_value(value)
 
-        if self.lock_enabled and self.lock:
-            try:
-                with self.lock:
-                    self._write_byte_unlocked(address, register, value)
-            except Timeout:
-                raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.lock_timeout}s")
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                self._write_byte_unlocked(address, register, value)
         else:
             self._write_byte_unlocked(address, register, value)
 
     def _write_byte_unlocked(self, address: int, register: int, value: int) -> None:
         """Internal write operation without locking."""
+        self._invalidate_cached(address, register)
         try:
-            time.sleep(WRITE_DELAY_MS / 1000.0)
             self.bus.write_byte_data(address, register, value)
-            logger.debug(f"I2C write: addr=0x{address:02X} reg=0x{register:02X} <- 0x{value:02X}")
+            self.last_transfer[address] = time.monotonic()
+            logger.debug("I2C write: addr=0x%02X reg=0x%02X <- 0x%02X", address, register, value)
         except Exception as e:
             raise I2CError(f"I2C write failed: addr=0x{address:02X} reg=0x{register:02X}: {e}")
 
+    def write_registers(self, address: int, writes: Sequence[tuple[int, int]]) -> None:
+        """
+        Write a batch of single-register values.
+
+        When the adapter supports plain I2C messages, each (register, value)
+        pair becomes one write message and up to I2C_RDWR_MAX_MSGS messages
+        are issued per I2C_RDWR ioctl, instead of one SMBus transfer each.
+        Otherwise the values are written one by one in order.
+
+        Args:
+            address: I2C device address (7-bit)
+            writes: (register, value) pairs, written in order
+
+        Raises:
+            I2CError: If write operation fails or parameters are invalid
+            I2CBusLockError: If lock cannot be acquired
+
+        Example:
+            >>> bus.write_registers(0x4D, [(0x30, 0x80), (0x40, 0x80)])
+        """
+        self._validate_address(address)
+        for register, value in writes:
+            if register & _INVALID_REGISTER_BITS or value & _INVALID_BYTE_BITS:
+                self._validate_register(register)
+                self._validate_byte_value(value)
+
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                self._write_registers_unlocked(address, writes)
+        else:
+            self._write_registers_unlocked(address, writes)
+
+    def _write_registers_unlocked(self, address: int, writes: Sequence[tuple[int, int]]) -> None:
+        """Internal batched register write operation without locking."""
+        if self._register_cache:
+            for register, _ in writes:
+                self._invalidate_cached(address, register)
+        try:
+            if self.rdwr_supported:
+                msgs = self._wr_msgs
+                pairs = self._wr_pairs
+                with self._rdwr_lock:
+                    for start in range(0, len(writes), I2C_RDWR_MAX_MSGS):
+                        chunk = writes[start : start + I2C_RDWR_MAX_MSGS]
+                        for index, (register, value) in enumerate(chunk):
+                            msgs[index].addr = address
+                            pairs[2 * index] = register
+                            pairs[2 * index + 1] = value
+                        self._wr_data.nmsgs = len(chunk)
+                        ioctl(self.bus.fd, I2C_RDWR, self._wr_data)
+            else:
+                for register, value in writes:
+                    self.bus.write_byte_data(address, register, value)
+            self.last_transfer[address] = time.monotonic()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "I2C write registers: addr=0x%02X <- %s",
+                    address,
+                    [f"0x{register:02X}=0x{value:02X}" for register, value in writes],
+                )
+        except Exception as e:
+            raise I2CError(f"I2C register write failed: addr=0x{address:02X}: {e}")
+
     def read_word(self, address: int, register: int) -> int:
         """
         Read a 16-bit word from a register.
@@ -239,22 +852,20 @@ class I2CBus:
         Returns:
             16-bit word value read from register
         """
-        if self.lock_enabled and self.lock:
-            try:
-                with self.lock:
-                    return self._read_word_unlocked(address, register)
-            except Timeout:
-                raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.lock_timeout}s")
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                return self._read_word_unlocked(address, register)
         else:
             return self._read_word_unlocked(address, register)
 
     def _read_word_unlocked(self, address: int, register: int) -> int:
         """Internal word read operation without locking."""
         try:
-            time.sleep(READ_DELAY_MS / 1000.0)
-            value = self.bus.read_word_data(address, register)
+            # SMBus words are transferred LSB first
+            data = self._read_register_data(address, register, 2)
+            value = data[0] | (data[1] << 8)
             logger.debug(
-                f"I2C read word: addr=0x{address:02X} reg=0x{register:02X} -> 0x{value:04X}"
+                "I2C read word: addr=0x%02X reg=0x%02X -> 0x%04X", address, register, value
             )
             return value
         except Exception as e:
@@ -269,22 +880,20 @@ class I2CBus:
             register: Register address
             value: 16-bit word value to write
         """
-        if self.lock_enabled and self.lock:
-            try:
-                with self.lock:
-                    self._write_word_unlocked(address, register, value)
-            except Timeout:
-                raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.lock_timeout}s")
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                self._write_word_unlocked(address, register, value)
         else:
             self._write_word_unlocked(address, register, value)
 
     def _write_word_unlocked(self, address: int, register: int, value: int) -> None:
         """Internal word write operation without locking."""
+        self._invalidate_cached(address, register, 2)
         try:
-            time.sleep(WRITE_DELAY_MS / 1000.0)
             self.bus.write_word_data(address, register, value)
+            self.last_transfer[address] = time.monotonic()
             logger.debug(
-                f"I2C write word: addr=0x{address:02X} reg=0x{register:02X} <- 0x{value:04X}"
+                "I2C write word: addr=0x%02X reg=0x%02X <- 0x%04X", address, register, value
             )
         except Exception as e:
             raise I2CError(f"I2C word write failed: addr=0x{address:02X} reg=0x{register:02X}: {e}")
@@ -309,35 +918,36 @@ class I2CBus:
         self._validate_register(register)
         self._validate_block_length(length)
 
-        if self.lock_enabled and self.lock:
-            try:
-                with self.lock:
-                    return self._read_block_unlocked(address, register, length)
-            except Timeout:
-                raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.lock_timeout}s")
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                return self._read_block_unlocked(address, register, length)
         else:
             return self._read_block_unlocked(address, register, length)
 
     def _read_block_unlocked(self, address: int, register: int, length: int) -> list[int]:
         """Internal block read operation without locking."""
         try:
-            time.sleep(READ_DELAY_MS / 1000.0)
-            data = self.bus.read_i2c_block_data(address, register, length)
-            logger.debug(
-                f"I2C read block: addr=0x{address:02X} reg=0x{register:02X} len={length} -> {[hex(b) for b in data]}"
-            )
+            data = self._read_register_data(address, register, length)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "I2C read block: addr=0x%02X reg=0x%02X len=%d -> %s",
+                    address,
+                    register,
+                    length,
+                    [hex(b) for b in data],
+                )
             return data
         except Exception as e:
             raise I2CError(f"I2C block read failed: addr=0x{address:02X} reg=0x{register:02X}: {e}")
 
-    def write_block(self, address: int, register: int, data: list[int]) -> None:
+    def write_block(self, address: int, register: int, data: Sequence[int]) -> None:
         """
         Write a block of bytes to consecutive registers.
 
         Args:
             address: I2C device address (7-bit)
             register: Starting register address
-            data: List of byte values to write
+            data: Byte values to write (list, bytes or bytearray)
 
         Raises:
             I2CError: If write operation fails or parameters are invalid
@@ -346,31 +956,92 @@ class I2CBus:
         self._validate_address(address)
         self._validate_register(register)
         self._validate_block_length(len(data))
-        for value in data:
-            self._validate_byte_value(value)
+        self._validate_byte_values(data)
 
-        if self.lock_enabled and self.lock:
-            try:
-                with self.lock:
-                    self._write_block_unlocked(address, register, data)
-            except Timeout:
-                raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.lock_timeout}s")
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                self._write_block_unlocked(address, register, data)
         else:
             self._write_block_unlocked(address, register, data)
 
-    def _write_block_unlocked(self, address: int, register: int, data: list[int]) -> None:
+    def _write_block_unlocked(self, address: int, register: int, data: Sequence[int]) -> None:
         """Internal block write operation without locking."""
+        self._invalidate_cached(address, register, len(data))
         try:
-            time.sleep(WRITE_DELAY_MS / 1000.0)
             self.bus.write_i2c_block_data(address, register, data)
-            logger.debug(
-                f"I2C write block: addr=0x{address:02X} reg=0x{register:02X} <- {[hex(b) for b in data]}"
-            )
+            self.last_transfer[address] = time.monotonic()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "I2C write block: addr=0x%02X reg=0x%02X <- %s",
+                    address,
+                    register,
+                    [hex(b) for b in data],
+                )
         except Exception as e:
             raise I2CError(
                 f"I2C block write failed: addr=0x{address:02X} reg=0x{register:02X}: {e}"
             )
 
+    def write_blocks(self, address: int, blocks: Sequence[tuple[int, Sequence[int]]]) -> None:
+        """
+        Write several blocks of bytes, each to its own run of consecutive registers.
+
+        When the adapter supports plain I2C messages, each block becomes one
+        write message and up to I2C_RDWR_MAX_MSGS messages are issued per
+        I2C_RDWR ioctl. Otherwise the blocks are written one by one in order.
+
+        Args:
+            address: I2C device address (7-bit)
+            blocks: (start register, data) pairs, written in order
+
+        Raises:
+            I2CError: If write operation fails or parameters are invalid
+            I2CBusLockError: If lock cannot be acquired
+
+        Example:
+            >>> bus.write_blocks(0x4D, [(0x31, [0x01, 0x2B]), (0x41, [0x01, 0x2B])])
+        """
+        self._validate_address(address)
+        for register, data in blocks:
+            self._validate_register(register)
+            self._validate_block_length(len(data))
+            self._validate_byte_values(data)
+
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                self._write_blocks_unlocked(address, blocks)
+        else:
+            self._write_blocks_unlocked(address, blocks)
+
+    def _write_blocks_unlocked(
+        self, address: int, blocks: Sequence[tuple[int, Sequence[int]]]
+    ) -> None:
+        """Internal batched block write operation without locking."""
+        if self._register_cache:
+            for register, data in blocks:
+                self._invalidate_cached(address, register, len(data))
+        try:
+            if self.rdwr_supported:
+                for start in range(0, len(blocks), I2C_RDWR_MAX_MSGS):
+                    self.bus.i2c_rdwr(
+                        *(
+                            i2c_msg.write(address, [register, *data])
+                            for register, data in blocks[start : start + I2C_RDWR_MAX_MSGS]
+                        )
+                    )
+            else:
+                for register, data in blocks:
+                    self.bus.write_i2c_block_data(address, register, list(data))
+            self.last_transfer[address] = time.monotonic()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "I2C write blocks: addr=0x%02X <- %s",
+                    address,
+                    {f"0x{register:02X}": [hex(b) for b in data] for register, data in blocks},
+                )
+        except Exception as e:
+            raise I2CError(f"I2C block write failed: addr=0x{address:02X}: {e}")
+
     def send_byte(self, address: int, value: int) -> None:
         """
         Send a single byte without a register address (SMBus Send Byte).
@@ -383,21 +1054,18 @@ class I2CBus:
             I2CError: If send operation fails
             I2CBusLockError: If lock cannot be acquired
         """
-        if self.lock_enabled and self.lock:
-            try:
-                with self.lock:
-                    self._send_byte_unlocked(address, value)
-            except Timeout:
-                raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.lock_timeout}s")
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                self._send_byte_unlocked(address, value)
         else:
             self._send_byte_unlocked(address, value)
 
     def _send_byte_unlocked(self, address: int, value: int) -> None:
         """Internal send byte operation without locking."""
         try:
-            time.sleep(WRITE_DELAY_MS / 1000.0)
             self.bus.write_byte(address, value)
-            logger.debug(f"I2C send byte: addr=0x{address:02X} <- 0x{value:02X}")
+            self.last_transfer[address] = time.monotonic()
+            logger.debug("I2C send byte: addr=0x%02X <- 0x%02X", address, value)
         except Exception as e:
             raise I2CError(f"I2C send byte failed: addr=0x{address:02X}: {e}")
 
@@ -415,30 +1083,44 @@ class I2CBus:
             I2CError: If receive operation fails
             I2CBusLockError: If lock cannot be acquired
         """
-        if self.lock_enabled and self.lock:
-            try:
-                with self.lock:
-                    return self._receive_byte_unlocked(address)
-            except Timeout:
-                raise I2CBusLockError(f"Failed to acquire I2C bus lock within {self.lock_timeout}s")
+        if self.lock is not None and not self._transaction.active:
+            with self.lock:
+                return self._receive_byte_unlocked(address)
         else:
             return self._receive_byte_unlocked(address)
 
     def _receive_byte_unlocked(self, address: int) -> int:
         """Internal receive byte operation without locking."""
         try:
-            time.sleep(READ_DELAY_MS / 1000.0)
             value = self.bus.read_byte(address)
-            logger.debug(f"I2C receive byte: addr=0x{address:02X} -> 0x{value:02X}")
+            self.last_transfer[address] = time.monotonic()
+            logger.debug("I2C receive byte: addr=0x%02X -> 0x%02X", address, value)
             return value
         except Exception as e:
             raise I2CError(f"I2C receive byte failed: addr=0x{address:02X}: {e}")
 
+    def settle(self) -> None:
+        """
+        Wait for the device to settle after a batch of register writes.
+
+        Individual transfers are issued back to back without any delay; call
+        this once after a logical configuration sequence instead.
+        """
+        time.sleep(INIT_DELAY_MS / 1000.0)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the bus device file descriptor has been closed."""
+        return self.bus.fd is None
+
     def close(self) -> None:
         """Close the I2C bus connection."""
+        self._register_cache.clear()
         if self.bus:
             self.bus.close()
-            logger.debug(f"I2C bus {self.bus_number} closed")
+            logger.debug("I2C bus %d closed", self.bus_number)
+        if self.lock:
+            self.lock.close()
 
     def __enter__(self) -> "I2CBus":
         """Context manager entry."""
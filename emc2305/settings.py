@@ -7,16 +7,25 @@ Configuration Management
 Handles loading and saving configuration for EMC2305 fan controller.
 """
 
+import functools
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 try:
     import yaml
 except ImportError:
     yaml = None
+else:
+    # Prefer libyaml's C implementation; PyYAML only provides it when built with libyaml
+    try:
+        from yaml import CSafeDumper as _YamlDumper
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeDumper as _YamlDumper
+        from yaml import SafeLoader as _YamlLoader
 
 from emc2305.driver import constants as const
 
@@ -38,6 +47,7 @@ class I2CConfig:
     lock_enabled: bool = True
     lock_timeout: float = const.DEFAULT_I2C_LOCK_TIMEOUT
     lock_path: str = const.DEFAULT_I2C_LOCK_PATH
+    lock_poll_interval: float = const.DEFAULT_I2C_LOCK_POLL_INTERVAL
 
 
 @dataclass
@@ -118,6 +128,20 @@ class DriverConfig:
     log_file: Optional[str] = None  # Log to file (None = console only)
 
 
+# Keys accepted from each configuration file section; the dataclasses supply the
+# defaults for anything missing and unknown keys are ignored
+_I2C_FIELDS = frozenset(f.name for f in fields(I2CConfig))
+_FAN_FIELDS = frozenset(f.name for f in fields(FanChannelConfig))
+_EMC2305_FIELDS = frozenset(f.name for f in fields(EMC2305Config)) - {"address", "fans"}
+
+
+def _coerce_address(value: Any) -> int:
+    """Convert a device address from the configuration file, accepting hex strings like "0x61"."""
+    if isinstance(value, str):
+        return int(value, 16)
+    return value
+
+
 class ConfigManager:
     """
     Configuration file manager.
@@ -144,22 +168,30 @@ class ConfigManager:
 
         self.config_path = config_path
         if self.config_path is None:
-            self.config_path = self._find_config()
+            self.config_path = _find_config()
 
         self.config = DriverConfig()
 
-    def _find_config(self) -> Optional[Path]:
-        """Find configuration file in default locations."""
-        for path in self.DEFAULT_CONFIG_LOCATIONS:
-            if path.exists():
-                logger.info(f"Found configuration: {path}")
-                return path
-        return None
+        # Parsed file contents keyed by (path, mtime_ns, size); load() only
+        # re-parses when the file changed
+        self._parsed: Optional[tuple[tuple[Path, int, int], Any]] = None
+
+    def invalidate(self) -> None:
+        """Drop the cached file contents so the next load() re-parses the file."""
+        self._parsed = None
 
     def load(self) -> DriverConfig:
         """
         Load configuration from file.
 
+        The parsed YAML is cached; the file is only parsed again when its
+        modification time or size changes.
+
+        File values are trusted: the known keys of each section are passed to
+        its dataclass constructor without validation, and unknown keys are
+        ignored. Missing keys take the dataclass defaults (fans are named
+        "Fan N"); only the device address is converted, from a hex string.
+
         Returns:
             DriverConfig with loaded values or defaults
         """
@@ -172,8 +204,15 @@ class ConfigManager:
             return self.config
 
         try:
-            with open(self.config_path) as f:
-                data = yaml.safe_load(f)
+            stat = self.config_path.stat()
+            key = (self.config_path, stat.st_mtime_ns, stat.st_size)
+            if self._parsed is not None and self._parsed[0] == key:
+                data = self._parsed[1]
+            else:
+                # Binary stream: the loader detects the encoding and decodes as it parses
+                with open(self.config_path, "rb") as f:
+                    data = yaml.load(f, Loader=_YamlLoader)
+                self._parsed = (key, data)
 
             if data is None:
                 return self.config
@@ -182,57 +221,29 @@ class ConfigManager:
             if "i2c" in data:
                 i2c_data = data["i2c"]
                 self.config.i2c = I2CConfig(
-                    bus=i2c_data.get("bus", const.DEFAULT_I2C_BUS),
-                    lock_enabled=i2c_data.get("lock_enabled", True),
-                    lock_timeout=i2c_data.get("lock_timeout", const.DEFAULT_I2C_LOCK_TIMEOUT),
-                    lock_path=i2c_data.get("lock_path", const.DEFAULT_I2C_LOCK_PATH),
+                    **{key: value for key, value in i2c_data.items() if key in _I2C_FIELDS}
                 )
 
             # Load EMC2305 configuration
             if "emc2305" in data:
                 emc_data = data["emc2305"]
 
-                # Parse address (support hex strings like "0x61")
-                address = emc_data.get("address", const.DEFAULT_DEVICE_ADDRESS)
-                if isinstance(address, str):
-                    address = int(address, 16)
+                address = _coerce_address(emc_data.get("address", const.DEFAULT_DEVICE_ADDRESS))
 
                 # Load fan channel configurations
                 fans = {}
                 if "fans" in emc_data:
                     for channel_str, fan_data in emc_data["fans"].items():
                         channel = int(channel_str) if isinstance(channel_str, str) else channel_str
-                        fans[channel] = FanChannelConfig(
-                            name=fan_data.get("name", f"Fan {channel}"),
-                            enabled=fan_data.get("enabled", True),
-                            control_mode=fan_data.get("control_mode", "pwm"),
-                            min_rpm=fan_data.get("min_rpm", const.MIN_RPM),
-                            max_rpm=fan_data.get("max_rpm", const.MAX_RPM),
-                            default_target_rpm=fan_data.get("default_target_rpm", 2000),
-                            min_duty_percent=fan_data.get("min_duty_percent", 20),
-                            max_duty_percent=fan_data.get("max_duty_percent", 100),
-                            default_duty_percent=fan_data.get("default_duty_percent", 50),
-                            update_time_ms=fan_data.get("update_time_ms", 500),
-                            edges=fan_data.get("edges", 5),
-                            max_step=fan_data.get("max_step", const.DEFAULT_MAX_STEP),
-                            pwm_divide=fan_data.get("pwm_divide", const.DEFAULT_PWM_DIVIDE),
-                            spin_up_level_percent=fan_data.get("spin_up_level_percent", 50),
-                            spin_up_time_ms=fan_data.get("spin_up_time_ms", 500),
-                            pid_gain_p=fan_data.get("pid_gain_p", 2),
-                            pid_gain_i=fan_data.get("pid_gain_i", 1),
-                            pid_gain_d=fan_data.get("pid_gain_d", 1),
-                        )
+                        fan_fields = {
+                            key: value for key, value in fan_data.items() if key in _FAN_FIELDS
+                        }
+                        fan_fields.setdefault("name", f"Fan {channel}")
+                        fans[channel] = FanChannelConfig(**fan_fields)
 
                 self.config.emc2305 = EMC2305Config(
-                    name=emc_data.get("name", "EMC2305 Fan Controller"),
+                    **{key: value for key, value in emc_data.items() if key in _EMC2305_FIELDS},
                     address=address,
-                    enabled=emc_data.get("enabled", True),
-                    use_external_clock=emc_data.get("use_external_clock", False),
-                    pwm_frequency_hz=emc_data.get("pwm_frequency_hz", 26000),
-                    pwm_polarity_inverted=emc_data.get("pwm_polarity_inverted", False),
-                    pwm_output_push_pull=emc_data.get("pwm_output_push_pull", False),
-                    enable_watchdog=emc_data.get("enable_watchdog", False),
-                    enable_alerts=emc_data.get("enable_alerts", True),
                     fans=fans,
                 )
 
@@ -245,11 +256,11 @@ class ConfigManager:
             self.config.log_level = data.get("log_level", "INFO")
             self.config.log_file = data.get("log_file")
 
-            logger.info(f"Configuration loaded from {self.config_path}")
+            logger.info("Configuration loaded from %s", self.config_path)
             return self.config
 
         except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
+            logger.error("Failed to load configuration: %s", e)
             return self.config
 
     def save(self, config: DriverConfig) -> bool:
@@ -273,62 +284,36 @@ class ConfigManager:
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Convert config to dictionary
+            # Convert config to dictionary; the address is written as a hex string
+            emc2305_data = asdict(config.emc2305)
+            emc2305_data["address"] = "0x%02X" % config.emc2305.address
             data = {
-                "i2c": {
-                    "bus": config.i2c.bus,
-                    "lock_enabled": config.i2c.lock_enabled,
-                    "lock_timeout": config.i2c.lock_timeout,
-                    "lock_path": config.i2c.lock_path,
-                },
-                "emc2305": {
-                    "name": config.emc2305.name,
-                    "address": f"0x{config.emc2305.address:02X}",
-                    "enabled": config.emc2305.enabled,
-                    "use_external_clock": config.emc2305.use_external_clock,
-                    "pwm_frequency_hz": config.emc2305.pwm_frequency_hz,
-                    "pwm_polarity_inverted": config.emc2305.pwm_polarity_inverted,
-                    "pwm_output_push_pull": config.emc2305.pwm_output_push_pull,
-                    "enable_watchdog": config.emc2305.enable_watchdog,
-                    "enable_alerts": config.emc2305.enable_alerts,
-                    "fans": {
-                        channel: {
-                            "name": fan.name,
-                            "enabled": fan.enabled,
-                            "control_mode": fan.control_mode,
-                            "min_rpm": fan.min_rpm,
-                            "max_rpm": fan.max_rpm,
-                            "default_target_rpm": fan.default_target_rpm,
-                            "min_duty_percent": fan.min_duty_percent,
-                            "max_duty_percent": fan.max_duty_percent,
-                            "default_duty_percent": fan.default_duty_percent,
-                            "update_time_ms": fan.update_time_ms,
-                            "edges": fan.edges,
-                            "max_step": fan.max_step,
-                            "pwm_divide": fan.pwm_divide,
-                            "spin_up_level_percent": fan.spin_up_level_percent,
-                            "spin_up_time_ms": fan.spin_up_time_ms,
-                            "pid_gain_p": fan.pid_gain_p,
-                            "pid_gain_i": fan.pid_gain_i,
-                            "pid_gain_d": fan.pid_gain_d,
-                        }
-                        for channel, fan in config.emc2305.fans.items()
-                    },
-                },
+                "i2c": asdict(config.i2c),
+                "emc2305": emc2305_data,
                 "log_level": config.log_level,
             }
 
             if config.log_file:
                 data["log_file"] = config.log_file
 
-            with open(self.config_path, "w") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            self.invalidate()
+            # The file may now exist in a default location that was searched before
+            _find_config.cache_clear()
+            with open(self.config_path, "wb") as f:
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=_YamlDumper,
+                    encoding="utf-8",
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
 
-            logger.info(f"Configuration saved to {self.config_path}")
+            logger.info("Configuration saved to %s", self.config_path)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
+            logger.error("Failed to save configuration: %s", e)
             return False
 
     def create_default(self, path: Optional[Path] = None) -> bool:
@@ -385,3 +370,17 @@ class ConfigManager:
         }
 
         return self.save(default_config)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_config() -> Optional[Path]:
+    """
+    Find configuration file in default locations.
+
+    The result is cached for the process; ConfigManager.save() clears it.
+    """
+    for path in ConfigManager.DEFAULT_CONFIG_LOCATIONS:
+        if path.exists():
+            logger.info("Found configuration: %s", path)
+            return path
+    return None
@@ -39,10 +39,11 @@ def check_all_fan_faults(fan_controller: EMC2305) -> None:
 
     fault_detected = False
 
-    for channel in range(1, 6):
-        status = fan_controller.get_fan_status(channel)
-        rpm = fan_controller.get_current_rpm(channel)
-        duty = fan_controller.get_pwm_duty_cycle(channel)
+    # One block read covers status, RPM and duty cycle of every channel
+    for channel, state in fan_controller.get_all_fan_states().items():
+        status = state.status
+        rpm = state.current_rpm
+        duty = state.pwm_percent
 
         status_str = status.value.upper()
 
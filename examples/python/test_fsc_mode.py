@@ -82,10 +82,12 @@ def main():
             start_time = time.time()
 
             while time.time() - start_time < 10:
-                current_rpm = fan_controller.get_current_rpm(1)
-                target_readback = fan_controller.get_target_rpm(1)
-                duty = fan_controller.get_pwm_duty_cycle(1)
-                status = fan_controller.get_fan_status(1)
+                # Single read of the channel's register window
+                state = fan_controller.get_fan_state(1)
+                current_rpm = state.current_rpm
+                target_readback = state.target_rpm
+                duty = state.pwm_percent
+                status = state.status
 
                 error = abs(current_rpm - target_rpm)
                 error_percent = (error / target_rpm * 100) if target_rpm > 0 else 0
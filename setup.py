@@ -48,7 +48,6 @@ setup(
     python_requires=">=3.9",
     install_requires=[
         "smbus2>=0.4.0",          # I2C communication
-        "filelock>=3.12.0",       # Cross-process I2C locking
     ],
     extras_require={
         "config": [
@@ -9,7 +9,9 @@ without requiring actual hardware.
 """
 
 import threading
-from typing import Dict, Optional
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, Tuple
 
 from emc2305.driver.i2c import I2CError
 
@@ -31,6 +33,14 @@ class MockI2CBus:
         self.device_address = device_address
         self._registers: Dict[int, int] = {}
         self._lock = threading.Lock()
+        self.settle_count = 0
+        self.transaction_count = 0
+        self.in_transaction = False
+        self.write_batch_count = 0
+        self.last_transfer: Dict[int, float] = {}
+        self.bus_speed_hz: Optional[int] = None
+        self.bus_number = 0
+        self.closed = False
         self._initialize_default_registers()
 
     def _initialize_default_registers(self) -> None:
@@ -133,6 +143,7 @@ class MockI2CBus:
             )
 
         with self._lock:
+            self.last_transfer[device_address] = time.monotonic()
             if register not in self._registers:
                 # Return 0 for uninitialized registers (realistic behavior)
                 return 0x00
@@ -164,8 +175,44 @@ class MockI2CBus:
             raise ValueError(f"Register must be 0-255, got {register}")
 
         with self._lock:
+            self.last_transfer[device_address] = time.monotonic()
             self._registers[register] = value
 
+    def send_byte(self, device_address: int, value: int) -> None:
+        """
+        Send a byte without a register address (sets the register pointer).
+
+        Args:
+            device_address: I2C device address
+            value: Register pointer value (0-255)
+
+        Raises:
+            I2CError: If device address doesn't match
+        """
+        if device_address != self.device_address:
+            raise I2CError(
+                f"Device not found at address 0x{device_address:02X}. "
+                f"Mock device is at 0x{self.device_address:02X}"
+            )
+
+        with self._lock:
+            self.last_transfer[device_address] = time.monotonic()
+
+    def write_registers(self, device_address: int, writes: Sequence[Tuple[int, int]]) -> None:
+        """
+        Write a batch of (register, value) pairs in order.
+
+        Args:
+            device_address: I2C device address
+            writes: (register, value) pairs
+
+        Raises:
+            I2CError: If device address doesn't match
+        """
+        self.write_batch_count += 1
+        for register, value in writes:
+            self.write_byte(device_address, register, value)
+
     def read_block(self, device_address: int, register: int, length: int) -> bytes:
         """
         Read block of bytes starting from register.
@@ -188,6 +235,7 @@ class MockI2CBus:
             )
 
         with self._lock:
+            self.last_transfer[device_address] = time.monotonic()
             data = []
             for i in range(length):
                 reg = register + i
@@ -197,6 +245,23 @@ class MockI2CBus:
                     data.append(0x00)
             return bytes(data)
 
+    def read_register_block(self, device_address: int, register: int, length: int) -> list[int]:
+        """
+        Read consecutive registers in one transaction (no SMBus length limit).
+
+        Args:
+            device_address: I2C device address
+            register: Starting register address
+            length: Number of bytes to read
+
+        Returns:
+            List of register values
+
+        Raises:
+            I2CError: If device address doesn't match
+        """
+        return list(self.read_block(device_address, register, length))
+
     def write_block(self, device_address: int, register: int, data: bytes) -> None:
         """
         Write block of bytes starting from register.
@@ -216,9 +281,40 @@ class MockI2CBus:
             )
 
         with self._lock:
+            self.last_transfer[device_address] = time.monotonic()
             for i, byte_val in enumerate(data):
                 self._registers[register + i] = byte_val
 
+    def write_blocks(
+        self, device_address: int, blocks: Sequence[Tuple[int, Sequence[int]]]
+    ) -> None:
+        """
+        Write several blocks of bytes in order.
+
+        Args:
+            device_address: I2C device address
+            blocks: (start register, data) pairs
+
+        Raises:
+            I2CError: If device address doesn't match
+        """
+        for register, data in blocks:
+            self.write_block(device_address, register, bytes(data))
+
+    @contextmanager
+    def transaction(self) -> Iterator["MockI2CBus"]:
+        """Group operations under one bus lock (counted for tests)."""
+        self.transaction_count += 1
+        self.in_transaction = True
+        try:
+            yield self
+        finally:
+            self.in_transaction = False
+
+    def settle(self) -> None:
+        """Settling delay after a write batch (no-op for the mock)."""
+        self.settle_count += 1
+
     def get_register(self, register: int) -> Optional[int]:
         """
         Get register value (for test verification).
@@ -14,11 +14,14 @@ from emc2305.driver import constants as const
 from emc2305.driver.emc2305 import (
     EMC2305,
     ControlMode,
+    EMC2305CommunicationError,
+    EMC2305ConfigurationLockedError,
     EMC2305DeviceNotFoundError,
     EMC2305ValidationError,
     FanConfig,
     FanStatus,
 )
+from emc2305.driver.i2c import I2CError
 
 
 @pytest.fixture
@@ -58,17 +61,209 @@ def test_device_detection_wrong_product_id(mock_bus):
         EMC2305(i2c_bus=mock_bus, device_address=0x4D)
 
 
+def test_identification_registers_cached(emc2305, mock_bus):
+    """Test that identification registers are served from the detection cache."""
+    mock_bus.set_register(const.REG_PRODUCT_FEATURES, 0x00)
+    mock_bus.set_register(const.REG_REVISION, 0x7F)
+
+    features = emc2305.get_product_features()
+    assert features.product_id == 0x34
+    assert features.manufacturer_id == 0x5D
+    assert features.revision == emc2305.revision
+    assert features.revision != 0x7F
+    assert features.fan_channels != 0
+    assert emc2305.get_product_features() is features
+
+
+def test_deferred_initialization(mock_bus):
+    """Test that defer_init postpones detection and setup until first use."""
+    controller = EMC2305(i2c_bus=mock_bus, device_address=0x4D, defer_init=True)
+    assert mock_bus.get_register(const.REG_CONFIGURATION) == 0x00
+    assert mock_bus.settle_count == 0
+
+    controller.get_current_rpm(1)
+    assert mock_bus.get_register(const.REG_CONFIGURATION) & const.CONFIG_GLBL_EN
+    assert mock_bus.settle_count == 1
+
+    controller.get_current_rpm(1)
+    assert mock_bus.settle_count == 1
+
+
+def test_single_threaded_controller(mock_bus):
+    """Test that thread_safe=False drives the device without a driver lock."""
+    controller = EMC2305(i2c_bus=mock_bus, device_address=0x4D, thread_safe=False)
+    controller.set_pwm_duty_cycle(1, 50.0)
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 127
+    assert controller.get_fan_status(1) == FanStatus.OK
+
+
+def test_closed_bus_rejected(mock_bus):
+    """Test that a closed bus fails initialization instead of device detection."""
+    mock_bus.closed = True
+    with pytest.raises(EMC2305CommunicationError, match="closed"):
+        EMC2305(i2c_bus=mock_bus, device_address=0x4D)
+
+
+def test_close_sets_safe_speed_in_one_batch(emc2305, mock_bus):
+    """Test that closing writes the safe shutdown speed to every fan in one batch."""
+    emc2305.set_pwm_duty_cycle(1, const.SAFE_SHUTDOWN_PWM_PERCENT)
+    batches = mock_bus.write_batch_count
+
+    emc2305.close()
+
+    assert mock_bus.write_batch_count == batches + 1
+    safe_pwm = emc2305._percent_to_pwm(const.SAFE_SHUTDOWN_PWM_PERCENT)
+    for regs in const.FAN_REGS:
+        assert mock_bus.get_register(regs[const.FAN_REG_SETTING]) == safe_pwm
+
+
+def test_deferred_initialization_wrong_address(mock_bus):
+    """Test that deferred detection errors surface on first use."""
+    controller = EMC2305(i2c_bus=mock_bus, device_address=0x2F, defer_init=True)
+    with pytest.raises(EMC2305DeviceNotFoundError):
+        controller.get_pwm_duty_cycle(1)
+
+
 # =============================================================================
 # Initialization Tests
 # =============================================================================
 
 
+def test_initialization_reports_slow_bus(mock_bus, caplog):
+    """Test that a bus clocked below Fast-mode is reported at initialization."""
+    mock_bus.bus_speed_hz = 100_000
+    with caplog.at_level("INFO", logger="emc2305.driver.emc2305"):
+        EMC2305(i2c_bus=mock_bus, device_address=0x4D)
+    assert "I2C bus clock is 100 kHz" in caplog.text
+
+
 def test_initialization_enables_glbl_en(emc2305, mock_bus):
     """Test that initialization enables GLBL_EN bit."""
     config = mock_bus.get_register(const.REG_CONFIGURATION)
     assert config & const.CONFIG_GLBL_EN, "GLBL_EN bit must be enabled"
 
 
+def test_initialization_settles_once(emc2305, mock_bus):
+    """Test that initialization waits once after the whole write sequence."""
+    assert mock_bus.settle_count == 1
+
+
+def test_initialization_uses_single_bus_transaction(emc2305, mock_bus):
+    """Test that detection and initialization hold the bus lock once."""
+    assert mock_bus.transaction_count == 1
+
+    emc2305.configure_fan(1, FanConfig(min_drive_percent=40))
+    assert mock_bus.transaction_count == 2
+
+
+def test_settle_runs_outside_bus_transaction(mock_bus):
+    """Test that the settling delay does not hold the bus lock."""
+    settled_in_transaction = []
+    original_settle = mock_bus.settle
+
+    def record_settle():
+        settled_in_transaction.append(mock_bus.in_transaction)
+        original_settle()
+
+    mock_bus.settle = record_settle
+    controller = EMC2305(i2c_bus=mock_bus, device_address=0x4D)
+    controller.configure_fan(1, FanConfig(min_drive_percent=40))
+    assert settled_in_transaction == [False, False]
+
+
+def test_initialization_writes_single_batch(emc2305, mock_bus):
+    """Test that initialization writes the global registers in one batch."""
+    assert mock_bus.write_batch_count == 1
+    assert (
+        mock_bus.get_register(const.REG_FAN_INTERRUPT_ENABLE) == const.FAN_INTERRUPT_ENABLE_ALL_FANS
+    )
+
+
+def record_block_writes(mock_bus):
+    """Record the (register, length) blocks of each write_blocks() call on the mock bus."""
+    block_writes = []
+    original_write_blocks = mock_bus.write_blocks
+
+    def record_write_blocks(addr, blocks):
+        block_writes.append([(reg, len(data)) for reg, data in blocks])
+        original_write_blocks(addr, blocks)
+
+    mock_bus.write_blocks = record_write_blocks
+    return block_writes
+
+
+def test_initialization_writes_fan_windows_in_one_batch(mock_bus):
+    """Test that initialization sends every channel's configuration block together."""
+    block_writes = record_block_writes(mock_bus)
+    EMC2305(i2c_bus=mock_bus, device_address=0x4D)
+
+    assert block_writes == [[(0x31 + 0x10 * i, 11) for i in range(const.NUM_FAN_CHANNELS)]]
+
+
+def test_configure_fan_single_block_write(emc2305, mock_bus):
+    """Test that fan configuration is one block write preserving the reserved register."""
+    block_writes = record_block_writes(mock_bus)
+    mock_bus.set_register(0x44, 0xA5)  # Reserved register inside the channel 2 window
+
+    emc2305.configure_fan(2, FanConfig(min_drive_percent=40))
+
+    assert block_writes == [[(0x41, 11)]]  # PWM_DIVIDE (0x41) to DRIVE_FAIL_BAND_HIGH (0x4B)
+    assert mock_bus.get_register(0x44) == 0xA5
+    assert mock_bus.get_register(const.FAN_REGS[1][const.FAN_REG_MINIMUM_DRIVE]) == 102
+
+
+def test_locked_configuration_skips_lock_read(emc2305, mock_bus):
+    """Test that configuration changes on a locked device fail without a lock register read."""
+    emc2305.lock_configuration()
+    mock_bus.read_byte = None  # Any register read would now fail
+
+    with pytest.raises(EMC2305ConfigurationLockedError):
+        emc2305.configure_fan(1, FanConfig(min_drive_percent=40))
+
+
+def test_fan_config_validated_on_construction(emc2305):
+    """Test that invalid configurations fail when built and when modified later."""
+    with pytest.raises(EMC2305ValidationError):
+        FanConfig(update_time_ms=250)
+
+    config = FanConfig()
+    config.max_step = 64
+    with pytest.raises(EMC2305ValidationError):
+        emc2305.configure_fan(1, config)
+    assert emc2305._fan_configs[1] is not config
+
+
+def test_configure_fan_skips_unchanged_config(emc2305, mock_bus):
+    """Test that rewriting the current configuration is skipped unless forced."""
+    emc2305.configure_fan(1, FanConfig())
+    assert mock_bus.transaction_count == 1
+
+    emc2305.configure_fan(1, FanConfig(), force=True)
+    assert mock_bus.transaction_count == 2
+
+    emc2305.set_control_mode(1, ControlMode.PWM)
+    assert mock_bus.transaction_count == 2
+
+
+@pytest.mark.parametrize(
+    "frequency,expected_code",
+    [
+        (26000, const.PWM_FREQ_26000HZ),
+        (20000, const.PWM_FREQ_26000HZ),
+        (19531, const.PWM_FREQ_19531HZ),
+        (12000, const.PWM_FREQ_19531HZ),
+        (4882, const.PWM_FREQ_4882HZ),
+        (3499, const.PWM_FREQ_2441HZ),
+        (0, const.PWM_FREQ_2441HZ),
+    ],
+)
+def test_initialization_pwm_base_frequency(mock_bus, frequency, expected_code):
+    """Test PWM base frequency selection thresholds."""
+    EMC2305(i2c_bus=mock_bus, device_address=0x4D, pwm_frequency=frequency)
+    assert mock_bus.get_register(const.REG_PWM_BASE_FREQ_1) == expected_code
+    assert mock_bus.get_register(const.REG_PWM_BASE_FREQ_2) == expected_code
+
+
 def test_initialization_disables_smbus_timeout(emc2305, mock_bus):
     """Test that initialization disables SMBus timeout."""
     config = mock_bus.get_register(const.REG_CONFIGURATION)
@@ -102,6 +297,87 @@ def test_set_pwm_duty_cycle_valid(emc2305, mock_bus):
         assert pwm_reg == expected_pwm, f"Failed for {percent}%"
 
 
+def test_set_pwm_duty_cycle_skips_unchanged(emc2305, mock_bus):
+    """Test that an unchanged duty cycle is not rewritten unless forced."""
+    emc2305.set_pwm_duty_cycle(1, 50.0)
+    mock_bus.set_register(const.REG_FAN1_SETTING, 0x00)
+
+    emc2305.set_pwm_duty_cycle(1, 50.0)
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 0x00
+
+    emc2305.set_pwm_duty_cycle(1, 50.0, force=True)
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 127
+
+    emc2305.configure_fan(1, FanConfig(control_mode=ControlMode.FSC))
+    emc2305.configure_fan(1, FanConfig())
+    mock_bus.set_register(const.REG_FAN1_SETTING, 0x00)
+    emc2305.set_pwm_duty_cycle(1, 50.0)
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 127
+
+
+@pytest.mark.parametrize(
+    "read_back",
+    [
+        lambda controller: controller.get_pwm_duty_cycle(1),
+        lambda controller: controller.get_all_pwm_duty_cycles(),
+        lambda controller: controller.get_all_fan_states(),
+        lambda controller: controller.get_fan_state(1),
+    ],
+)
+def test_pwm_read_back_refreshes_skip_cache(emc2305, mock_bus, read_back):
+    """Test that reading the Fan Setting register catches writes made outside the driver."""
+    emc2305.set_pwm_duty_cycle(1, 50.0)
+    mock_bus.set_register(const.REG_FAN1_SETTING, 0xFF)  # E.g. another process
+
+    read_back(emc2305)
+    emc2305.set_pwm_duty_cycle(1, 50.0)
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 127
+
+    emc2305.set_pwm_duty_cycles({1: 100.0})
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 0xFF
+
+
+@pytest.mark.parametrize(
+    "status_read",
+    [
+        lambda controller: controller.get_fan_status(1),
+        lambda controller: controller.get_alert_status(),
+        lambda controller: controller.read_status_block(),
+    ],
+)
+def test_watchdog_status_drops_skip_cache(emc2305, mock_bus, status_read):
+    """Test that any status read reporting a watchdog timeout drops the skip-write cache."""
+    emc2305.set_pwm_duty_cycles({1: 50.0, 2: 50.0})
+    # The watchdog drove the fans to full speed
+    mock_bus.set_register(const.REG_FAN1_SETTING, 0xFF)
+    mock_bus.set_register(const.FAN_REGS[1][const.FAN_REG_SETTING], 0xFF)
+    mock_bus.set_register(const.REG_FAN_STATUS, const.FAN_STATUS_WATCH)
+
+    status_read(emc2305)
+    emc2305.set_pwm_duty_cycles({1: 50.0, 2: 50.0})
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 127
+    assert mock_bus.get_register(const.FAN_REGS[1][const.FAN_REG_SETTING]) == 127
+
+
+def test_set_pwm_duty_cycles_batch(emc2305, mock_bus):
+    """Test that several duty cycles are written as one register batch."""
+    emc2305.set_pwm_duty_cycle(3, 75.0)
+    batches = mock_bus.write_batch_count
+
+    emc2305.set_pwm_duty_cycles({1: 25.0, 2: 50.0, 3: 75.0})
+
+    assert mock_bus.write_batch_count == batches + 1
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 63
+    assert mock_bus.get_register(const.FAN_REGS[1][const.FAN_REG_SETTING]) == 127
+
+    emc2305.set_pwm_duty_cycles({1: 25.0, 3: 75.0})
+    assert mock_bus.write_batch_count == batches + 1
+
+    with pytest.raises(EMC2305ValidationError):
+        emc2305.set_pwm_duty_cycles({1: 50.0, 6: 50.0})
+    assert mock_bus.get_register(const.REG_FAN1_SETTING) == 63
+
+
 def test_set_pwm_duty_cycle_invalid_channel(emc2305):
     """Test setting PWM with invalid channel."""
     with pytest.raises(EMC2305ValidationError):
@@ -138,6 +414,60 @@ def test_pwm_all_channels(emc2305, mock_bus):
         assert pwm_reg == 191  # 75% of 255
 
 
+def test_pwm_conversion_tables(emc2305):
+    """Test PWM lookup tables match the arithmetic conversion."""
+    for percent in range(101):
+        assert emc2305._percent_to_pwm(percent) == int(percent * 255 / 100.0)
+        assert emc2305._percent_to_pwm(float(percent)) == const.PCT_TO_PWM[percent]
+    for pwm in range(256):
+        percent = pwm * 100 / 255
+        assert emc2305._percent_to_pwm(percent) == int(percent * 255 / 100.0)
+    assert const.PCT_TO_PWM[25] == 63
+    assert const.PWM_TO_PCT[255] == 100.0
+    assert emc2305._pwm_to_percent(128) == pytest.approx(50.196, abs=0.001)
+
+
+def test_fan_register_table():
+    """Test precomputed per-channel register table matches channel offsets."""
+    assert len(const.FAN_REGS) == const.NUM_FAN_CHANNELS
+    for index, regs in enumerate(const.FAN_REGS):
+        offset = index * const.FAN_CHANNEL_OFFSET
+        assert regs[const.FAN_REG_SETTING] == const.REG_FAN1_SETTING + offset
+        assert regs[const.FAN_REG_GAIN] == const.REG_FAN1_GAIN + offset
+        assert regs[const.FAN_REG_TACH_READING_LOW] == const.REG_FAN1_TACH_READING_LOW + offset
+    assert const.FAN_REGS[4][const.FAN_REG_TACH_READING_LOW] == 0x7F
+    assert const.FAN_WINDOW_TACH_TARGET == 0x0C
+    assert const.FAN_WINDOW_TACH_READING == 0x0E
+    assert const.FAN_CHANNEL_BITS == (0x01, 0x02, 0x04, 0x08, 0x10)
+
+
+@pytest.mark.parametrize(
+    "level,expected",
+    [
+        (30, const.SPIN_UP_LEVEL_30_PERCENT),
+        (45, const.SPIN_UP_LEVEL_45_PERCENT),
+        (65, const.SPIN_UP_LEVEL_65_PERCENT),
+    ],
+)
+def test_configure_fan_spin_up_level(emc2305, mock_bus, level, expected):
+    """Test spin-up level is encoded from the shared lookup table."""
+    emc2305.configure_fan(1, FanConfig(spin_up_level_percent=level))
+
+    spin_config = mock_bus.get_register(const.REG_FAN1_SPIN_UP_CONFIG)
+    assert spin_config & const.SPIN_UP_LEVEL_MASK == expected
+
+
+def test_nearest_spin_up_level():
+    """Test nearest spin-up level lookup matches a linear nearest search."""
+    from emc2305.driver.emc2305 import _SPIN_UP_LEVELS, _nearest_spin_up_index
+
+    for tenths in range(0, 1001):
+        percent = tenths / 10
+        expected = min(_SPIN_UP_LEVELS, key=lambda level: abs(level - percent))
+        assert _SPIN_UP_LEVELS[_nearest_spin_up_index(percent)] == expected
+    assert _SPIN_UP_LEVELS[_nearest_spin_up_index(32.5)] == 30  # Ties go to the lower level
+
+
 # =============================================================================
 # RPM Control Tests
 # =============================================================================
@@ -145,7 +475,9 @@ def test_pwm_all_channels(emc2305, mock_bus):
 
 def test_set_target_rpm_valid(emc2305, mock_bus):
     """Test setting target RPM with valid values."""
+    batches = mock_bus.write_batch_count
     emc2305.set_target_rpm(1, 3000)
+    assert mock_bus.write_batch_count == batches + 1
 
     # Verify TACH target registers were written
     tach_high = mock_bus.get_register(const.REG_FAN1_TACH_TARGET_HIGH)
@@ -155,6 +487,16 @@ def test_set_target_rpm_valid(emc2305, mock_bus):
     assert tach_low is not None
 
 
+def test_get_target_rpm_round_trip(emc2305, mock_bus):
+    """Test target RPM reads back from the TACH target register pair."""
+    emc2305.set_target_rpm(2, 10000)
+    assert emc2305.get_target_rpm(2) == 10000
+
+    mock_bus.set_register(const.FAN_REGS[1][const.FAN_REG_TACH_TARGET_LOW], 0x00)
+    mock_bus.set_register(const.FAN_REGS[1][const.FAN_REG_TACH_TARGET_HIGH], 0x05)
+    assert emc2305.get_target_rpm(2) == emc2305._tach_count_to_rpm(0x500 >> 3)
+
+
 def test_set_target_rpm_invalid_range(emc2305):
     """Test setting RPM outside valid range."""
     with pytest.raises(EMC2305ValidationError):
@@ -180,6 +522,40 @@ def test_get_current_rpm(emc2305, mock_bus):
     assert 3800 <= rpm <= 4200, f"Expected ~4000 RPM, got {rpm}"
 
 
+def test_get_all_current_rpms(emc2305, mock_bus):
+    """Test reading RPM of all fans in one transaction."""
+    # Fan 3 at ~4000 RPM (see test_get_current_rpm), others stopped (0x1FFF)
+    for channel in range(1, 6):
+        regs = const.FAN_REGS[channel - 1]
+        mock_bus.set_register(regs[const.FAN_REG_TACH_READING_HIGH], 0x1F)
+        mock_bus.set_register(regs[const.FAN_REG_TACH_READING_LOW], 0xF8)
+    mock_bus.set_register(const.FAN_REGS[2][const.FAN_REG_TACH_READING_HIGH], 0x1E)
+    mock_bus.set_register(const.FAN_REGS[2][const.FAN_REG_TACH_READING_LOW], 0x00)
+
+    rpms = emc2305.get_all_current_rpms()
+    assert set(rpms) == {1, 2, 3, 4, 5}
+    assert rpms[3] == emc2305.get_current_rpm(3)
+    assert 3800 <= rpms[3] <= 4200
+    assert rpms[1] == rpms[2] == rpms[4] == rpms[5] == 0
+
+
+def test_get_all_pwm_duty_cycles(emc2305, mock_bus):
+    """Test reading the duty cycle of all fans in one transaction."""
+    emc2305.set_pwm_duty_cycles({1: 0, 2: 25, 3: 50, 4: 75, 5: 100})
+    calls = []
+    original = mock_bus.read_register_block
+
+    def record(device_address, register, length):
+        calls.append((register, length))
+        return original(device_address, register, length)
+
+    mock_bus.read_register_block = record
+    duty_cycles = emc2305.get_all_pwm_duty_cycles()
+    assert len(calls) == 1
+    assert duty_cycles == {ch: emc2305.get_pwm_duty_cycle(ch) for ch in range(1, 6)}
+    assert duty_cycles[1] == 0.0 and duty_cycles[5] == 100.0
+
+
 # =============================================================================
 # Control Mode Tests
 # =============================================================================
@@ -207,6 +583,29 @@ def test_set_control_mode_fsc(emc2305, mock_bus):
     assert (config1 & const.FAN_CONFIG1_EN_ALGO) != 0
 
 
+def test_set_control_mode_publishes_new_config(emc2305, mock_bus, monkeypatch):
+    """Test that a mode change replaces the config only after its registers are written."""
+    config = FanConfig(max_step=31)
+    emc2305.configure_fan(1, config)
+
+    emc2305.set_control_mode(1, ControlMode.FSC)
+    assert config.control_mode is ControlMode.PWM
+    assert emc2305._fan_configs[1].control_mode is ControlMode.FSC
+    assert emc2305._fan_configs[1].max_step == 31
+    assert mock_bus.get_register(const.REG_FAN1_CONFIG1) & const.FAN_CONFIG1_EN_ALGO
+
+    def fail(*args):
+        raise I2CError("bus error")
+
+    fsc_config = emc2305._fan_configs[1]
+    for method in ("write_byte", "write_block", "write_blocks", "write_registers"):
+        monkeypatch.setattr(mock_bus, method, fail)
+    with pytest.raises(I2CError):
+        emc2305.set_control_mode(1, ControlMode.PWM)
+    assert emc2305._fan_configs[1] is fsc_config
+    assert fsc_config.control_mode is ControlMode.FSC
+
+
 # =============================================================================
 # Status Monitoring Tests
 # =============================================================================
@@ -240,10 +639,23 @@ def test_get_fan_status_drive_failure(emc2305, mock_bus):
     assert status == FanStatus.DRIVE_FAILURE
 
 
+def test_get_fan_status_fault_priority(emc2305, mock_bus):
+    """Test that stall outranks spin failure, which outranks drive failure."""
+    mock_bus.simulate_fault("drive_fail", channel=2)
+    mock_bus.simulate_fault("spin", channel=2)
+    mock_bus.simulate_fault("drive_fail", channel=3)
+    mock_bus.simulate_fault("stall", channel=3)
+
+    assert emc2305.get_fan_status(2) == FanStatus.SPIN_FAILURE
+    assert emc2305.get_fan_status(3) == FanStatus.STALLED
+
+
 def test_get_all_fan_states(emc2305, mock_bus):
     """Test getting state for all fans."""
     mock_bus.simulate_fault("stall", channel=2)
     mock_bus.simulate_fault("spin", channel=3)
+    mock_bus.set_register(const.FAN_REGS[3][const.FAN_REG_SETTING], 128)
+    mock_bus.set_register(const.FAN_REGS[3][const.FAN_REG_TACH_READING_HIGH], 0x1E)
 
     states = emc2305.get_all_fan_states()
 
@@ -252,6 +664,109 @@ def test_get_all_fan_states(emc2305, mock_bus):
     assert states[3].status == FanStatus.SPIN_FAILURE
     assert states[4].status == FanStatus.OK
     assert states[5].status == FanStatus.OK
+    assert states[4] == emc2305.get_fan_state(4)
+
+
+def test_get_fan_state_decodes_register_window(emc2305, mock_bus):
+    """Test single-fan state is decoded from the channel register window."""
+    mock_bus.set_register(const.REG_FAN1_SETTING, 128)  # ~50%
+    mock_bus.set_register(const.REG_FAN1_TACH_READING_HIGH, 0x1E)  # ~4000 RPM
+    mock_bus.set_register(const.REG_FAN1_TACH_READING_LOW, 0x00)
+
+    state = emc2305.get_fan_state(1)
+
+    assert state.channel == 1
+    assert 49.0 <= state.pwm_percent <= 51.0
+    assert state.current_rpm == emc2305.get_current_rpm(1)
+    assert state.target_rpm == 0  # PWM mode reports no target
+    assert state.status == FanStatus.OK
+    assert not hasattr(state, "__dict__")
+
+
+def test_configure_fan_alerts_single_write(emc2305, mock_bus):
+    """Test alert enables update the cached mask with one write and no read."""
+    mock_bus.read_byte = None  # Any register read would now fail
+
+    emc2305.configure_fan_alerts(2, False)
+    emc2305.configure_fan_alerts(4, False)
+    assert mock_bus.get_register(const.REG_FAN_INTERRUPT_ENABLE) == 0x15
+
+    emc2305.set_fan_alerts_mask(0b00011)
+    emc2305.configure_fan_alerts(5, True)
+    assert mock_bus.get_register(const.REG_FAN_INTERRUPT_ENABLE) == 0x13
+
+    with pytest.raises(EMC2305ValidationError):
+        emc2305.set_fan_alerts_mask(0x20)
+
+
+def test_get_alert_status(emc2305, mock_bus):
+    """Test per-channel alert flags combine stall, spin and drive failures."""
+    mock_bus.simulate_fault("spin", channel=1)
+    mock_bus.simulate_fault("drive_fail", channel=4)
+
+    alerts = emc2305.get_alert_status()
+    assert alerts == {1: True, 2: False, 3: False, 4: True, 5: False}
+
+    alerts[2] = True  # Callers get their own copy
+    assert emc2305.get_alert_status()[2] is False
+
+
+def test_get_faulted_fans(emc2305, mock_bus):
+    """Test faulted fan lookup from status registers."""
+    assert emc2305.get_faulted_fans() == ()
+
+    mock_bus.simulate_fault("stall", channel=2)
+    mock_bus.simulate_fault("drive_fail", channel=5)
+    emc2305._status_cache_time -= emc2305._status_cache_ttl  # Expire the status snapshot
+    assert emc2305.get_faulted_fans() == (2, 5)
+
+
+def test_clear_fault_status_returns_cleared_values(emc2305, mock_bus):
+    """Test that clearing fault status reports the latched values and drops the snapshot."""
+    mock_bus.simulate_fault("stall", channel=2)
+    mock_bus.simulate_fault("spin", channel=4)
+
+    assert emc2305._clear_fault_status() == (0x0A, 0x02, 0x08, 0x00)
+    assert emc2305._status_cache is None
+
+
+def test_status_reads_share_cached_snapshot(emc2305, mock_bus):
+    """Test that a burst of status queries performs one clear-on-read status read."""
+    status_reads = []
+    original_read_block = mock_bus.read_block
+
+    def record_read_block(addr, reg, length):
+        if reg == const.REG_FAN_STATUS:
+            status_reads.append(length)
+        return original_read_block(addr, reg, length)
+
+    mock_bus.read_block = record_read_block
+    mock_bus.simulate_fault("stall", channel=2)
+
+    statuses = [emc2305.get_fan_status(channel) for channel in range(1, 6)]
+    assert statuses[1] == FanStatus.STALLED
+    assert emc2305.get_faulted_fans() == (2,)
+    assert len(status_reads) == 1
+
+    emc2305.clear_alert_status()
+    emc2305.get_fan_status(1)
+    assert len(status_reads) == 3
+
+
+def test_read_status_block(emc2305, mock_bus):
+    """Test status block decodes the 0x24-0x2B register span."""
+    mock_bus.simulate_fault("stall", channel=2)
+    mock_bus.set_register(const.REG_PWM_POLARITY_CONFIG, 0x04)
+
+    status = emc2305.read_status_block()
+
+    assert status.stall == 0x02
+    assert status.fan_status & 0x02
+    assert status.spin == 0x00
+    assert status.drive_fail == 0x00
+    assert status.int_en == const.FAN_INTERRUPT_ENABLE_ALL_FANS
+    assert status.pwm_pol == 0x04
+    assert status.pwm_out_cfg == const.DEFAULT_PWM_OUTPUT_CONFIG
 
 
 # =============================================================================
@@ -329,6 +844,30 @@ def test_tach_count_to_rpm_conversion(emc2305):
     assert 2900 <= rpm <= 3100, f"Expected ~3000 RPM, got {rpm}"
 
 
+def test_rpm_conversion_uses_configured_edges(emc2305):
+    """Test that RPM conversions use the edges setting last written to the channel."""
+    assert emc2305._channel_edges == dict.fromkeys(range(1, 6), 5)
+
+    config = FanConfig(edges=9)
+    emc2305.configure_fan(1, config)
+    assert emc2305._channel_edges[1] == 9
+
+    config.edges = 3  # Not applied until configure_fan() writes it
+    assert emc2305._channel_edges[1] == 9
+
+
+def test_tach_conversion_external_clock(mock_bus):
+    """Test tachometer conversions use the external clock frequency."""
+    controller = EMC2305(i2c_bus=mock_bus, device_address=0x4D, use_external_clock=True)
+    # RPM = ((edges-1) * 32768 * 60) / (TACH_COUNT * poles)
+    for edges in (3, 5, 7, 9):
+        assert controller._tach_count_to_rpm(1280, edges=edges) == 3072
+        assert controller._rpm_to_tach_count(3072, edges=edges) == 1280
+
+    with pytest.raises(EMC2305ValidationError):
+        controller._rpm_to_tach_count(3000, edges=4)
+
+
 # =============================================================================
 # Validation Tests
 # =============================================================================
@@ -347,6 +886,9 @@ def test_validate_channel(emc2305):
     with pytest.raises(EMC2305ValidationError):
         emc2305._validate_channel(6)
 
+    with pytest.raises(EMC2305ValidationError):
+        emc2305._validate_channel(1.0)  # Equal to a valid channel, but not an int
+
 
 def test_validate_percent(emc2305):
     """Test percentage validation."""
@@ -362,6 +904,12 @@ def test_validate_percent(emc2305):
     with pytest.raises(EMC2305ValidationError):
         emc2305._validate_percent(101.0)
 
+    with pytest.raises(EMC2305ValidationError):
+        emc2305._validate_percent(float("nan"))
+
+    with pytest.raises(EMC2305ValidationError):
+        emc2305._validate_percent("50")
+
 
 def test_validate_rpm(emc2305):
     """Test RPM validation."""
@@ -412,5 +960,34 @@ def test_set_pwm_verified_with_tolerance(emc2305, mock_bus):
     assert 20.0 <= actual <= 35.0
 
 
+def test_service_watchdog_only_when_due(mock_bus):
+    """Test that the watchdog is only serviced after the bus has been idle."""
+    controller = EMC2305(i2c_bus=mock_bus, device_address=0x4D, enable_watchdog=True)
+    assert controller.service_watchdog() is False
+
+    mock_bus.last_transfer[0x4D] -= const.WATCHDOG_SERVICE_INTERVAL_SEC
+    assert controller.service_watchdog() is True
+    assert controller.service_watchdog() is False
+
+
+def test_reset_watchdog_does_not_read(mock_bus, monkeypatch):
+    """Test that resetting the watchdog is a single write-only transfer."""
+    controller = EMC2305(i2c_bus=mock_bus, device_address=0x4D, enable_watchdog=True)
+
+    def fail_read(*args):
+        raise AssertionError("reset_watchdog must not read")
+
+    monkeypatch.setattr(mock_bus, "read_byte", fail_read)
+    mock_bus.last_transfer.clear()
+    controller.reset_watchdog()
+    assert 0x4D in mock_bus.last_transfer
+
+
+def test_service_watchdog_disabled(emc2305, mock_bus):
+    """Test that service_watchdog is a no-op without the watchdog enabled."""
+    mock_bus.last_transfer.clear()
+    assert emc2305.service_watchdog() is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,640 @@
+# Copyright (c) 2025 Contributors to the microchip-emc2305 project
+# SPDX-License-Identifier: MIT
+
+"""
+Unit Tests for the I2C Communication Layer
+
+Tests I2CBus without requiring hardware: smbus2.SMBus is replaced by a fake
+adapter and bus locks use lock files under a temporary directory.
+"""
+
+import ctypes
+import os
+import threading
+from fcntl import LOCK_EX, LOCK_NB, LOCK_UN, flock
+from typing import Callable, Optional
+
+import pytest
+import smbus2
+
+from emc2305.driver import constants as const
+from emc2305.driver import i2c
+from emc2305.driver.i2c import I2CBus, I2CBusLockError, I2CError
+
+
+class FakeAdapter:
+    """
+    Simulated i2c-dev adapter with one 256-register device at every address.
+
+    Records every transfer, both the SMBus calls made through FakeSMBus and
+    the I2C_RDWR ioctls issued directly on the bus file descriptor.
+    """
+
+    def __init__(self):
+        self.funcs = smbus2.I2cFunc.I2C
+        self.registers = bytearray(256)
+        self.transfers: list[tuple] = []
+
+    def ioctl(self, fd: int, request: int, data) -> None:
+        """Serve an I2C_RDWR request, filling read messages from the registers."""
+        assert request == const.I2C_RDWR
+        pointer = None
+        msgs = []
+        for msg in data.msgs[: data.nmsgs]:
+            if msg.flags & const.I2C_M_RD:
+                payload = bytes(self.registers[pointer : pointer + msg.len])
+                ctypes.memmove(msg.buf, payload, msg.len)
+            else:
+                payload = ctypes.string_at(msg.buf, msg.len)
+                pointer = payload[0]
+                self.registers[pointer : pointer + msg.len - 1] = payload[1:]
+            msgs.append((msg.addr, msg.flags, msg.len, payload))
+        self.transfers.append(("ioctl", msgs))
+
+
+class FakeSMBus:
+    """Stand-in for smbus2.SMBus that serves transfers from a FakeAdapter."""
+
+    def __init__(self, adapter: FakeAdapter, bus_number: int):
+        self.adapter = adapter
+        self.bus_number = bus_number
+        self.funcs = adapter.funcs
+        self.fd = -1
+
+    def read_byte_data(self, address: int, register: int) -> int:
+        self.adapter.transfers.append(("read_byte_data", address, register))
+        return self.adapter.registers[register]
+
+    def read_i2c_block_data(self, address: int, register: int, length: int) -> list[int]:
+        self.adapter.transfers.append(("read_i2c_block_data", address, register, length))
+        return list(self.adapter.registers[register : register + length])
+
+    def write_byte_data(self, address: int, register: int, value: int) -> None:
+        self.adapter.transfers.append(("write_byte_data", address, register, value))
+        self.adapter.registers[register] = value
+
+    def write_word_data(self, address: int, register: int, value: int) -> None:
+        self.adapter.transfers.append(("write_word_data", address, register, value))
+        self.adapter.registers[register : register + 2] = value.to_bytes(2, "little")
+
+    def write_i2c_block_data(self, address: int, register: int, data: list[int]) -> None:
+        self.adapter.transfers.append(("write_i2c_block_data", address, register, list(data)))
+        self.adapter.registers[register : register + len(data)] = bytes(data)
+
+    def i2c_rdwr(self, *msgs) -> None:
+        self.adapter.transfers.append(
+            ("i2c_rdwr", [(msg.addr, msg.flags, msg.len, bytes(msg)) for msg in msgs])
+        )
+        for msg in msgs:
+            data = bytes(msg)
+            self.adapter.registers[data[0] : data[0] + msg.len - 1] = data[1:]
+
+    def close(self) -> None:
+        self.fd = None
+
+
+class FakeClock:
+    """Replacement for the time module in emc2305.driver.i2c; sleep() advances monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+        self.on_sleep: Optional[Callable[[], None]] = None
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        if self.on_sleep is not None:
+            self.on_sleep()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Run the I2C layer on a fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(i2c, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    """Replace smbus2.SMBus and the I2C_RDWR ioctl with a simulated adapter."""
+    fake = FakeAdapter()
+    monkeypatch.setattr(i2c.smbus2, "SMBus", lambda bus_number: FakeSMBus(fake, bus_number))
+    monkeypatch.setattr(i2c, "ioctl", fake.ioctl)
+    return fake
+
+
+@pytest.fixture
+def make_bus(adapter, tmp_path):
+    """Factory for I2CBus instances on the simulated adapter, locking under tmp_path."""
+    buses = []
+
+    def factory(**kwargs) -> I2CBus:
+        kwargs.setdefault("lock_path", str(tmp_path))
+        bus = I2CBus(bus_number=kwargs.pop("bus_number", 7), **kwargs)
+        buses.append(bus)
+        return bus
+
+    yield factory
+    for bus in buses:
+        bus.close()
+
+
+def _file_locked_elsewhere(path) -> bool:
+    """Whether another open file description cannot take the lock on path."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        flock(fd, LOCK_EX | LOCK_NB)
+    except BlockingIOError:
+        return True
+    else:
+        flock(fd, LOCK_UN)
+        return False
+    finally:
+        os.close(fd)
+
+
+def _wait_child(pid: int) -> int:
+    """Wait for a forked child and return its exit status."""
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+# =============================================================================
+# Bus Lock Tests
+# =============================================================================
+
+
+def test_forked_child_is_excluded_by_parent_lock(make_bus):
+    """Test that a child forked from a bus user contends for the lock with its parent."""
+    bus = make_bus(lock_timeout=0.2)
+    ready_r, ready_w = os.pipe()
+    held_r, held_w = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - child process
+        status = 1
+        try:
+            os.write(ready_w, b"1")
+            os.read(held_r, 1)  # Parent holds the lock now
+            try:
+                bus.read_byte(0x4D, 0x00)
+            except I2CBusLockError:
+                status = 0
+        finally:
+            os._exit(status)
+
+    os.read(ready_r, 1)
+    with bus.lock:
+        os.write(held_w, b"1")
+        assert _wait_child(pid) == 0
+    for fd in (ready_r, ready_w, held_r, held_w):
+        os.close(fd)
+
+
+def test_forked_child_does_not_inherit_held_lock(make_bus):
+    """Test that buses in a child forked while the lock is held start unheld."""
+    bus = make_bus(lock_timeout=0.2)
+
+    with bus.lock:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            status = 1
+            try:
+                # A bus created in the child shares the reset lock file entry
+                child_bus = I2CBus(bus_number=7, lock_path=str(bus.lock.path.parent))
+                child_bus.lock.timeout = 0.2
+                assert child_bus.lock._file is bus.lock._file
+                assert child_bus.lock._file.depth == 0
+                failures = 0
+                for user in (bus, child_bus):
+                    try:
+                        user.read_byte(0x4D, 0x00)
+                    except I2CBusLockError:
+                        failures += 1
+                # Leaving the parent's `with bus.lock` block in the child is a no-op
+                bus.lock.release()
+                status = 0 if failures == 2 else 1
+            finally:
+                os._exit(status)
+        assert _wait_child(pid) == 0
+
+    # The parent's lock survives the child closing its descriptors
+    bus.read_byte(0x4D, 0x00)
+
+
+def test_closed_bus_raises_i2c_error(make_bus):
+    """Test that operations on a closed bus raise I2CError instead of failing in the lock."""
+    bus = make_bus()
+    bus.close()
+
+    with pytest.raises(I2CError, match="closed"):
+        bus.read_byte(0x4D, 0x00)
+    with pytest.raises(I2CError, match="closed"):
+        bus.lock.release()
+
+
+def test_lock_is_reentrant(make_bus):
+    """Test that nested acquires only take and drop the file lock at the outermost level."""
+    bus = make_bus()
+    lock_file = bus.lock._file
+
+    with bus.lock:
+        with bus.lock:
+            assert lock_file.depth == 2
+            assert _file_locked_elsewhere(bus.lock.path)
+        assert lock_file.depth == 1
+        assert _file_locked_elsewhere(bus.lock.path)
+        bus.read_byte(0x4D, 0x00)
+    assert lock_file.depth == 0
+    assert not _file_locked_elsewhere(bus.lock.path)
+
+
+def test_lock_excludes_other_thread(make_bus):
+    """Test that another thread times out with I2CBusLockError while the lock is held."""
+    bus = make_bus(lock_timeout=0.05)
+    held = threading.Event()
+    done = threading.Event()
+
+    def holder():
+        with bus.lock:
+            held.set()
+            done.wait(5)
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    try:
+        assert held.wait(5)
+        with pytest.raises(I2CBusLockError):
+            bus.read_byte(0x4D, 0x00)
+    finally:
+        done.set()
+        thread.join()
+    bus.read_byte(0x4D, 0x00)
+
+
+def test_lock_polls_at_configured_interval(make_bus, clock):
+    """Test that a lock held by another process is retried every lock_poll_interval."""
+    bus = make_bus(lock_timeout=0.25, lock_poll_interval=0.0625)
+    fd = os.open(bus.lock.path, os.O_RDONLY)
+    try:
+        flock(fd, LOCK_EX)
+        with pytest.raises(I2CBusLockError):
+            bus.read_byte(0x4D, 0x00)
+    finally:
+        os.close(fd)
+
+    assert clock.sleeps == [0.0625] * 4
+    assert bus.lock._file.depth == 0
+    bus.read_byte(0x4D, 0x00)
+
+
+@pytest.mark.parametrize("replace", [False, True])
+def test_lock_reopens_removed_or_replaced_file(make_bus, replace):
+    """Test that the lock is taken on the file currently at the lock path."""
+    bus = make_bus()
+    path = bus.lock.path
+    if replace:
+        replacement = path.with_name("replacement")
+        replacement.touch()
+        os.replace(replacement, path)
+    else:
+        path.unlink()
+    assert not bus.lock._file.holds_current_file()
+
+    with bus.lock:
+        assert bus.lock._file.holds_current_file()
+        assert _file_locked_elsewhere(path)
+
+
+def test_lock_file_shared_and_closed_with_last_bus(make_bus):
+    """Test that buses on one lock path share its descriptor until the last one closes."""
+    first = make_bus()
+    second = make_bus()
+    lock_file = first.lock._file
+    fd = lock_file.fd
+    assert second.lock._file is lock_file
+    assert lock_file.users == 2
+
+    # The lock is held per process, so one bus can be used inside the other's lock
+    with first.lock:
+        second.read_byte(0x4D, 0x00)
+
+    first.close()
+    os.fstat(fd)
+    assert lock_file.fd == fd
+    second.close()
+    assert lock_file.fd is None
+    with pytest.raises(OSError):
+        os.fstat(fd)
+    assert os.path.realpath(first.lock.path) not in i2c._LOCK_FILES
+
+
+# =============================================================================
+# Combined Read Tests
+# =============================================================================
+
+
+def test_read_uses_combined_transaction(make_bus, adapter):
+    """Test that a register read is one pointer write + repeated START read ioctl."""
+    adapter.registers[0x24:0x28] = bytes([0x11, 0x22, 0x33, 0x44])
+    bus = make_bus()
+
+    assert bus.rdwr_supported
+    assert bus.read_register_block(0x4D, 0x24, 4) == [0x11, 0x22, 0x33, 0x44]
+    assert adapter.transfers == [
+        (
+            "ioctl",
+            [
+                (0x4D, 0, 1, bytes([0x24])),
+                (0x4D, const.I2C_M_RD, 4, bytes([0x11, 0x22, 0x33, 0x44])),
+            ],
+        )
+    ]
+
+
+def test_read_reuses_receive_buffer_across_lengths(make_bus, adapter):
+    """Test that reads of different lengths only return their own bytes from the shared buffer."""
+    adapter.registers[0x30:0x40] = bytes(range(0xA0, 0xB0))
+    adapter.registers[0x80:0x82] = bytes([0x01, 0x02])
+    bus = make_bus()
+
+    assert bus.read_register_block(0x4D, 0x30, 16) == list(range(0xA0, 0xB0))
+    assert bus.read_register_block(0x4D, 0x80, 2) == [0x01, 0x02]
+    assert bus.read_byte(0x4D, 0x3F) == 0xAF
+    assert bus.read_block(0x4D, 0x30, 3) == [0xA0, 0xA1, 0xA2]
+    assert [msgs[1][2] for _, msgs in adapter.transfers] == [16, 2, 1, 3]
+
+
+def test_read_word_is_lsb_first(make_bus, adapter):
+    """Test that read_word() combines the two registers LSB first."""
+    adapter.registers[0x3E:0x40] = bytes([0x34, 0x12])
+    bus = make_bus()
+
+    assert bus.read_word(0x4D, 0x3E) == 0x1234
+
+
+def test_read_falls_back_to_smbus(make_bus, adapter):
+    """Test SMBus reads on adapters without I2C_FUNC_I2C, split into SMBus-sized chunks."""
+    adapter.funcs = 0
+    adapter.registers[0x30:0x80] = bytes(range(0x50))
+    bus = make_bus()
+
+    assert not bus.rdwr_supported
+    assert bus.read_byte(0x4D, 0x31) == 0x01
+    assert bus.read_word(0x4D, 0x3E) == 0x0F0E
+    assert bus.read_register_block(0x4D, 0x30, 0x50) == list(range(0x50))
+    assert adapter.transfers == [
+        ("read_byte_data", 0x4D, 0x31),
+        ("read_i2c_block_data", 0x4D, 0x3E, 2),
+        ("read_i2c_block_data", 0x4D, 0x30, 32),
+        ("read_i2c_block_data", 0x4D, 0x50, 32),
+        ("read_i2c_block_data", 0x4D, 0x70, 16),
+    ]
+
+
+# =============================================================================
+# Batched Write Tests
+# =============================================================================
+
+
+def test_write_registers_split_into_rdwr_batches(make_bus, adapter):
+    """Test that write_registers() sends at most I2C_RDWR_MAX_MSGS messages per ioctl."""
+    bus = make_bus()
+    writes = [(register, register ^ 0xFF) for register in range(const.I2C_RDWR_MAX_MSGS + 8)]
+
+    bus.write_registers(0x4D, writes)
+
+    assert [len(msgs) for _, msgs in adapter.transfers] == [const.I2C_RDWR_MAX_MSGS, 8]
+    sent = [msg for _, msgs in adapter.transfers for msg in msgs]
+    assert sent == [(0x4D, 0, 2, bytes(pair)) for pair in writes]
+
+
+def test_write_registers_smbus_fallback_in_order(make_bus, adapter):
+    """Test that write_registers() writes each register in order without I2C_FUNC_I2C."""
+    adapter.funcs = 0
+    bus = make_bus()
+    writes = [(0x40, 0x80), (0x30, 0x10), (0x40, 0x20)]
+
+    bus.write_registers(0x4D, writes)
+
+    assert adapter.transfers == [("write_byte_data", 0x4D, *pair) for pair in writes]
+    assert adapter.registers[0x40] == 0x20
+
+
+def test_write_blocks_split_into_rdwr_batches(make_bus, adapter):
+    """Test that write_blocks() sends at most I2C_RDWR_MAX_MSGS block messages per transfer."""
+    bus = make_bus()
+    blocks = [(register, [register, 0x5A]) for register in range(const.I2C_RDWR_MAX_MSGS + 1)]
+
+    bus.write_blocks(0x4D, blocks)
+
+    assert [len(msgs) for _, msgs in adapter.transfers] == [const.I2C_RDWR_MAX_MSGS, 1]
+    sent = [msg for _, msgs in adapter.transfers for msg in msgs]
+    assert sent == [(0x4D, 0, 3, bytes([register, *data])) for register, data in blocks]
+
+
+def test_write_blocks_smbus_fallback_in_order(make_bus, adapter):
+    """Test that write_blocks() writes each block in order without I2C_FUNC_I2C."""
+    adapter.funcs = 0
+    bus = make_bus()
+    blocks = [(0x41, [0x01, 0x2B]), (0x31, (0x02, 0x2C))]
+
+    bus.write_blocks(0x4D, blocks)
+
+    assert adapter.transfers == [
+        ("write_i2c_block_data", 0x4D, 0x41, [0x01, 0x2B]),
+        ("write_i2c_block_data", 0x4D, 0x31, [0x02, 0x2C]),
+    ]
+
+
+# =============================================================================
+# Polling Tests
+# =============================================================================
+
+
+def test_poll_until_returns_on_first_match(make_bus, adapter, clock):
+    """Test that poll_until() returns without waiting when the first read matches."""
+    adapter.registers[0x25] = 0x02
+    bus = make_bus()
+
+    assert bus.poll_until(0x4D, 0x25, 0x01, 0x00, timeout=1.0) == 0x02
+    assert clock.sleeps == []
+    assert len(adapter.transfers) == 1
+
+
+def test_poll_until_backs_off_until_match(make_bus, adapter, clock):
+    """Test that the wait between reads doubles from the minimum interval until a match."""
+    adapter.registers[0x25] = 0x01
+    bus = make_bus()
+
+    def clear_after_three_waits():
+        if len(clock.sleeps) == 3:
+            adapter.registers[0x25] = 0x00
+
+    clock.on_sleep = clear_after_three_waits
+    assert bus.poll_until(0x4D, 0x25, 0x01, 0x00, timeout=1.0) == 0x00
+    minimum = const.POLL_INTERVAL_MIN_MS / 1000.0
+    assert clock.sleeps == pytest.approx([minimum, 2 * minimum, 4 * minimum])
+    assert len(adapter.transfers) == 4
+
+
+def test_poll_until_times_out(make_bus, adapter, clock):
+    """Test backoff bounds and the timeout error when the value never matches."""
+    adapter.registers[0x25] = 0x01
+    bus = make_bus()
+    start = clock.now
+
+    with pytest.raises(I2CError, match="timed out"):
+        bus.poll_until(0x4D, 0x25, 0x01, 0x00, timeout=0.02)
+
+    minimum = const.POLL_INTERVAL_MIN_MS / 1000.0
+    maximum = const.POLL_INTERVAL_MAX_MS / 1000.0
+    assert clock.sleeps[:7] == pytest.approx([minimum * 2**n for n in range(6)] + [maximum])
+    assert max(clock.sleeps) == pytest.approx(maximum)
+    # The last wait is cut short by the deadline instead of overshooting it
+    assert clock.sleeps[-1] < maximum
+    assert clock.now - start == pytest.approx(0.02)
+
+
+# =============================================================================
+# Register Cache Tests
+# =============================================================================
+
+
+def test_read_byte_cached_skips_bus_until_stale(make_bus, adapter, clock):
+    """Test that a cached register is served without a transfer until max_age passes."""
+    adapter.registers[0x20] = 0x40
+    bus = make_bus()
+
+    assert bus.read_byte_cached(0x4D, 0x20, max_age=1.0) == 0x40
+    adapter.registers[0x20] = 0x41  # Changed behind the bus: not seen while fresh
+    assert bus.read_byte_cached(0x4D, 0x20, max_age=1.0) == 0x40
+    assert len(adapter.transfers) == 1
+
+    clock.now += 1.0
+    assert bus.read_byte_cached(0x4D, 0x20, max_age=1.0) == 0x41
+    assert len(adapter.transfers) == 2
+
+    bus.clear_register_cache()
+    bus.read_byte_cached(0x4D, 0x20, max_age=1.0)
+    assert len(adapter.transfers) == 3
+
+
+def test_writes_invalidate_cached_registers(make_bus, adapter):
+    """Test that every write path drops the cached values of the registers it covers."""
+    bus = make_bus()
+
+    def cache(*registers):
+        for register in registers:
+            bus.read_byte_cached(0x4D, register, max_age=60.0)
+
+    cache(0x20, 0x21, 0x32, 0x33, 0x34)
+    bus.write_byte(0x4D, 0x20, 0x01)
+    bus.write_registers(0x4D, [(0x21, 0x02)])
+    bus.write_block(0x4D, 0x32, [0x03, 0x04])
+    assert bus.read_byte_cached(0x4D, 0x20, max_age=60.0) == 0x01
+    assert bus.read_byte_cached(0x4D, 0x21, max_age=60.0) == 0x02
+    assert bus.read_byte_cached(0x4D, 0x32, max_age=60.0) == 0x03
+    assert bus.read_byte_cached(0x4D, 0x33, max_age=60.0) == 0x04
+
+    # Registers outside the writes and other devices keep their cached values
+    adapter.registers[0x34] = 0xEE
+    bus.write_byte(0x2F, 0x34, 0x05)
+    assert bus.read_byte_cached(0x4D, 0x34, max_age=60.0) == 0x00
+
+    cache(0x3E, 0x3F)
+    bus.write_blocks(0x4D, [(0x3E, [0x06])])
+    assert bus.read_byte_cached(0x4D, 0x3E, max_age=60.0) == 0x06
+    bus.write_word(0x4D, 0x3E, 0x0807)
+    assert bus.read_byte_cached(0x4D, 0x3E, max_age=60.0) == 0x07
+    assert bus.read_byte_cached(0x4D, 0x3F, max_age=60.0) == 0x08
+
+
+# =============================================================================
+# Parameter Validation Tests
+# =============================================================================
+
+ADDRESS_CASES = [
+    (-1, False),
+    (-0x80, False),
+    (0, True),
+    (False, True),
+    (True, True),
+    (0x7F, True),
+    (0x80, False),
+    (0xFF, False),
+    (0x100, False),
+]
+
+BYTE_CASES = [
+    (-1, False),
+    (-0x100, False),
+    (0, True),
+    (False, True),
+    (True, True),
+    (0xFF, True),
+    (0x100, False),
+    (0x1FF, False),
+]
+
+
+def _check_validation(adapter, valid: bool, operation: Callable[[], object]) -> None:
+    """Run operation and check it either succeeds or raises I2CError without a transfer."""
+    if valid:
+        operation()
+        assert adapter.transfers
+    else:
+        with pytest.raises(I2CError, match="Invalid"):
+            operation()
+        assert adapter.transfers == []
+
+
+@pytest.mark.parametrize("address,valid", ADDRESS_CASES)
+def test_address_range_checks(make_bus, adapter, address, valid):
+    """Test the address mask checks against the address range boundaries."""
+    bus = make_bus()
+    operations = [
+        lambda: bus.read_byte(address, 0x00),
+        lambda: bus.write_byte(address, 0x00, 0x00),
+        lambda: bus.read_register_block(address, 0x00, 2),
+        lambda: bus.read_byte_cached(address, 0x00, max_age=0.0),
+        lambda: bus.write_registers(address, [(0x00, 0x00)]),
+    ]
+    for operation in operations:
+        adapter.transfers.clear()
+        _check_validation(adapter, valid, operation)
+
+
+@pytest.mark.parametrize("register,valid", BYTE_CASES)
+def test_register_range_checks(make_bus, adapter, register, valid):
+    """Test the register mask checks against the register range boundaries."""
+    bus = make_bus()
+    operations = [
+        lambda: bus.read_byte(0x4D, register),
+        lambda: bus.write_byte(0x4D, register, 0x00),
+        lambda: bus.read_register_block(0x4D, register, 1),
+        lambda: bus.read_byte_cached(0x4D, register, max_age=0.0),
+        lambda: bus.write_registers(0x4D, [(0x00, 0x00), (register, 0x00)]),
+    ]
+    for operation in operations:
+        adapter.transfers.clear()
+        _check_validation(adapter, valid, operation)
+
+
+@pytest.mark.parametrize("value,valid", BYTE_CASES)
+def test_byte_value_range_checks(make_bus, adapter, value, valid):
+    """Test the value mask checks against the byte range boundaries."""
+    bus = make_bus()
+    operations = [
+        lambda: bus.write_byte(0x4D, 0x00, value),
+        lambda: bus.write_registers(0x4D, [(0x00, 0x00), (0x01, value)]),
+        lambda: bus.write_block(0x4D, 0x00, [0x00, value]),
+    ]
+    for operation in operations:
+        adapter.transfers.clear()
+        _check_validation(adapter, valid, operation)
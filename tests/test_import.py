@@ -0,0 +1,33 @@
+# Copyright (c) 2025 Contributors to the microchip-emc2305 project
+# SPDX-License-Identifier: MIT
+
+"""
+Package Import Tests
+
+Checks that the source tree provides a single emc2305 package.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import emc2305
+
+# Build output, virtual environments and installed copies are not part of the source tree
+_EXCLUDED_DIRS = frozenset({"build", "dist", "venv", "site-packages"})
+
+
+def test_package_has_single_init():
+    """Test that the source tree contains exactly one emc2305/__init__.py."""
+    root = Path(emc2305.__file__).resolve().parents[1]
+    if not (root / "pyproject.toml").exists():
+        pytest.skip("emc2305 is not imported from a source tree")
+
+    copies = [
+        path
+        for path in root.rglob("emc2305/__init__.py")
+        if not any(
+            part.startswith(".") or part in _EXCLUDED_DIRS for part in path.relative_to(root).parts
+        )
+    ]
+    assert copies == [root / "emc2305" / "__init__.py"]
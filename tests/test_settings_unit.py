@@ -0,0 +1,154 @@
+# Copyright (c) 2025 Contributors to the microchip-emc2305 project
+# SPDX-License-Identifier: MIT
+
+"""
+Unit Tests for Configuration Management
+
+Tests ConfigManager loading and saving against files in a temporary directory.
+"""
+
+import os
+
+import pytest
+
+from emc2305 import settings
+from emc2305.settings import (
+    ConfigManager,
+    DriverConfig,
+    EMC2305Config,
+    FanChannelConfig,
+    I2CConfig,
+)
+
+yaml = pytest.importorskip("yaml")
+
+
+@pytest.fixture
+def default_locations(monkeypatch, tmp_path):
+    """Point the default configuration search at tmp_path, with a clean lookup cache."""
+    locations = [tmp_path / "user" / "emc2305.yaml", tmp_path / "etc" / "emc2305.yaml"]
+    monkeypatch.setattr(ConfigManager, "DEFAULT_CONFIG_LOCATIONS", locations)
+    settings._find_config.cache_clear()
+    yield locations
+    settings._find_config.cache_clear()
+
+
+@pytest.fixture
+def yaml_loads(monkeypatch):
+    """Count the configuration files parsed by ConfigManager."""
+    calls = []
+    load = settings.yaml.load
+
+    def counting_load(stream, Loader):
+        calls.append(stream.name)
+        return load(stream, Loader=Loader)
+
+    monkeypatch.setattr(settings.yaml, "load", counting_load)
+    return calls
+
+
+# =============================================================================
+# Load Cache Tests
+# =============================================================================
+
+
+def test_load_parses_unchanged_file_once(tmp_path, yaml_loads):
+    """Test that loading an unchanged file reuses the parsed contents."""
+    path = tmp_path / "emc2305.yaml"
+    path.write_text("i2c:\n  bus: 3\n")
+    manager = ConfigManager(config_path=path)
+
+    assert manager.load().i2c.bus == 3
+    assert manager.load().i2c.bus == 3
+    assert len(yaml_loads) == 1
+
+
+def test_load_reparses_when_mtime_or_size_changes(tmp_path, yaml_loads):
+    """Test that a new modification time or size forces the file to be parsed again."""
+    path = tmp_path / "emc2305.yaml"
+    path.write_text("i2c:\n  bus: 3\n")
+    manager = ConfigManager(config_path=path)
+    manager.load()
+    mtime_ns = path.stat().st_mtime_ns
+
+    # Same size, later modification time
+    path.write_text("i2c:\n  bus: 4\n")
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert manager.load().i2c.bus == 4
+    assert len(yaml_loads) == 2
+
+    # Different size, same modification time
+    path.write_text("i2c:\n  bus: 12\n")
+    os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+    assert manager.load().i2c.bus == 12
+    assert len(yaml_loads) == 3
+
+    manager.invalidate()
+    manager.load()
+    assert len(yaml_loads) == 4
+
+
+def test_find_config_cached_until_save(default_locations):
+    """Test that the default location search is cached and cleared by save()."""
+    user_path, etc_path = default_locations
+
+    assert ConfigManager().config_path is None
+    etc_path.parent.mkdir()
+    etc_path.write_text("log_level: DEBUG\n")
+    assert ConfigManager().config_path is None  # Cached for the process
+
+    assert ConfigManager().create_default()
+    assert user_path.exists()
+    assert ConfigManager().config_path == user_path
+
+
+# =============================================================================
+# Save/Load Tests
+# =============================================================================
+
+
+def test_save_load_round_trip(tmp_path):
+    """Test that a saved configuration loads back equal to the original."""
+    config = DriverConfig(
+        i2c=I2CConfig(bus=3, lock_enabled=False, lock_timeout=2.5, lock_poll_interval=0.01),
+        emc2305=EMC2305Config(name="Chassis", address=0x2F, pwm_frequency_hz=4882),
+        log_level="DEBUG",
+        log_file="/var/log/emc2305.log",
+    )
+    config.emc2305.fans[2] = FanChannelConfig(
+        name="CPU Fan",
+        control_mode="fsc",
+        default_target_rpm=3300,
+        edges=7,
+        pid_gain_p=4,
+    )
+    path = tmp_path / "emc2305.yaml"
+
+    assert ConfigManager(config_path=path).save(config)
+    assert "address: '0x2F'" in path.read_text()
+    assert ConfigManager(config_path=path).load() == config
+
+
+def test_load_ignores_unknown_keys(tmp_path):
+    """Test that unknown keys are dropped and missing ones take the dataclass defaults."""
+    path = tmp_path / "emc2305.yaml"
+    path.write_text(
+        "i2c:\n"
+        "  bus: 2\n"
+        "  speed: 400000\n"
+        "emc2305:\n"
+        "  address: 0x4C\n"
+        "  color: blue\n"
+        "  fans:\n"
+        "    '3':\n"
+        "      max_rpm: 5000\n"
+        "      label: rear\n"
+    )
+
+    config = ConfigManager(config_path=path).load()
+
+    assert config.i2c == I2CConfig(bus=2)
+    assert config.emc2305.address == 0x4C
+    assert config.emc2305.fans[3] == FanChannelConfig(name="Fan 3", max_rpm=5000)
+    assert config.emc2305.fans[1] == FanChannelConfig(name="Fan 1")
+    assert sorted(config.emc2305.fans) == [1, 2, 3, 4, 5]